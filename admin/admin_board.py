@@ -11,10 +11,15 @@ from core.models import Board, BoardNew, Scrap, BoardFile, BoardGood
 from core.formclass import BoardForm
 from core.template import AdminTemplates
 from lib.common import (
-    dynamic_create_write_table, FileCache, get_from_list,
+    dynamic_create_write_table, get_from_list,
     safe_int_convert, select_query, set_url_query_params
 )
+from lib.board_thumbnail import delete_board_thumbnails
 from lib.dependency.board import get_board
+from lib.fragment_cache import latest_cache
+from lib.fulltext import (
+    create_fulltext_index, drop_fulltext_index, rebuild_fulltext_index
+)
 from lib.dependency.dependencies import (
     common_search_query_params, validate_token
 )
@@ -22,6 +27,7 @@ from lib.template_functions import (
     get_editor_select, get_group_select,
     get_member_level_select, get_paging, get_skin_select,
 )
+from service.board_count_service import BoardCountService
 from service.board_file_service import BoardFileService
 
 
@@ -105,7 +111,7 @@ async def board_list_update(
             db.commit()
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            latest_cache.invalidate(board.bo_table)
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -137,6 +143,8 @@ async def board_list_delete(
             db.execute(delete(BoardFile).where(BoardFile.bo_table == board.bo_table))
             # 좋아요 기록 삭제
             db.execute(delete(BoardGood).where(BoardGood.bo_table == board.bo_table))
+            # 썸네일 정보 삭제
+            delete_board_thumbnails(db, board.bo_table)
 
             db.commit()
 
@@ -145,9 +153,11 @@ async def board_list_delete(
             write_model.__table__.indexes.clear()  # 인덱스까지 삭제해야 동일한 table로 재생성시 에러가 안남
             write_model.__table__.drop(DBConnect().engine)
             _created_models.pop(board.bo_table, None)  # 동적 모델 캐싱 삭제
+            # 전문검색 색인 테이블 삭제
+            drop_fulltext_index(board.bo_table)
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            latest_cache.invalidate(board.bo_table)
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -240,6 +250,8 @@ async def board_form_update(
 
         # 게시판 테이블 생성
         dynamic_create_write_table(table_name=bo_table, create_table=True)
+        # 전문검색 색인 테이블 생성
+        create_fulltext_index(bo_table)
 
     # 수정
     elif action == "u":
@@ -250,6 +262,8 @@ async def board_form_update(
         # 폼 데이터 반영 후 commit
         for field, value in form_data.__dict__.items():
             setattr(existing_board, field, value)
+        # 게시글/댓글 수는 폼에 포함되지 않으므로 게시글 테이블 기준으로 다시 계산
+        BoardCountService(db).recount(existing_board)
         db.commit()
 
     else:
@@ -274,7 +288,7 @@ async def board_form_update(
             db.commit()
 
     # 최신글 캐시 삭제
-    FileCache().delete_prefix(f'latest-{bo_table}')
+    latest_cache.invalidate(bo_table)
 
     url = f"/admin/board_form/{bo_table}"
     query_params = request.query_params
@@ -340,6 +354,13 @@ async def board_copy_update(
                                          bo_table, write.wr_id,
                                          target_table, write.wr_id)
 
+    # 복사된 게시판의 게시글/댓글 수 계산
+    BoardCountService(db).recount(target_board)
+    db.commit()
+
+    # 복사된 게시판의 전문검색 색인 생성
+    rebuild_fulltext_index(target_table)
+
     content = """
     <script>
         window.opener.location.href = "/admin/board_list";
@@ -8,6 +8,8 @@ from sse_starlette import EventSourceResponse
 from core.database import db_session
 from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_super_admin
+from lib.fragment_cache import latest_cache
+from lib.user_agent import user_agent_cache
 
 router = APIRouter(dependencies=[Depends(validate_super_admin)])
 templates = AdminTemplates()
@@ -21,8 +23,11 @@ async def cache_file_delete(request: Request, db: db_session):
     캐시파일 일괄삭제 화면
     """
     request.session["menu_key"] = CACHE_MENU_KEY
-
-    return templates.TemplateResponse("cache_file_delete.html", {"request": request})
+    context = {
+        "request": request,
+        "cache_stats": [latest_cache.get_stats(), user_agent_cache.stats()],
+    }
+    return templates.TemplateResponse("cache_file_delete.html", context)
 
 
 @router.get("/cache_file_deleting")
@@ -60,6 +65,10 @@ async def cache_file_deleting(request: Request, db: db_session):
             yield f"data: [끝]오류가 발생했습니다. {str(e)} \n\n"
             raise
 
+        # 최신글 캐시(메모리, 공유 캐시) 삭제
+        latest_cache.clear()
+        yield "data: 최신글 캐시를 삭제했습니다. \n\n"
+
         # 종료 메시지 전송
         yield f"data: 총 {count}개의 파일과 디렉토리를 삭제했습니다.\n\n"
         yield "data: [끝]\n\n"
@@ -17,7 +17,8 @@ from lib.common import (
     get_from_list, is_none_datetime, select_query, set_url_query_params
 )
 from lib.dependency.dependencies import common_search_query_params, validate_token
-from lib.pbkdf2 import create_hash
+from lib.member_cache import member_cache
+from lib.password_hasher import password_hasher
 from lib.template_functions import get_member_level_select, get_paging
 from service.member_service import MemberImageService
 
@@ -122,6 +123,7 @@ async def member_list_update(
             member.mb_intercept_date = (datetime.now().strftime("%Y%m%d") if get_from_list(mb_intercept_date, i, 0) else "")
             member.mb_level = mb_level[i]
             db.commit()
+            member_cache.invalidate(member.mb_id)
 
     query_params = request.query_params
     url = "/admin/member_list"
@@ -201,6 +203,7 @@ async def member_list_delete(
             file_service.update_image_file(member.mb_id, 'image', None, 1)
 
             db.commit()
+            member_cache.invalidate(member.mb_id)
 
     url = "/admin/member_list"
     query_params = request.query_params
@@ -254,10 +257,11 @@ async def member_form_update(
         if not form_data.mb_password:
             # 비밀번호가 없다면 현재시간으로 해시값을 만든후 다시 해시 (알수없게 만드는게 목적)
             time_ymdhis = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            new_member.mb_password = create_hash(create_hash(time_ymdhis))
+            new_member.mb_password = password_hasher.hash(password_hasher.hash(time_ymdhis))
 
         db.add(new_member)
         db.commit()
+        member_cache.invalidate(mb_id)
 
     else:  # 수정 (회원아이디가 존재하면)
 
@@ -271,6 +275,7 @@ async def member_form_update(
             setattr(exists_member, field, value)
 
         db.commit()
+        member_cache.invalidate(mb_id)
 
     # 이미지 검사 -> 이미지 수정(삭제 포함)
     file_service.update_image_file(mb_id, 'image', mb_img, del_mb_img)
@@ -142,7 +142,7 @@ async def point_list_delete(
         db.commit()
 
         # 회원 포인트 갱신
-        sum_point = service.get_total_point(point.mb_id)
+        sum_point = service.calculate_total_point(point.mb_id)
         member_service.update_member_point(point.mb_id, sum_point)
 
     url = "/admin/point_list"
@@ -14,6 +14,8 @@ from core.template import (
     AdminTemplates, TEMPLATES, TemplateService, UserTemplates,
     get_current_theme, get_theme_list, get_theme_info, register_theme_statics,
 )
+from lib.config_cache import config_cache
+from lib.fragment_cache import latest_cache
 from lib.dependency.dependencies import validate_super_admin, validate_theme
 
 logging.basicConfig(level=logging.INFO)
@@ -41,6 +43,7 @@ async def theme(request: Request, db: db_session):
     if current_theme not in theme_list:
         config.cf_theme = current_theme = "basic"
         db.commit()
+        config_cache.invalidate()
 
     # 현재 사용 중인 테마를 목록 맨 앞으로 이동
     if current_theme and current_theme in theme_list:
@@ -99,15 +102,12 @@ async def theme_update(
 
     db.execute(update(Config).values(cf_theme=select_theme))
     db.commit()
+    config_cache.invalidate()
 
     # 선택한 테마로 캐시&설정 데이터들을 갱신합니다.
     get_current_theme.cache_clear()
     TemplateService.set_templates_dir()
-    cache_directory = "data/cache"
-    for filename in os.listdir(cache_directory):
-        if filename.startswith("latest-"):
-            file_path = os.path.join(cache_directory, filename)
-            os.unlink(file_path)
+    latest_cache.clear()
 
     # 테마 관련 정적 파일을 등록합니다.
     register_theme_statics(app)
@@ -1,9 +1,12 @@
 import re
+from calendar import monthrange
+from collections import Counter
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 
 from fastapi import APIRouter, Depends, Form, Query, Request
 from sqlalchemy import asc, cast, delete, desc, extract, func, select, String
+from starlette.concurrency import run_in_threadpool
 
 from core.database import db_session
 from core.exception import AlertException
@@ -12,6 +15,11 @@ from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_super_admin, validate_token
 from lib.pbkdf2 import validate_password
 from lib.template_functions import get_paging
+from lib.visit_rollup import (
+    DIMENSION_BROWSER, DIMENSION_DEVICE, DIMENSION_OS, DIMENSION_REFERER,
+    delete_visit_rollup, get_visit_date_counts, get_visit_dimension_counts,
+    get_visit_hour_counts, refresh_visit_rollup
+)
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -130,6 +138,7 @@ async def visit_delete_update(
     if method == "before":
         # 이전 자료 삭제
         query = query.where(Visit.vi_date < delete_date)
+        delete_visit_rollup(db, lambda column: column < delete_date.date())
 
     elif method == "specific":
         # 당월 자료만 삭제
@@ -137,6 +146,8 @@ async def visit_delete_update(
             extract('year', Visit.vi_date) == year,
             extract('month', Visit.vi_date) == month
         )
+        last_date = delete_date.replace(day=monthrange(year, month)[1]).date()
+        delete_visit_rollup(db, lambda column: column.between(delete_date.date(), last_date))
     else:
         raise AlertException("잘못된 요청입니다.", 400)
 
@@ -233,39 +244,19 @@ async def visit_domain(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
-
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
+    await run_in_threadpool(refresh_visit_rollup, db)
 
     site_url = f"{request.base_url.scheme}://{request.base_url.hostname}"
     if request.base_url.port:
         site_url += f":{request.base_url.port}"
-    # referer에서 도메인 필터링
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        # http or https
-        match = re.search(r'^http[s]*\S+', visit.vi_referer)
-        if match:
-            match_group = match.group()
-            referer: str = re.sub(r"^(www\.|search\.|dirsearch\.|dir\.search\.|dir\.|kr\.search\.|myhome\.)(.*)",
-                                  "\\2", match_group)
-            filtered_visits.append({
-                "vi_referer": '직접' if referer.startswith(site_url) else referer,
-                "count": 1,
-            })
-        else:
-            filtered_visits.append({
-                "vi_referer": '직접',
-                "count": 1,
-            })
-        total_records += 1
+    # 접속경로(referer)별 접속자집계
+    # - http(s) 주소가 아니거나 사이트 내부 주소이면 '직접'으로 합산합니다.
+    counts = Counter()
+    for referer, count in get_visit_dimension_counts(db, DIMENSION_REFERER, from_date, to_date).items():
+        counts['직접' if not referer or referer.startswith(site_url) else referer] += count
 
-    visits = count_by_field(filtered_visits, "vi_referer")
-    visits = add_percent_field(visits)
+    total_records = sum(counts.values())
+    visits = to_visit_list("vi_referer", dict(counts.most_common()))
 
     context = {
         "request": request,
@@ -289,26 +280,11 @@ async def visit_browser(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
+    await run_in_threadpool(refresh_visit_rollup, db)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 브라우저별 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "vi_browser": visit.vi_browser or get_browser(visit.vi_agent),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "vi_browser")
-    visits = add_percent_field(visits)
+    counts = get_visit_dimension_counts(db, DIMENSION_BROWSER, from_date, to_date)
+    total_records = sum(counts.values())
+    visits = to_visit_list("vi_browser", counts)
 
     context = {
         "request": request,
@@ -332,26 +308,11 @@ async def visit_os(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
+    await run_in_threadpool(refresh_visit_rollup, db)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # OS별 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "vi_os": visit.vi_os or get_os(visit.vi_agent),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "vi_os")
-    visits = add_percent_field(visits)
+    counts = get_visit_dimension_counts(db, DIMENSION_OS, from_date, to_date)
+    total_records = sum(counts.values())
+    visits = to_visit_list("vi_os", counts)
 
     context = {
         "request": request,
@@ -375,26 +336,11 @@ async def visit_device(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
+    await run_in_threadpool(refresh_visit_rollup, db)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속기기별 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "vi_device": visit.vi_device,
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "vi_device")
-    visits = add_percent_field(visits)
+    counts = get_visit_dimension_counts(db, DIMENSION_DEVICE, from_date, to_date)
+    total_records = sum(counts.values())
+    visits = to_visit_list("vi_device", counts)
 
     context = {
         "request": request,
@@ -417,32 +363,19 @@ async def visit_hour(
     시간별 접속자집계 목록
     """
     request.session["menu_key"] = VISIT_MENU_KEY
-    dialect = db.bind.dialect.name
     from_date, to_date = validate_time(from_date, to_date)
+    await run_in_threadpool(refresh_visit_rollup, db)
 
-    query = select().where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    # 합계
-    total_count = db.scalar(query.add_columns(func.count(Visit.vi_id)))
     # 시간별 접속자집계
-    # TODO: postgresql는 테스트가 안되어 있음
-    if dialect == 'mysql':
-        query = query.add_columns(func.hour(Visit.vi_time).label('hour'))
-    elif dialect == 'postgresql':
-        query = query.add_columns(func.to_char(Visit.vi_time, 'HH24').label('hour'))
-    elif dialect == 'sqlite':
-        query = query.add_columns(func.strftime('%H', Visit.vi_time).label('hour'))
-    query_result = db.execute(
-        query.add_columns(func.count().label('hour_count'))
-        .group_by('hour')
-    ).all()
+    hour_counts = get_visit_hour_counts(db, from_date, to_date)
+    total_count = sum(hour_counts.values())
 
     # 00 ~ 23 시간별 접속자집계
     visits = {f"{hour:02d}": {"count": 0, "rate": 0} for hour in range(24)}
 
-    for result in query_result:
-        result_hour = int(result.hour)
-        visits[f"{result_hour:02d}"]["count"] = result.hour_count
-        visits[f"{result_hour:02d}"]["rate"] = round(result.hour_count / total_count * 100, 2)
+    for hour, count in hour_counts.items():
+        visits[f"{hour:02d}"]["count"] = count
+        visits[f"{hour:02d}"]["rate"] = round(count / total_count * 100, 2)
 
     context = {
         "request": request,
@@ -465,28 +398,13 @@ async def visit_weekday(
     요일별 접속자집계 목록
     """
     request.session["menu_key"] = VISIT_MENU_KEY
-    dialect = db.bind.dialect.name
     from_date, to_date = validate_time(from_date, to_date)
+    await run_in_threadpool(refresh_visit_rollup, db)
 
-    query = select().where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    # 합계
-    total_count = db.scalar(query.add_columns(func.count(Visit.vi_id)))
     # 요일별 접속자집계
-    # TODO: postgresql는 테스트가 안되어 있음
-    if dialect == 'mysql':
-        query = query.add_columns(func.dayofweek(Visit.vi_date).label('dow'))
-    elif dialect == 'postgresql':
-        query = query.add_columns(func.to_char(Visit.vi_date, 'D').label('dow'))
-    elif dialect == 'sqlite':
-        query = query.add_columns(func.strftime('%w', Visit.vi_date).label('dow'))
-    query_result = db.execute(
-        query.add_columns(Visit.vi_date, func.count().label('dow_count'))
-        .group_by(Visit.vi_date, 'dow')
-        # 데이터베이스 별로 요일(day of week)을 출력하는 기준이 다르기 때문에
-        # vi_date 가 필요하다.
-    ).all()
+    date_counts = get_visit_date_counts(db, from_date, to_date)
+    total_count = sum(date_counts.values())
 
-    # 요일별 접속자집계
     day_of_week = {
         "Mon": "월",
         "Tue": "화",
@@ -498,12 +416,12 @@ async def visit_weekday(
     }
     visits = {value: {"count": 0, "rate": 0} for value in day_of_week.values()}
 
-    for result in query_result:
-        # 데이터베이스 별로 요일(day of week)을 출력하는 기준이 다르기 때문에
-        # 요일을 python 기준으로 다시한번 변경한다.
-        dow = day_of_week[result.vi_date.strftime("%a")]
-        visits[dow]["count"] = result.dow_count
-        visits[dow]["rate"] = round(result.dow_count / total_count * 100, 2)
+    for visit_date, count in date_counts.items():
+        dow = day_of_week[visit_date.strftime("%a")]
+        visits[dow]["count"] += count
+    for visit in visits.values():
+        if visit["count"]:
+            visit["rate"] = round(visit["count"] / total_count * 100, 2)
 
     context = {
         "request": request,
@@ -527,26 +445,15 @@ async def visit_date(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
-
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
+    await run_in_threadpool(refresh_visit_rollup, db)
 
     # 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "visit_date": visit.vi_date.strftime("%Y-%m-%d"),
-            "count": 1,
-        })
+    counts = Counter()
+    for visit_date, count in get_visit_date_counts(db, from_date, to_date).items():
+        counts[visit_date.strftime("%Y-%m-%d")] += count
 
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "visit_date")
-    visits = add_percent_field(visits)
+    total_records = sum(counts.values())
+    visits = to_visit_list("visit_date", counts)
 
     context = {
         "request": request,
@@ -570,26 +477,15 @@ async def visit_month(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
-
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
+    await run_in_threadpool(refresh_visit_rollup, db)
 
     # 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "visit_month": visit.vi_date.strftime("%Y-%m"),
-            "count": 1,
-        })
+    counts = Counter()
+    for visit_date, count in get_visit_date_counts(db, from_date, to_date).items():
+        counts[visit_date.strftime("%Y-%m")] += count
 
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "visit_month")
-    visits = add_percent_field(visits)
+    total_records = sum(counts.values())
+    visits = to_visit_list("visit_month", counts)
 
     context = {
         "request": request,
@@ -613,26 +509,15 @@ async def visit_year(
     """
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
-
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
+    await run_in_threadpool(refresh_visit_rollup, db)
 
     # 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "visit_year": visit.vi_date.strftime("%Y"),
-            "count": 1,
-        })
-
-        total_records += 1
+    counts = Counter()
+    for visit_date, count in get_visit_date_counts(db, from_date, to_date).items():
+        counts[visit_date.strftime("%Y")] += count
 
-    visits = count_by_field(filtered_visits, "visit_year")
-    visits = add_percent_field(visits)
+    total_records = sum(counts.values())
+    visits = to_visit_list("visit_year", counts)
 
     context = {
         "request": request,
@@ -644,21 +529,14 @@ async def visit_year(
     return templates.TemplateResponse("visit_year.html", context)
 
 
-def count_by_field(list: list, field_name: str) -> list:
-    """기존 리스트를 field_name 기준으로 합산합니다.
+def to_visit_list(field_name: str, counts: Dict[str, int]) -> list:
+    """항목별 접속자 수를 화면 출력 목록으로 변환하고 백분율(percent) 필드를 추가합니다.
     Args:
-        list (list): 접속자 리스트
+        field_name (str): 항목 필드 이름
+        counts (Dict[str, int]): 항목별 접속자 수 (출력 순서)
     """
-    temp = {}
-    for item in list:
-        referer = item[field_name]
-        count = item["count"]
-
-        if referer in temp:
-            temp[referer] += count
-        else:
-            temp[referer] = count
-    return [{field_name: key, "count": value} for key, value in temp.items()]
+    visits = [{field_name: key, "count": value} for key, value in counts.items()]
+    return add_percent_field(visits)
 
 
 def add_percent_field(list: List[dict]) -> list:
@@ -676,63 +554,6 @@ def add_percent_field(list: List[dict]) -> list:
     return list
 
 
-def get_browser(user_agent):
-    """브라우저이름을 반환합니다.
-    """
-    user_agent = user_agent.lower()
-
-    browsers = {
-        'Chrome': r"chrome",
-        'FireFox': r"firefox",
-        'Safari': r"safari",
-        'Opera': r"opera",
-        'MSIE': r"msie ([1-9][0-9]\.[0-9]+)",
-        'Mozilla': r"mozilla",
-        'Robot': r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook",
-        'IE': r"internet explorer"
-    }
-
-    for browser_name, pattern in browsers.items():
-        if re.search(pattern, user_agent):
-            return browser_name
-
-    return "other"  # todo 다국어
-
-
-def get_os(user_agent):
-    user_agent = user_agent.lower()
-
-    os_patterns = {
-        "Android": r"android",
-        "IOS": r"IOS",
-        "iPad OS": r"iPad",
-        "Phone": r"phone",
-        "Windows10": r"windows nt 10\.0",
-        "Windows8.1": r"windows nt 6\.3",
-        "Windows8": r"windows nt 6\.2",
-        "Windows7": r"windows nt 6\.1",
-        "Vista": r"windows nt 6\.0",
-        "XP": r"windows nt 5\.1",
-        "2003": r"windows nt 5\.2",
-        "NT": r"windows nt 4\.[0-9]*",
-        "CE": r"windows ce",
-        "MAC": r"mac",
-        "Robot": r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook ",
-        "Linux": r"linux",
-        "Solrais": r"solrais",
-        "IE": r"internet explorer",
-        "Mozilla": r"mozilla",
-        "IRIX": r"irix"
-    }
-
-    # Iterate through the patterns and return the first matching OS
-    for os_name, pattern in os_patterns.items():
-        if re.search(pattern, user_agent):
-            return os_name
-
-    return "other"
-
-
 def validate_time(from_date, to_date):
     if from_date:
         from_date = re.sub(r'[^0-9 :\-]', '', from_date)
@@ -4,17 +4,14 @@ from fastapi import Depends, Request
 from sqlalchemy.exc import ProgrammingError
 
 from api.v1.auth import oauth2_optional
-from core.database import db_session
 from api.v1.dependencies.member import get_current_member_optional
-from api.v1.service.current_connect import CurrentConnectServiceAPI
 from api.v1.service.member import MemberServiceAPI
 from lib.common import get_client_ip
+from lib.presence_tracker import presence_tracker
 
 
 async def set_current_connect(
         request: Request,
-        db: db_session,
-        service: Annotated[CurrentConnectServiceAPI, Depends()],
         member_service: Annotated[MemberServiceAPI, Depends()],
         ):
     """현재 접속자 정보 설정"""
@@ -27,19 +24,9 @@ async def set_current_connect(
         mb_id = getattr(member, "mb_id", "")
         cf_admin = getattr(request.state.config, "cf_admin", "admin")
 
+        # 메모리에 기록하고, 테이블 저장과 오래된 접속자 삭제는 백그라운드에서 처리합니다.
         if cf_admin != mb_id:
-            current_login = service.fetch_current_connect(current_ip)
-            if current_login:
-                service.update_current_connect(current_login, path, mb_id)
-            else:
-                service.create_current_connect(current_ip, path, mb_id)
-
-        # 현재 로그인한 이력 삭제
-        service.delete_current_connect()
-
-        # 세션의 member 데이터를 데이터베이스와 동기화
-        if member:
-            db.refresh(member)
+            presence_tracker.touch(current_ip, mb_id, path)
 
     except ProgrammingError as e:
         print(e)
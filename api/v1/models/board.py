@@ -286,6 +286,15 @@ class BoardPaginationRequest(PagenationRequest):
               """
               )
     )
+    cursor: Union[str, None] = Field(
+        Query(default=None,
+              title="커서",
+              description="""커서 페이징 <br>\
+                빈 값이면 첫 페이지, 이후에는 응답의 prev_cursor/next_cursor 값을 사용 <br>\
+                기본 정렬일 때만 적용되며, 그 외에는 page 기준으로 조회
+              """
+              )
+    )
 
 
 class ResponseBoardListModel(PaginationResponse):
@@ -298,6 +307,8 @@ class ResponseBoardListModel(PaginationResponse):
     current_page: int
     prev_spt: Union[int, None]
     next_spt: Union[int, None]
+    prev_cursor: Union[str, None] = None
+    next_cursor: Union[str, None] = None
 
 
 class ResponseTotalBoardNewListModel(BaseModel):
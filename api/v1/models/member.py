@@ -5,7 +5,7 @@ from fastapi import Body
 from pydantic import BaseModel, ConfigDict, EmailStr, field_validator, model_validator
 
 from lib.member import set_zip_code
-from lib.pbkdf2 import create_hash
+from lib.password_hasher import password_hasher
 
 from api.v1.service.member import MemberImageServiceAPI as ImageService
 from api.v1.models.response import MessageResponse
@@ -66,7 +66,7 @@ class CreateMember(BaseModel):
             raise ValueError('비밀번호가 일치하지 않습니다.')
 
         # convert to hash password
-        self.mb_password = create_hash(pw1)
+        self.mb_password = password_hasher.hash(pw1)
         return self
 
     @model_validator(mode='after')
@@ -133,7 +133,7 @@ class UpdateMember(BaseModel):
         if pw1 is not None:
             if pw1 != pw2:
                 raise ValueError('비밀번호가 일치하지 않습니다.')
-            self.mb_password = create_hash(pw1)
+            self.mb_password = password_hasher.hash(pw1)
         else:
             del self.mb_password
 
@@ -228,6 +228,6 @@ class ResetMemberPassword(BaseModel):
         if pw1 != pw2:
             raise ValueError('비밀번호가 일치하지 않습니다.')
 
-        self.password = create_hash(pw1)
+        self.password = password_hasher.hash(pw1)
 
         return self
@@ -71,6 +71,8 @@ async def api_list_post(
         "current_page": service.search_params['current_page'],
         "prev_spt": service.prev_spt,
         "next_spt": service.next_spt,
+        "prev_cursor": service.prev_cursor,
+        "next_cursor": service.next_cursor,
     }
     return jsonable_encoder(content)
 
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, Request
 from core.models import Member
 from lib.common import get_paging_info, hide_ip_address
 from lib.member import is_super_admin
+from lib.presence_tracker import presence_tracker
 from api.v1.dependencies.member import get_current_member_optional
 from api.v1.service.current_connect import CurrentConnectServiceAPI
 from api.v1.models.current_connect import (
@@ -29,6 +30,8 @@ async def read_member_points(
 ) -> CurrentConnectListResponse:
     """현재 사이트에 접속 중인 회원들의 목록을 조회합니다."""
     only_member = data.only_member == "Y"
+    # 메모리의 접속자 정보를 저장한 후 조회합니다.
+    presence_tracker.sync()
     total_records = service.fetch_total_records(only_member)
     paging_info = get_paging_info(data.page, data.per_page, total_records)
     connects = service.fetch_corrent_connects(only_member,
@@ -18,6 +18,6 @@ async def read_menus(
 ) -> List[MenuResponse]:
     """
     메인/서브 메뉴 목록을 조회합니다.
-    - LRU(Least Recently Used)캐시를 사용하여 조회합니다.
+    - 레이아웃 캐시를 사용하여 조회합니다.
     """
     return menu_service.fetch_menus()
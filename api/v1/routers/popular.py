@@ -24,7 +24,7 @@ async def read_populars(
 ) -> List[PopularResponse]:
     """
     인기 검색어 목록을 조회합니다.
-    - TTLCache(Time-To-Live) 캐시를 사용하여 조회합니다.
+    - 레이아웃 캐시를 사용하여 조회합니다. (보관시간 60초)
     """
     return service.fetch_populars(data.limit, data.day)
 
@@ -18,6 +18,7 @@ from service.board import (
     DeletePostService, CommentService, DeleteCommentService,
     MoveUpdateService, ListDeleteService
 )
+from service.board_count_service import BoardCountService
 from service.board_file_service import BoardFileService
 
 
@@ -175,6 +176,7 @@ class CreatePostServiceAPI(CreatePostService):
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
         self.db.commit()
+        BoardCountService.invalidate(self.bo_table)
         return write
 
 class UpdatePostServiceAPI(UpdatePostService):
@@ -4,9 +4,10 @@
 from typing_extensions import Annotated, List
 
 from fastapi import APIRouter, Depends, Request, Form, Path, Query, File, UploadFile
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse, Response
+from sqlalchemy.orm import Session
 
-from core.database import db_session
+from core.database import db_session, threaded_db_session
 from core.exception import AlertException
 from core.formclass import WriteForm, WriteCommentForm
 from core.models import WriteBaseModel
@@ -23,7 +24,7 @@ from lib.dependency.board import get_write
 from lib.dependency.dependencies import (
     check_group_access, common_search_query_params, validate_captcha, validate_token
 )
-from lib.template_functions import get_paging
+from lib.template_functions import get_cursor_paging, get_paging
 from service.board import (
     ListPostService, CreatePostService, ReadPostService,
     UpdatePostService, DeletePostService, GroupBoardListService,
@@ -31,6 +32,8 @@ from service.board import (
     MoveUpdateService, DownloadFileService
 )
 from service.board_file_service import BoardFileService
+from service.member_service import MemberService
+from service.point_service import PointService
 from service.popular_service import PopularService
 
 
@@ -70,18 +73,37 @@ async def group_board_list(
 @router.get("/{bo_table}/")
 async def list_post(
     request: Request,
-    list_post_service: Annotated[ListPostService, Depends(ListPostService.async_init)],
-    popular_service: Annotated[PopularService, Depends(PopularService.async_init)],
+    db: threaded_db_session,
+    bo_table: Annotated[str, Path(..., title="게시판 테이블명", description="게시판 테이블명")],
     search_params: Annotated[dict, Depends(common_search_query_params)],
 ):
     """해당 게시판의 게시글 목록을 보여준다."""
+    return await db.run_sync(render_list_post, request, bo_table, search_params)
+
+
+def render_list_post(db: Session, request: Request, bo_table: str, search_params: dict) -> Response:
+    """게시글 목록 화면을 출력한다. (list_post에서 run_sync()로 실행)"""
+    file_service = BoardFileService(request, db)
+    list_post_service = ListPostService(request, db, bo_table, file_service, search_params)
+    popular_service = PopularService(db)
+
     board = list_post_service.board
-    paging = get_paging(
-        list_post_service.request,
-        list_post_service.search_params['current_page'],
-        list_post_service.get_total_count(),
-        list_post_service.page_rows
-    )
+    if list_post_service.is_cursor_paging:
+        # 커서 페이징은 게시글을 조회한 후에 이전/다음 커서가 정해집니다.
+        writes = list_post_service.get_writes()
+        paging = get_cursor_paging(
+            list_post_service.request,
+            list_post_service.prev_cursor,
+            list_post_service.next_cursor
+        )
+    else:
+        paging = get_paging(
+            list_post_service.request,
+            list_post_service.search_params['current_page'],
+            list_post_service.get_total_count(),
+            list_post_service.page_rows
+        )
+        writes = list_post_service.get_writes(page=search_params.get('current_page'))
 
     # 검색 단어를 인기검색어에 등록
     fields = search_params.get('sfl')
@@ -94,7 +116,7 @@ async def list_post(
         "board": board,
         "board_config": list_post_service,
         "notice_writes": list_post_service.get_notice_writes(),
-        "writes": list_post_service.get_writes(page=search_params.get('current_page')),
+        "writes": writes,
         "total_count": list_post_service.get_total_count(),
         "current_page": list_post_service.search_params['current_page'],
         "paging": paging,
@@ -104,6 +126,8 @@ async def list_post(
         "gallery_height": list_post_service.gallery_height,
         "prev_spt": list_post_service.prev_spt,
         "next_spt": list_post_service.next_spt,
+        "prev_cursor": list_post_service.prev_cursor,
+        "next_cursor": list_post_service.next_cursor,
     }
 
     return templates.TemplateResponse(f"/board/{board.bo_skin}/list_post.html", context)
@@ -386,9 +410,21 @@ async def update_post(
 
 @router.get("/{bo_table}/{wr_id}", dependencies=[Depends(check_group_access)])
 async def read_post(
-    service: Annotated[ReadPostService, Depends(ReadPostService.async_init)],
+    request: Request,
+    db: threaded_db_session,
+    bo_table: Annotated[str, Path(...)],
+    wr_id: Annotated[int, Path(...)],
 ):
     """게시글을 읽는다."""
+    return await db.run_sync(render_read_post, request, bo_table, wr_id)
+
+
+def render_read_post(db: Session, request: Request, bo_table: str, wr_id: int) -> Response:
+    """게시글 읽기 화면을 출력한다. (read_post에서 run_sync()로 실행)"""
+    file_service = BoardFileService(request, db)
+    point_service = PointService(request, db, MemberService(request, db))
+    service = ReadPostService(request, db, file_service, point_service, bo_table, wr_id)
+
     board = service.board
     service.request.state.editor = service.select_editor
     service.validate_secret_with_session()
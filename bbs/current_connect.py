@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, Request
 
 from core.template import UserTemplates
 from lib.common import hide_ip_address
+from lib.presence_tracker import presence_tracker
 from service.current_connect_service import CurrentConnectService
 
 router = APIRouter()
@@ -17,6 +18,8 @@ async def current_connect(
     service: Annotated[CurrentConnectService, Depends()],
 ):
     """현재 접속중인 사용자의 정보를 반환합니다."""
+    # 메모리의 접속자 정보를 저장한 후 조회합니다.
+    presence_tracker.sync()
     logins = service.fetch_corrent_connects(per_page=100000)
     for login, member in logins:
         if not request.state.is_super_admin:
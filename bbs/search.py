@@ -1,7 +1,9 @@
 """전체검색 Template Router"""
-from typing_extensions import Annotated
-from fastapi import APIRouter, Depends, Request, Query
+from fastapi import APIRouter, Request, Query
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
 
+from core.database import threaded_db_session
 from core.template import UserTemplates
 from lib.template_filters import search_font
 from service.popular_service import PopularService
@@ -15,16 +17,25 @@ templates.env.filters["search_font"] = search_font
 @router.get("/search")
 async def search(
     request: Request,
-    search_service: Annotated[SearchService, Depends(SearchService.async_init)],
-    popular_service: Annotated[PopularService, Depends()],
+    db: threaded_db_session,
     sfl: str = Query("wr_subject||wr_content"),
     stx: str = Query(...),
     sop: str = Query("and"),
+    gr_id: str = Query(None),
     onetable: str = Query(None),
 ):
     """
     게시판 검색
     """
+    return await db.run_sync(render_search, request, sfl, stx, sop, gr_id, onetable)
+
+
+def render_search(db: Session, request: Request, sfl: str, stx: str, sop: str,
+                  gr_id: str, onetable: str) -> Response:
+    """검색 결과 화면을 출력한다. (search에서 run_sync()로 실행)"""
+    search_service = SearchService(request, db, gr_id, onetable)
+    popular_service = PopularService(db)
+
     groups = search_service.get_groups()
     boards = search_service.get_boards()
     searched_result = search_service.search(boards, sfl, stx, sop)
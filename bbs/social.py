@@ -20,7 +20,7 @@ from core.models import Config, Member, MemberSocialProfiles
 from core.template import UserTemplates
 from lib.common import get_admin_email, get_admin_email_name, session_member_key
 from lib.mail import mailer
-from lib.pbkdf2 import create_hash
+from lib.password_hasher import password_hasher
 from lib.social import providers
 from lib.social.social import (
     get_social_login_token, get_social_profile, oauth, SocialProvider
@@ -270,7 +270,7 @@ async def post_social_register(
 
     member = Member()
     member.mb_id = gnu_social_id
-    member.mb_password = create_hash(str(request_time.microsecond) + uuid4().hex)
+    member.mb_password = password_hasher.hash(str(request_time.microsecond) + uuid4().hex)
     member.mb_name = mb_nick
     member.mb_nick = mb_nick
     member.mb_email = member_form.mb_email
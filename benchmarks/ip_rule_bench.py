@@ -0,0 +1,120 @@
+"""접근가능/접근차단 IP 규칙(lib/ip_rule.py IpRuleSet) 벤치마크
+
+IP 규칙 목록(정확한 IP, 끝이 '+'인 규칙, CIDR)에서 요청 IP 1건을 확인하는 시간을 측정합니다.
+- 이전 방식: 요청마다 규칙 한 줄씩 정규식으로 변환하여 re.match 합니다.
+- 현재 방식: 목록을 IpRuleSet으로 한번 컴파일한 후 match() 합니다.
+- 이전 방식은 CIDR 규칙을 지원하지 않으므로 결과 비교시 CIDR은 ipaddress로 확인합니다.
+
+실행 방법 (프로젝트 루트에서)
+    python -m benchmarks.ip_rule_bench --rules 10000 --requests 20
+
+결과 예시 (1 vCPU, Python 3.11, 규칙 10,000개: 정확한 IP 7,000 / 접두사 2,000 / CIDR 1,000)
+    컴파일: 26.1 ms
+    이전 방식: 요청 1건 337.6 ms
+    현재 방식: 요청 1건 6.9 µs
+    결과 비교: 규칙 500개, IP 20,000개, 불일치 0
+"""
+import argparse
+import ipaddress
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.ip_rule import IpRuleSet  # noqa: E402
+
+
+def legacy_match(ip_list: str, current_ip: str) -> bool:
+    """이전 방식의 IP 목록 확인 (lib/common.py check_ip_list)"""
+    for pattern in ip_list.split("\n"):
+        pattern = pattern.strip()
+        if not pattern:
+            continue
+        pattern = pattern.replace(".", r"\.")
+        pattern = pattern.replace("+", r"[0-9\.]+")
+        if re.match(f"^{pattern}$", current_ip):
+            return True
+    return False
+
+
+def generate_rules(count: int, rnd: random.Random) -> list:
+    """정확한 IP 70%, 접두사('+') 20%, CIDR 10%의 규칙 목록을 생성합니다."""
+    rules = []
+    for index in range(count):
+        octets = [rnd.randint(1, 50), rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(0, 255)]
+        kind = index % 10
+        if kind < 7:
+            rules.append(".".join(map(str, octets)))
+        elif kind < 9:
+            rules.append(".".join(map(str, octets[:rnd.randint(2, 3)])) + ".+")
+        else:
+            prefix = rnd.choice((16, 20, 24))
+            rules.append(str(ipaddress.ip_network(f"{'.'.join(map(str, octets))}/{prefix}", strict=False)))
+    rnd.shuffle(rules)
+    return rules
+
+
+def generate_ips(count: int, rules: list, rnd: random.Random) -> list:
+    """규칙에 속하는 IP와 속하지 않는 IP가 섞인 IP 목록을 생성합니다."""
+    exact = [rule for rule in rules if "+" not in rule and "/" not in rule]
+    ips = []
+    for _ in range(count):
+        if exact and rnd.random() < 0.2:
+            ips.append(rnd.choice(exact))
+        else:
+            ips.append(".".join(str(value) for value in
+                                (rnd.randint(1, 60), rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(0, 255))))
+    return ips
+
+
+def reference_match(ip_list: str, networks: list, ip: str) -> bool:
+    """이전 방식 + CIDR 확인 결과"""
+    if legacy_match(ip_list, ip):
+        return True
+    address = ipaddress.ip_address(ip)
+    return any(address in network for network in networks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=10000, help="IP 규칙 수")
+    parser.add_argument("--requests", type=int, default=20, help="이전 방식으로 확인할 요청(IP) 수")
+    parser.add_argument("--check-rules", type=int, default=500, help="결과 비교에 사용할 규칙 수")
+    parser.add_argument("--check-ips", type=int, default=20000, help="결과 비교에 사용할 IP 수")
+    args = parser.parse_args()
+    rnd = random.Random(1)
+
+    rules = generate_rules(args.rules, rnd)
+    ip_list = "\n".join(rules)
+
+    started = time.perf_counter()
+    rule_set = IpRuleSet(ip_list)
+    print(f"컴파일: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    ips = generate_ips(args.requests, rules, rnd)
+    started = time.perf_counter()
+    for ip in ips:
+        legacy_match(ip_list, ip)
+    print(f"이전 방식: 요청 1건 {(time.perf_counter() - started) / len(ips) * 1000:.1f} ms")
+
+    ips = generate_ips(max(args.requests, 100000), rules, rnd)
+    started = time.perf_counter()
+    for ip in ips:
+        rule_set.match(ip)
+    print(f"현재 방식: 요청 1건 {(time.perf_counter() - started) / len(ips) * 1000000:.1f} µs")
+
+    rules = generate_rules(args.check_rules, rnd)
+    ip_list = "\n".join(rules)
+    networks = [ipaddress.ip_network(rule) for rule in rules if "/" in rule]
+    rule_set = IpRuleSet(ip_list)
+    ips = generate_ips(args.check_ips, rules, rnd)
+    mismatched = sum(1 for ip in ips if rule_set.match(ip) != reference_match(ip_list, networks, ip))
+    print(f"결과 비교: 규칙 {len(rules):,}개, IP {len(ips):,}개, 불일치 {mismatched}")
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""비밀번호 암호화/검증(lib/password_hasher.py) 처리량 벤치마크
+
+- 반복 횟수별 암호화 1건의 시간을 측정합니다.
+- 여러 로그인이 동시에 들어온 경우 검증 처리량을 측정합니다.
+  (순차 실행 / 스레드 풀(PASSWORD_HASH_WORKERS) 실행)
+- 이벤트 루프에서 직접 검증하는 경우와 verify_async()로 검증하는 경우
+  이벤트 루프가 멈춘 최대 시간을 측정합니다.
+
+실행 방법 (프로젝트 루트에서)
+    python -m benchmarks.password_hash_bench --iterations 12000 100000 --logins 64 --workers 4
+
+결과 예시 (1 vCPU, Python 3.11 - CPU가 1개이므로 스레드 풀로 처리량은 늘지 않고 이벤트 루프 정지만 줄어듭니다.)
+    반복 12000: 암호화 5.7 ms/건
+    반복 100000: 암호화 48.0 ms/건
+    [반복 12000] 로그인 64건 순차 0.41초 (154건/초), 스레드 풀 4개 0.44초 (146건/초)
+    [반복 12000] 이벤트 루프 최대 정지: 직접 검증 19.1 ms, verify_async 5.3 ms
+    [반복 100000] 로그인 64건 순차 2.97초 (22건/초), 스레드 풀 4개 3.07초 (21건/초)
+    [반복 100000] 이벤트 루프 최대 정지: 직접 검증 141.2 ms, verify_async 12.6 ms
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.password_hasher import PasswordHasher  # noqa: E402
+
+
+def measure_hash(hasher: PasswordHasher, count: int = 20) -> float:
+    """암호화 1건의 평균 시간(초)을 반환합니다."""
+    started = time.perf_counter()
+    for _ in range(count):
+        hasher.hash("password")
+    return (time.perf_counter() - started) / count
+
+
+def measure_logins(hasher: PasswordHasher, hashed: str, logins: int) -> tuple:
+    """로그인(검증) 순차 실행 시간과 스레드 풀 실행 시간(초)을 반환합니다."""
+    started = time.perf_counter()
+    for _ in range(logins):
+        hasher.verify("password", hashed)
+    sequential = time.perf_counter() - started
+
+    async def run():
+        await asyncio.gather(*[hasher.verify_async("password", hashed) for _ in range(logins)])
+
+    started = time.perf_counter()
+    asyncio.run(run())
+    pooled = time.perf_counter() - started
+    return sequential, pooled
+
+
+def measure_loop_stall(hasher: PasswordHasher, hashed: str, logins: int = 10) -> tuple:
+    """직접 검증 / verify_async() 검증 중 이벤트 루프가 멈춘 최대 시간(초)을 반환합니다."""
+
+    async def run(use_async: bool) -> float:
+        stop = asyncio.Event()
+        stalls = []
+
+        async def ticker():
+            while not stop.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(0.001)
+                stalls.append(time.perf_counter() - started - 0.001)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0.01)
+        for _ in range(logins):
+            if use_async:
+                await hasher.verify_async("password", hashed)
+            else:
+                hasher.verify("password", hashed)
+            await asyncio.sleep(0)
+        stop.set()
+        await task
+        return max(stalls)
+
+    return asyncio.run(run(False)), asyncio.run(run(True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, nargs="+", default=[12000, 100000],
+                        help="암호화 반복 횟수 (PASSWORD_HASH_ITERATIONS)")
+    parser.add_argument("--logins", type=int, default=64, help="동시 로그인 수")
+    parser.add_argument("--workers", type=int, default=4, help="검증 스레드 수 (PASSWORD_HASH_WORKERS)")
+    args = parser.parse_args()
+
+    for iterations in args.iterations:
+        hasher = PasswordHasher(iterations=iterations, max_workers=args.workers)
+        print(f"반복 {iterations}: 암호화 {measure_hash(hasher) * 1000:.1f} ms/건")
+        hasher.shutdown()
+
+    for iterations in args.iterations:
+        hasher = PasswordHasher(iterations=iterations, max_workers=args.workers)
+        hashed = hasher.hash("password")
+        sequential, pooled = measure_logins(hasher, hashed, args.logins)
+        print(f"[반복 {iterations}] 로그인 {args.logins}건 "
+              f"순차 {sequential:.2f}초 ({args.logins / sequential:,.0f}건/초), "
+              f"스레드 풀 {args.workers}개 {pooled:.2f}초 ({args.logins / pooled:,.0f}건/초)")
+        inline, offloaded = measure_loop_stall(hasher, hashed)
+        print(f"[반복 {iterations}] 이벤트 루프 최대 정지: "
+              f"직접 검증 {inline * 1000:.1f} ms, verify_async {offloaded * 1000:.1f} ms")
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
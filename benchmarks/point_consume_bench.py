@@ -0,0 +1,139 @@
+"""포인트 사용 처리(service/point_service.py PointService._consume_points) 벤치마크
+
+적립된 포인트 내역이 많은 회원이 포인트를 사용할 때 사용 처리 시간을 측정합니다.
+- 이전 방식: 사용 가능한 포인트 내역 전체를 ORM 객체로 조회한 후 내역 1건마다 UPDATE, commit 합니다.
+  commit 할 때마다 조회한 객체 전체가 만료(expire)되므로 내역 수의 제곱에 비례합니다.
+- 현재 방식: 필요한 내역만 먼저 적립된 순서로 읽어 배분한 후 한번의 UPDATE(executemany), commit 합니다.
+- 이전 방식은 오래 걸리므로 --legacy-max-rows 이하의 내역 수에서만 실행합니다.
+
+실행 방법 (프로젝트 루트에서, 임시 SQLite 파일에 포인트 테이블을 생성합니다.)
+    python -m benchmarks.point_consume_bench --rows 1000 2000 5000 50000 --legacy-max-rows 5000
+
+결과 예시 (1 vCPU, Python 3.11, SQLite, 내역 1건당 10점 적립)
+    [내역 1,000건, 전체 사용] 이전 4.90초 (사용 10,000점) / 현재 0.066초 (사용 10,000점)
+    [내역 1,000건, 10점 사용] 이전 3.97초 (사용 10점) / 현재 0.003초 (사용 10점)
+    [내역 2,000건, 전체 사용] 이전 20.85초 (사용 20,000점) / 현재 0.022초 (사용 20,000점)
+    [내역 2,000건, 10점 사용] 이전 20.93초 (사용 10점) / 현재 0.004초 (사용 10점)
+    [내역 5,000건, 전체 사용] 이전 124.83초 (사용 50,000점) / 현재 0.044초 (사용 50,000점)
+    [내역 5,000건, 10점 사용] 이전 126.34초 (사용 10점) / 현재 0.004초 (사용 10점)
+    [내역 50,000건, 전체 사용] 이전 생략 / 현재 0.703초 (사용 500,000점)
+    [내역 50,000건, 10점 사용] 이전 생략 / 현재 0.003초 (사용 10점)
+- 이전 방식은 사용할 포인트와 관계없이 내역 전체를 commit 하므로 10점만 사용해도 시간이 같습니다.
+  내역 5만건에서는 (제곱에 비례하여) 몇 시간이 걸리므로 기본값으로는 실행하지 않습니다.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, select, update  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from core.models import Base, Member, Point  # noqa: E402
+from service.point_service import PointService  # noqa: E402
+
+MB_ID = "bench"
+ROW_POINT = 10
+
+
+def populate(engine, rows: int) -> None:
+    """포인트 테이블을 다시 생성하고 적립 내역을 생성합니다."""
+    Base.metadata.drop_all(bind=engine, tables=[Point.__table__, Member.__table__])
+    Base.metadata.create_all(bind=engine, tables=[Member.__table__, Point.__table__])
+    now = datetime.now()
+    with Session(engine) as db:
+        db.execute(Point.__table__.insert(), [
+            {"mb_id": MB_ID, "po_datetime": now, "po_content": f"적립 {index}", "po_point": ROW_POINT,
+             "po_expire_date": datetime(9999, 12, 31)}
+            for index in range(rows)
+        ])
+        db.commit()
+
+
+def legacy_consume_points(db: Session, mb_id: str, point: int) -> None:
+    """이전 방식의 포인트 사용 처리 (PointService.insert_use_point)"""
+    using_point = abs(point)
+    # 사용할 수 있는 포인트 내역 조회
+    query = (
+        select(Point).where(
+            Point.mb_id == mb_id,
+            Point.po_expired == 0,
+            Point.po_point > Point.po_use_point
+        )
+    )
+    points = db.scalars(query.order_by(Point.po_id.asc())).all()
+
+    # 포인트 사용처리
+    for row in points:
+        row_point = row.po_point
+        used_point = row.po_use_point
+
+        if (row_point - used_point) > using_point:
+            db.execute(
+                update(Point).values(po_mb_point=Point.po_mb_point + using_point)
+                .where(Point.po_id == row.po_id)
+            )
+            db.commit()
+        else:
+            deduction_point = row_point - used_point
+            db.execute(
+                update(Point).values(
+                    po_use_point=(Point.po_use_point + deduction_point),
+                    po_expired=100
+                ).where(Point.po_id == row.po_id)
+            )
+            db.commit()
+            using_point -= deduction_point
+
+
+def consume_points(db: Session, mb_id: str, point: int) -> None:
+    """현재 방식의 포인트 사용 처리"""
+    request = SimpleNamespace(state=SimpleNamespace(config=SimpleNamespace(cf_use_point=1, cf_point_term=0)))
+    service = PointService(request, db, None)
+    service._consume_points(mb_id, point)
+    db.commit()
+
+
+def measure(engine, rows: int, point: int, consume) -> tuple:
+    """포인트 사용 처리 시간(초)과 사용 처리된 포인트 합계를 반환합니다."""
+    populate(engine, rows)
+    with Session(engine) as db:
+        started = time.perf_counter()
+        consume(db, MB_ID, point)
+        elapsed = time.perf_counter() - started
+        used = db.scalar(select(func.sum(Point.po_use_point)))
+    return elapsed, used
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 2000, 5000, 50000], help="포인트 내역 수")
+    parser.add_argument("--legacy-max-rows", type=int, default=5000, help="이전 방식을 실행할 최대 내역 수")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="point_consume_")
+    engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+    try:
+        for rows in args.rows:
+            cases = [("전체 사용", rows * ROW_POINT), ("10점 사용", ROW_POINT)]
+            for name, point in cases:
+                current, current_used = measure(engine, rows, point, consume_points)
+                if rows <= args.legacy_max_rows:
+                    legacy, legacy_used = measure(engine, rows, point, legacy_consume_points)
+                    legacy_text = f"이전 {legacy:.2f}초 (사용 {legacy_used:,}점)"
+                else:
+                    legacy_text = "이전 생략"
+                print(f"[내역 {rows:,}건, {name}] {legacy_text} / 현재 {current:.3f}초 (사용 {current_used:,}점)")
+    finally:
+        engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
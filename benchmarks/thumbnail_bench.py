@@ -0,0 +1,90 @@
+"""섬네일 생성(lib/common.py thumbnail) 요청 처리 시간 벤치마크
+
+섬네일이 아직 없는 게시글 목록/최신글을 출력할 때 한 요청이 섬네일 생성 때문에 기다리는 시간을 측정합니다.
+- 기다림(wait=True): 이미지 처리 프로세스에서 섬네일을 생성할 때까지 기다립니다. (이전 방식)
+- 기다리지 않음(wait=False): 생성을 등록만 하고 바로 반환합니다. (목록/최신글 요청)
+- 생성된 후(캐시): 섬네일 파일이 있는 경우의 시간입니다.
+
+실행 방법 (프로젝트 루트에서)
+    python -m benchmarks.thumbnail_bench --images 24 --size 2400x1800
+
+결과 예시 (1 vCPU, Python 3.11, 이미지 24개 2400x1800 JPEG, 섬네일 200x150)
+    기다림: 요청 1건(섬네일 24개) 2683.4 ms
+    기다리지 않음: 요청 1건(섬네일 24개) 4.5 ms, 백그라운드 생성 완료까지 2019.4 ms
+    생성된 후: 요청 1건(섬네일 24개) 0.3 ms
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from lib.common import thumbnail  # noqa: E402
+from lib.image_service import image_service  # noqa: E402
+
+
+def create_images(directory: str, count: int, width: int, height: int) -> list:
+    """원본 이미지 파일을 생성하고 경로 목록을 반환합니다."""
+    files = []
+    for index in range(count):
+        path = os.path.join(directory, f"source_{index}.jpg")
+        Image.effect_noise((width, height), 64 + index).convert("RGB").save(path, quality=90)
+        files.append(path)
+    return files
+
+
+def render(files: list, wait: bool) -> float:
+    """목록 한 페이지의 섬네일을 조회하는 시간(초)을 반환합니다."""
+    started = time.perf_counter()
+    for path in files:
+        thumbnail(path, width=200, height=150, wait=wait)
+    return time.perf_counter() - started
+
+
+def wait_generated(files: list) -> None:
+    """모든 섬네일 파일이 생성될 때까지 기다립니다."""
+    while not all(thumbnail(path, width=200, height=150, wait=False) for path in files):
+        time.sleep(0.01)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=24, help="목록 한 페이지의 이미지 수")
+    parser.add_argument("--size", default="2400x1800", help="원본 이미지 크기 (너비x높이)")
+    args = parser.parse_args()
+    width, height = (int(value) for value in args.size.split("x"))
+
+    directory = tempfile.mkdtemp(prefix="thumbnail_")
+    try:
+        # 프로세스 풀을 미리 시작합니다. (처음 요청의 프로세스 생성 시간 제외)
+        warmup = create_images(directory, 1, 64, 64)
+        thumbnail(warmup[0], width=32, height=32)
+
+        os.makedirs(os.path.join(directory, "wait"))
+        files = create_images(os.path.join(directory, "wait"), args.images, width, height)
+        elapsed = render(files, wait=True)
+        print(f"기다림: 요청 1건(섬네일 {args.images}개) {elapsed * 1000:.1f} ms")
+
+        os.makedirs(os.path.join(directory, "nowait"))
+        files = create_images(os.path.join(directory, "nowait"), args.images, width, height)
+        started = time.perf_counter()
+        elapsed = render(files, wait=False)
+        wait_generated(files)
+        generated = time.perf_counter() - started
+        print(f"기다리지 않음: 요청 1건(섬네일 {args.images}개) {elapsed * 1000:.1f} ms, "
+              f"백그라운드 생성 완료까지 {generated * 1000:.1f} ms")
+
+        elapsed = render(files, wait=False)
+        print(f"생성된 후: 요청 1건(섬네일 {args.images}개) {elapsed * 1000:.1f} ms")
+    finally:
+        image_service.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""고유키 발급(lib/unique_id.py) 동시성 스트레스 테스트
+
+여러 프로세스(worker)와 스레드에서 동시에 고유키를 발급하여 중복이 없는지 확인합니다.
+- 슬롯 수보다 많은 프로세스를 실행하면 슬롯을 점유하지 못한 프로세스는
+  고유키 테이블에 INSERT 하여 발급하므로 두 방식이 섞여도 중복되지 않는지 확인합니다.
+- 같은 슬롯을 다시 점유한 프로세스(재시작)가 이전 프로세스가 미리 사용한 시간의
+  고유키를 다시 발급하지 않는지 확인합니다.
+
+실행 방법 (프로젝트 루트에서, 설치가 완료된 DB 필요)
+    python -m benchmarks.unique_id_stress --processes 9 --threads 4 --count 50 --slots 8
+"""
+import argparse
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _allocate(lock_dir: str, slots: int, threads: int, count: int, ready, start, queue) -> None:
+    """프로세스 하나에서 여러 스레드로 고유키를 발급하고 결과를 전달합니다."""
+    from lib.unique_id import UniqueIdAllocator
+
+    allocator = UniqueIdAllocator(slots=slots)
+    allocator.lock_dir = lock_dir
+    slot = allocator.slot
+    ready.release()
+    start.wait()
+
+    keys = []
+
+    def run():
+        for _ in range(count):
+            keys.append(allocator.allocate("127.0.0.1"))
+
+    started = time.perf_counter()
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    queue.put((slot, keys, time.perf_counter() - started))
+
+
+def run_processes(lock_dir: str, processes: int, slots: int, threads: int, count: int) -> list:
+    """프로세스를 동시에 실행하고 (슬롯 번호, 고유키 목록, 실행시간) 목록을 반환합니다."""
+    context = multiprocessing.get_context("spawn")
+    ready = context.Semaphore(0)
+    start = context.Event()
+    queue = context.Queue()
+    workers = [
+        context.Process(target=_allocate, args=(lock_dir, slots, threads, count, ready, start, queue))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    # 모든 프로세스가 슬롯을 점유한 후 동시에 발급을 시작합니다.
+    for _ in workers:
+        ready.acquire()
+    start.set()
+    results = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return results
+
+
+def check(name: str, results: list, seen: set) -> bool:
+    """중복/형식을 확인하고 결과를 출력합니다."""
+    keys = [key for _, process_keys, _ in results for key in process_keys]
+    failed = [key for key in keys if key is None]
+    valid = [key for key in keys if key is not None]
+    duplicated = len(valid) - len(set(valid)) + len(seen & set(valid))
+    malformed = [key for key in valid if not re.fullmatch(r"\d{16}", key)]
+    seen.update(valid)
+    elapsed = max(result[2] for result in results)
+    fallback = sum(1 for slot, _, _ in results if slot < 0)
+    print(f"[{name}] 프로세스 {len(results)} (DB 발급 {fallback}), 고유키 {len(keys)}, "
+          f"중복 {duplicated}, 형식 오류 {len(malformed)}, 실패 {len(failed)}, "
+          f"{elapsed:.2f}초 ({len(keys) / elapsed:,.0f}건/초)")
+    return not (duplicated or malformed or failed)
+
+
+def run_restart(lock_dir: str, slots: int, count: int) -> list:
+    """같은 프로세스에서 슬롯을 점유한 발급기를 종료하고 다시 점유하여 발급합니다.
+    - 첫번째 발급기는 같은 초에 발급할 수 있는 수를 넘겨 다음 초들을 미리 사용합니다.
+    """
+    from lib.unique_id import UniqueIdAllocator
+
+    results = []
+    for _ in range(2):
+        allocator = UniqueIdAllocator(slots=slots)
+        allocator.lock_dir = lock_dir
+        slot = allocator.slot
+        started = time.perf_counter()
+        keys = [allocator.allocate("127.0.0.1") for _ in range(count)]
+        results.append((slot, keys, time.perf_counter() - started))
+        allocator._slot_lock.release()  # 프로세스 종료
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=9, help="프로세스 수")
+    parser.add_argument("--threads", type=int, default=4, help="프로세스별 스레드 수")
+    parser.add_argument("--count", type=int, default=50, help="스레드별 발급 수")
+    parser.add_argument("--slots", type=int, default=8, help="슬롯 수 (UNIQUE_ID_WORKER_SLOTS)")
+    args = parser.parse_args()
+
+    lock_dir = tempfile.mkdtemp(prefix="uniqid_")
+    seen = set()
+    try:
+        ok = check("동시 발급", run_processes(
+            lock_dir, args.processes, args.slots, args.threads, args.count), seen)
+        # 이전 프로세스가 미리 사용한 시간이 지나기 전에 같은 슬롯으로 다시 발급
+        ok = check("재시작", run_restart(lock_dir, args.slots, args.threads * args.count), set()) and ok
+    finally:
+        shutil.rmtree(lock_dir, ignore_errors=True)
+
+    print("성공" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""게시판 검색 필터(lib/board_lib.py write_search_filter) 벤치마크
+
+게시글/댓글 100만건 게시판에서 검색 목록(게시글 수 + 첫 페이지)을 조회하는 시간을 측정합니다.
+- 이전 방식: 댓글 검색시 검색된 댓글 전체를 조회한 후 wr_parent 목록으로 IN 조건을 만듭니다.
+- 현재 방식: 검색된 댓글의 wr_parent를 서브쿼리(IN (SELECT ...))로 조회합니다.
+- 게시글 검색(댓글 검색이 아닌 경우)은 두 방식의 쿼리가 같으므로 비교 기준으로 출력합니다.
+
+실행 방법 (프로젝트 루트에서, 임시 SQLite 파일에 게시판 테이블을 생성합니다.)
+    python -m benchmarks.write_search_bench --rows 1000000
+
+결과 예시 (1 vCPU, Python 3.11, SQLite, 게시글 25만 + 댓글 75만건)
+    게시판 테이블 생성: 1,000,000건 (25.2초)
+    게시글 수 + 첫 페이지
+      [게시글 제목 "common"] 이전 255.4 ms / 현재 242.7 ms (결과 같음)
+      [게시글 제목+내용 "common"] 이전 320.8 ms / 현재 335.0 ms (결과 같음)
+      [댓글 내용 (드문 단어) "needle"] 이전 288.6 ms / 현재 591.5 ms (결과 같음)
+      [댓글 내용 (흔한 단어) "word0"] 이전 722.3 ms / 현재 1232.5 ms (결과 같음)
+    첫 페이지 (게시글 수 캐시)
+      [게시글 제목 "common"] 이전 11.8 ms / 현재 11.6 ms (결과 같음)
+      [게시글 제목+내용 "common"] 이전 8.0 ms / 현재 7.5 ms (결과 같음)
+      [댓글 내용 (드문 단어) "needle"] 이전 290.5 ms / 현재 304.7 ms (결과 같음)
+      [댓글 내용 (흔한 단어) "word0"] 이전 677.7 ms / 현재 596.9 ms (결과 같음)
+- 댓글 검색의 게시글 수를 처음 조회할 때는 서브쿼리가 게시글 수 쿼리와 목록 쿼리에서
+  각각 실행되므로 이전 방식보다 느립니다. 게시글 수는 BoardCountService가 캐시하므로
+  이후 페이지는 비슷하며, 검색된 댓글 전체를 메모리로 조회하지 않습니다.
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from core.models import WriteBaseModel  # noqa: E402
+from lib.board_lib import write_search_filter  # noqa: E402
+from lib.common import dynamic_create_write_table  # noqa: E402
+
+PAGE_ROWS = 15
+VOCABULARY = [f"word{index}" for index in range(5000)]
+
+
+def populate(engine, model: WriteBaseModel, rows: int, comment_ratio: float, seed: int = 1) -> None:
+    """게시글/댓글을 생성합니다.
+    - 댓글의 0.1%에 "needle", 게시글의 1%에 "common" 단어를 넣습니다.
+    """
+    model.__table__.create(bind=engine)
+    table = model.__table__
+    defaults = {
+        column.name: column.default.arg if column.default is not None and not callable(column.default.arg) else None
+        for column in table.columns
+    }
+    defaults.update(wr_datetime=datetime.now(), wr_option="html1")
+    columns = [name for name in defaults if name != "wr_id"]
+
+    rnd = random.Random(seed)
+    posts = max(int(rows * (1 - comment_ratio)), 1)
+
+    def text(words: int, marker: str = "") -> str:
+        values = rnd.choices(VOCABULARY, k=words)
+        if marker:
+            values.insert(rnd.randrange(len(values) + 1), marker)
+        return " ".join(values)
+
+    def generate():
+        for wr_id in range(1, rows + 1):
+            row = dict(defaults)
+            if wr_id <= posts:
+                row.update(wr_num=-wr_id, wr_parent=wr_id, wr_is_comment=0,
+                           wr_subject=text(6, "common" if rnd.random() < 0.01 else ""),
+                           wr_content=text(40, "common" if rnd.random() < 0.01 else ""))
+            else:
+                parent = rnd.randint(1, posts)
+                row.update(wr_num=-parent, wr_parent=parent, wr_is_comment=1,
+                           wr_content=text(15, "needle" if rnd.random() < 0.001 else ""))
+            yield tuple(row[name] for name in columns)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.executemany(
+            f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            generate())
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def legacy_search_filter(db: Session, model: WriteBaseModel, search_field: str, keyword: str):
+    """이전 방식의 댓글 검색 필터 (검색된 댓글 전체를 조회하여 IN 목록 생성)"""
+    query = write_search_filter(model, search_field=search_field.split(",")[0], keyword=keyword)
+    if search_field.endswith(",0"):
+        query = query.where(model.wr_is_comment == 1)
+        parents = db.scalars(query.add_columns(model)).all()
+        query = select().where(model.wr_id.in_([row.wr_parent for row in parents]))
+    return query
+
+
+def list_page(db: Session, model: WriteBaseModel, query, with_count: bool = True) -> tuple:
+    """검색 목록의 게시글 수와 첫 페이지를 조회합니다.
+    - with_count가 False 이면 게시글 수를 조회하지 않습니다. (BoardCountService 캐시 사용시)
+    """
+    count = db.scalar(query.add_columns(func.count()).order_by(None)) if with_count else None
+    writes = db.scalars(
+        query.add_columns(model).order_by(model.wr_num, model.wr_reply).limit(PAGE_ROWS)
+    ).all()
+    return count, [write.wr_id for write in writes]
+
+
+def measure(db: Session, model: WriteBaseModel, search_field: str, keyword: str, repeat: int,
+            with_count: bool = True) -> tuple:
+    """이전/현재 방식의 평균 조회 시간(초)과 결과를 반환합니다."""
+    timings = []
+    results = []
+    for build in (
+        lambda: legacy_search_filter(db, model, search_field, keyword),
+        lambda: write_search_filter(model, search_field=search_field, keyword=keyword),
+    ):
+        list_page(db, model, build(), with_count)  # 준비 실행 (캐시)
+        db.expunge_all()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            result = list_page(db, model, build(), with_count)
+            db.expunge_all()
+        timings.append((time.perf_counter() - started) / repeat)
+        results.append(result)
+    return timings, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000, help="게시글 + 댓글 수")
+    parser.add_argument("--comment-ratio", type=float, default=0.75, help="댓글 비율")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="write_search_")
+    engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+    model = dynamic_create_write_table("bench_search")
+    try:
+        started = time.perf_counter()
+        populate(engine, model, args.rows, args.comment_ratio)
+        print(f"게시판 테이블 생성: {args.rows:,}건 ({time.perf_counter() - started:.1f}초)")
+
+        cases = [
+            ("게시글 제목", "wr_subject", "common"),
+            ("게시글 제목+내용", "wr_subject||wr_content", "common"),
+            ("댓글 내용 (드문 단어)", "wr_content,0", "needle"),
+            ("댓글 내용 (흔한 단어)", "wr_content,0", VOCABULARY[0]),
+        ]
+        with Session(engine) as db:
+            for with_count, title in ((True, "게시글 수 + 첫 페이지"), (False, "첫 페이지 (게시글 수 캐시)")):
+                print(title)
+                for name, search_field, keyword in cases:
+                    (legacy, current), (legacy_result, current_result) = measure(
+                        db, model, search_field, keyword, args.repeat, with_count)
+                    same = "같음" if legacy_result == current_result else "다름"
+                    print(f"  [{name} \"{keyword}\"] 이전 {legacy * 1000:.1f} ms / 현재 {current * 1000:.1f} ms "
+                          f"(결과 {same})")
+    finally:
+        engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, TypeVar
 
 from fastapi import Depends
 from sqlalchemy import create_engine
@@ -6,6 +6,7 @@ from sqlalchemy.engine import Engine, URL
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
 from typing_extensions import Annotated
 
 from core.settings import settings
@@ -182,3 +183,54 @@ async def get_db() -> AsyncGenerator[Session, None]:
 
 # Annotated를 사용하여 의존성 주입
 db_session = Annotated[Session, Depends(get_db)]
+
+
+T = TypeVar("T")
+
+
+class ThreadedSession:
+    """동기 세션을 스레드풀에서 실행하는 세션
+    - run_sync()의 함수를 동기 세션으로 스레드풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    async def __aenter__(self) -> "ThreadedSession":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def run_sync(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+def threaded_session() -> ThreadedSession:
+    """동기 세션을 스레드풀에서 실행하는 세션을 생성합니다.
+    - run_sync()의 함수 전체가 스레드풀에서 실행되므로 이벤트 루프를 막지 않습니다.
+    - 기존 서비스(동기 Session 사용)는 run_sync()로 실행합니다.
+        await db.run_sync(lambda session: Service(request, session).get_something())
+    """
+    return ThreadedSession(DBConnect().sessionLocal())
+
+
+# 화면 출력용 데이터베이스 세션을 가져오는 의존성 함수 (항상 스레드풀에서 실행)
+async def get_threaded_db() -> AsyncGenerator[ThreadedSession, None]:
+    db = threaded_session()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+threaded_db_session = Annotated[ThreadedSession, Depends(get_threaded_db)]
@@ -7,7 +7,7 @@ from fastapi import Form
 
 from core.exception import AlertException
 from lib.member import set_zip_code
-from lib.pbkdf2 import create_hash
+from lib.password_hasher import password_hasher
 
 @dataclass
 class ConfigForm:
@@ -226,7 +226,7 @@ class AdminMemberForm(MemberForm):
 
         # 비밀번호 암호화
         if self.mb_password:
-            self.mb_password = create_hash(self.mb_password)
+            self.mb_password = password_hasher.hash(self.mb_password)
         else:
             del self.mb_password
 
@@ -265,7 +265,7 @@ class RegisterMemberForm(MemberForm):
             raise AlertException("이메일을 입력해 주세요.", 400)
 
         # 비밀번호 암호화
-        self.mb_password = create_hash(self.mb_password)
+        self.mb_password = password_hasher.hash(self.mb_password)
 
         del self.mb_password_re
 
@@ -287,7 +287,7 @@ class UpdateMemberForm(MemberForm):
 
             if self.mb_password != self.mb_password_re:
                 raise AlertException("비밀번호와 비밀번호 확인이 일치하지 않습니다.", 400)
-            self.mb_password = create_hash(self.mb_password)
+            self.mb_password = password_hasher.hash(self.mb_password)
         else:
             del self.mb_password
 
@@ -1,10 +1,18 @@
 """애플리케이션에 사용되는 미들웨어를 정의합니다."""
-from user_agents import parse
+import json
+import logging
+import re
+import secrets
+import time
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from core.plugin import (
     register_plugin_admin_menu, get_plugin_state_change_time,
@@ -12,6 +20,8 @@ from core.plugin import (
     unregister_plugin, delete_router_by_tagname
 )
 from core.settings import settings, cors_config
+from lib.session_store import SESSION_MAX_AGE, SessionStore, session_store
+from lib.user_agent import user_agent_cache
 
 
 def regist_core_middleware(app: FastAPI) -> None:
@@ -48,15 +58,17 @@ def regist_core_middleware(app: FastAPI) -> None:
         request.state.is_responsive = settings.IS_RESPONSIVE
 
         # 반응형이라면 PC/모바일 버전 설정 세션을 초기화합니다.
+        # (설정 세션이 없는 방문자의 세션은 새로 만들지 않습니다.)
         if request.state.is_responsive:
-            request.session["is_mobile"] = False
+            request.session.pop("is_mobile", None)
         else:
             # 사용자가 설정한 PC/모바일 버전 설정 세션을 확인합니다.
             if request.session.get("is_mobile"):
                 request.state.is_mobile = request.session.get("is_mobile", False)
             else:
                 # User-Agent 헤더를 통해 모바일 여부를 판단합니다. (모바일과 태블릿 접속)
-                user_agent = parse(request.headers.get("User-Agent", ""))
+                # - 같은 User-Agent의 분석 결과는 캐시에서 재사용합니다.
+                user_agent = user_agent_cache.classify(request.headers.get("User-Agent", ""))
                 if user_agent.is_mobile or user_agent.is_tablet:
                     request.state.is_mobile = True
 
@@ -69,11 +81,19 @@ def regist_core_middleware(app: FastAPI) -> None:
         return await call_next(request)
 
     # 세션 미들웨어를 추가합니다.
-    # .env 파일의 설정을 통해 secret_key, session_cookie를 설정할 수 있습니다.
-    app.add_middleware(SessionMiddleware,
-                       secret_key=settings.SESSION_SECRET_KEY,
-                       session_cookie=settings.SESSION_COOKIE_NAME,
-                       max_age=60 * 60 * 3)
+    # .env 파일의 SESSION_BACKEND 설정으로 세션 저장소를 선택합니다.
+    # - cookie: 서명된 쿠키에 저장 (secret_key, session_cookie 설정 사용)
+    # - memory, sqlite, redis: 서버에 저장하고 쿠키에는 세션 아이디만 저장
+    if session_store is None:
+        app.add_middleware(SessionMiddleware,
+                           secret_key=settings.SESSION_SECRET_KEY,
+                           session_cookie=settings.SESSION_COOKIE_NAME,
+                           max_age=SESSION_MAX_AGE)
+    else:
+        app.add_middleware(ServerSessionMiddleware,
+                           store=session_store,
+                           session_cookie=settings.SESSION_COOKIE_NAME,
+                           max_age=SESSION_MAX_AGE)
 
     # 클라이언트가 사용할 프로토콜을 결정하는 미들웨어를 추가합니다.
     app.add_middleware(BaseSchemeMiddleware)
@@ -117,3 +137,108 @@ class BaseSchemeMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         request.scope["scheme"] = request.headers.get("X-Forwarded-Proto", "http")
         return await call_next(request)
+
+
+class ServerSession(dict):
+    """서버 세션 데이터
+    - clear() 를 호출하거나(로그아웃 등) 로그인 회원(ss_mb_id)이 바뀌면
+      응답할 때 세션 아이디를 새로 발급합니다. (세션 고정 공격 방지)
+    """
+    regenerate = False
+
+    def clear(self) -> None:
+        self.regenerate = True
+        super().clear()
+
+
+class ServerSessionMiddleware:
+    """세션 데이터를 서버 저장소에 보관하고, 쿠키에는 세션 아이디만 저장하는 미들웨어
+
+    - 세션 데이터가 변경된 경우에만 저장소에 저장하고 쿠키를 발급합니다.
+    - 변경되지 않은 세션은 남은 보관시간이 절반 이하일 때만 보관시간을 연장합니다.
+    - 로그인 회원이 바뀐 경우(로그인, 로그아웃) 기존 세션을 삭제하고 세션 아이디를 새로 발급합니다.
+    """
+    # 값이 바뀌면 세션 아이디를 새로 발급하는 세션 키
+    login_session_key = "ss_mb_id"
+    session_id_pattern = re.compile(r"^[A-Za-z0-9_-]{43}$")
+
+    def __init__(self, app: ASGIApp, store: SessionStore,
+                 session_cookie: str = "session", max_age: int = 60 * 60 * 3,
+                 path: str = "/", same_site: str = "lax", https_only: bool = False) -> None:
+        self.app = app
+        self.store = store
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.security_flags = "httponly; samesite=" + same_site
+        if https_only:
+            self.security_flags += "; secure"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        cookie_value = connection.cookies.get(self.session_cookie)
+        session_id = None
+        data, expires = {}, 0.0
+        if cookie_value and self.session_id_pattern.match(cookie_value):
+            try:
+                record = await self._call(self.store.load, cookie_value)
+            except Exception as e:
+                logging.error("세션 조회 실패", exc_info=e)
+                record = None
+            if record:
+                session_id = cookie_value
+                data, expires = record
+
+        session = ServerSession(data)
+        scope["session"] = session
+        initial_payload = json.dumps(data)
+        initial_login = data.get(self.login_session_key)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if session.get(self.login_session_key) != initial_login:
+                    session.regenerate = True
+                cookie = await self._commit(session, session_id, initial_payload, expires,
+                                            had_cookie=bool(cookie_value))
+                if cookie:
+                    MutableHeaders(scope=message).append("Set-Cookie", cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _commit(self, session: ServerSession, session_id: str,
+                      initial_payload: str, expires: float, had_cookie: bool) -> str:
+        """세션을 저장/삭제하고 발급할 쿠키 헤더 값을 반환합니다. (발급하지 않으면 빈 문자열)"""
+        try:
+            if session_id and session.regenerate:
+                await self._call(self.store.delete, session_id)
+                session_id = None
+
+            if not session:
+                if session_id:
+                    await self._call(self.store.delete, session_id)
+                return self._cookie("null", 0) if had_cookie else ""
+
+            if session_id is None or json.dumps(session) != initial_payload:
+                session_id = session_id or secrets.token_urlsafe(32)
+            elif expires - time.time() > self.max_age / 2:
+                return ""
+            await self._call(self.store.save, session_id, dict(session), self.max_age)
+            return self._cookie(session_id, self.max_age)
+        except Exception as e:
+            logging.error("세션 저장 실패", exc_info=e)
+            return ""
+
+    def _cookie(self, value: str, max_age: int) -> str:
+        expires = "expires=Thu, 01 Jan 1970 00:00:00 GMT; " if not max_age else ""
+        return (f"{self.session_cookie}={value}; path={self.path}; "
+                f"{expires}Max-Age={max_age}; {self.security_flags}")
+
+    async def _call(self, func, *args):
+        if self.store.blocking:
+            return await run_in_threadpool(func, *args)
+        return func(*args)
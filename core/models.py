@@ -568,6 +568,31 @@ class VisitSum(Base):
     vs_count = Column(Integer, nullable=False, default=0)
 
 
+class VisitHourSum(Base):
+    """
+    시간별 방문자 수 집계 테이블
+    - 방문자 이력(visit)을 날짜, 시간 단위로 미리 집계합니다. (lib/visit_rollup.py)
+    """
+    __tablename__ = DB_TABLE_PREFIX + "visit_hour_sum"
+
+    vh_date = Column(Date, primary_key=True, nullable=False)
+    vh_hour = Column(Integer, primary_key=True, nullable=False, default=0)  # 0 ~ 23
+    vh_count = Column(Integer, nullable=False, default=0)
+
+
+class VisitDimensionSum(Base):
+    """
+    항목별 방문자 수 집계 테이블
+    - 방문자 이력(visit)을 날짜, 항목(브라우저, OS, 접속기기, 접속경로) 단위로 미리 집계합니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "visit_dimension_sum"
+
+    vd_date = Column(Date, primary_key=True, nullable=False)
+    vd_type = Column(String(20), primary_key=True, nullable=False, default="")  # browser, os, device, referer
+    vd_value = Column(String(255), primary_key=True, nullable=False, default="")
+    vd_count = Column(Integer, nullable=False, default=0)
+
+
 class QaConfig(Base):
     """
     Q&A 설정 테이블
@@ -925,6 +950,21 @@ class BoardFile(Base):
     bf_datetime = Column(DateTime, nullable=False, default=func.now())
 
 
+class BoardThumbnail(Base):
+    """
+    게시글 목록 썸네일 정보 테이블
+    - 게시글의 썸네일 원본 이미지와 생성된 썸네일 크기 목록을 기록합니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + 'board_thumbnail'
+
+    bo_table = Column(String(20), primary_key=True, nullable=False, default='')
+    wr_id = Column(Integer, primary_key=True, nullable=False, default=0)
+    th_source = Column(String(255), nullable=False, default='')  # 원본 이미지 경로 (없으면 '')
+    th_alt = Column(String(255), nullable=False, default='')
+    th_variants = Column(String(255), nullable=False, default='')  # 생성된 크기 목록 (예: 200x150,125x100)
+    th_datetime = Column(DateTime, nullable=False, default=func.now())
+
+
 class MemberSocialProfiles(Base):
     """
     회원 소셜 프로필 테이블
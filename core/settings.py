@@ -34,6 +34,17 @@ class Settings(BaseSettings):
 
     SESSION_COOKIE_NAME: str = "session"  # 세션 쿠키 이름
     SESSION_SECRET_KEY: str = ""  # 세션 비밀키
+    SESSION_BACKEND: str = "cookie"  # 세션 저장소 (cookie, memory, sqlite, redis)
+    SESSION_REDIS_URL: str = "redis://localhost:6379/0"  # 세션 저장소 접속 URL (redis)
+
+    # 비밀번호 암호화 설정
+    PASSWORD_HASH_ITERATIONS: int = 12000  # 암호화 반복 횟수 (낮은 비밀번호는 로그인할 때 다시 암호화)
+    PASSWORD_HASH_WORKERS: int = 4  # 비밀번호 검증 스레드 수
+
+    # 회원 정보 캐시 설정 (로그인 세션/JWT 인증)
+    MEMBER_CACHE_TTL: int = 10  # 보관시간 (초, 0: 사용안함)
+    MEMBER_CACHE_SIZE: int = 10000  # 보관할 회원 수 (worker별)
+    MEMBER_CACHE_NEGATIVE: bool = True  # 존재하지 않는 회원아이디 보관
 
     # SMTP 설정
     SMTP_SERVER: str = "localhost"
@@ -50,9 +61,37 @@ class Settings(BaseSettings):
     UPLOAD_IMAGE_RESIZE_HEIGHT: int = 2800  # 이미지 리사이즈 높이 (px)
     UPLOAD_IMAGE_QUALITY: int = 80  # 이미지 품질 (0~100)
 
+    # 이미지 처리(섬네일, 에디터 이미지) 프로세스 풀 설정
+    IMAGE_PROCESS_WORKERS: int = 0  # 프로세스 수 (0: CPU 수)
+    IMAGE_PROCESS_MAX_PENDING: int = 64  # 동시에 처리/대기할 수 있는 작업 수
+    IMAGE_PROCESS_TIMEOUT: int = 30  # 작업 대기 및 처리 제한시간 (초)
+
     USE_API: bool = True  # API 사용
     USE_TEMPLATE: bool = True  # 템플릿 사용
 
+    # 방문자 접속 이력 저장 설정 (메모리에 모아서 한번에 저장)
+    VISIT_FLUSH_SIZE: int = 100  # 저장할 접속 이력 건수
+    VISIT_FLUSH_INTERVAL: int = 5  # 저장 간격 (초)
+
+    USER_AGENT_CACHE_SIZE: int = 4096  # User-Agent 분석 결과 캐시 크기 (worker별)
+
+    CURRENT_CONNECT_SYNC_INTERVAL: int = 5  # 현재 접속자 테이블 저장 간격 (초)
+
+    # 레이아웃 데이터(메뉴, 최신 설문조사, 인기검색어) 캐시 설정
+    LAYOUT_CACHE_TTL: int = 600  # 최대 보관시간 (초)
+    LAYOUT_CACHE_SHARED: bool = True  # worker 간 캐시 무효화 (버전 파일 사용)
+
+    # 고유키 발급 설정
+    UNIQUE_ID_WORKER_SLOTS: int = 10  # 고유키 슬롯 수 (worker 수 이상)
+    UNIQUE_ID_AUDIT: bool = False  # 발급한 고유키를 고유키 테이블에 기록
+
+    USE_FULLTEXT_SEARCH: bool = False  # 게시판 전문검색(Full-Text Search) 색인 사용
+
+    # 최신글 등 화면 조각 캐시 설정
+    FRAGMENT_CACHE_MEMORY_SIZE: int = 8  # worker별 메모리 캐시 용량 (MB)
+    FRAGMENT_CACHE_TTL: int = 600  # 캐시 보관시간 (초)
+    FRAGMENT_CACHE_SHARED: bool = True  # worker 간 공유 캐시(SQLite 파일) 사용
+
     # CORS 설정
     CORS_ALLOW_ORIGINS: str = "*"
     CORS_ALLOW_CREDENTIALS: bool = False
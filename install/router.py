@@ -30,8 +30,9 @@ from install.default_values import (
     default_group, default_member, default_qa_config, default_version
 )
 from lib.common import dynamic_create_write_table, read_license
+from lib.config_cache import config_cache
 from lib.dependency.dependencies import validate_install, validate_token
-from lib.pbkdf2 import create_hash
+from lib.password_hasher import password_hasher
 
 
 INSTALL_TEMPLATES = "install/templates"
@@ -211,6 +212,7 @@ async def install_process():
                 board_group_setup(db)
                 board_setup(db)
                 db.commit()
+                config_cache.invalidate()
                 yield "기본설정 정보 입력 완료"
 
             for board in default_boards:
@@ -254,14 +256,14 @@ def admin_member_setup(db: Session, admin_id: str, admin_name : str,
         select(Member).where(Member.mb_id == admin_id)
     )
     if admin_member:
-        admin_member.mb_password = create_hash(admin_password)
+        admin_member.mb_password = password_hasher.hash(admin_password)
         admin_member.mb_name = admin_name
         admin_member.mb_email = admin_email
     else:
         db.execute(
             insert(Member).values(
                 mb_id=admin_id,
-                mb_password=create_hash(admin_password),
+                mb_password=password_hasher.hash(admin_password),
                 mb_name=admin_name,
                 mb_nick=admin_name,
                 mb_email=admin_email,
@@ -1,10 +1,11 @@
 """게시판/게시글 함수 모음"""
-import os
+import base64
+import json
 import re
 from datetime import datetime, timedelta
 
 import bleach
-from typing import List
+from typing import Dict, List
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import and_, asc, desc, func, insert, or_, select
@@ -13,12 +14,18 @@ from sqlalchemy.orm import Session
 
 from core.database import DBConnect
 from core.exception import AlertException
-from core.models import Board, BoardNew, Member, WriteBaseModel
+from core.models import Board, BoardFile, BoardNew, BoardThumbnail, Member, WriteBaseModel
 from core.template import TemplateService, UserTemplates
 from lib.common import (
-    FileCache, StringEncrypt, cut_name, dynamic_create_write_table, get_admin_email,
-    get_admin_email_name, get_editor_image, thumbnail
+    StringEncrypt, cut_name, dynamic_create_write_table, get_admin_email,
+    get_admin_email_name, thumbnail
 )
+from lib.board_thumbnail import (
+    DUMMY_IMAGE, DUMMY_THUMBNAIL_PATH, get_dummy_result, get_image_files, get_thumbnail_path,
+    get_thumbnail_records, parse_variants, schedule_thumbnails, select_thumbnail_source
+)
+from lib.fragment_cache import latest_cache
+from lib.fulltext import get_fulltext_backend
 from lib.mail import mailer
 from lib.member import MemberDetails
 from service.board_file_service import BoardFileService as FileService
@@ -228,6 +235,27 @@ class BoardConfig():
             return []
         return self.board.bo_notice.split(",")
 
+    def get_list_sort_fields(self, model: WriteBaseModel) -> List[tuple]:
+        """게시글 목록의 정렬 필드 목록을 반환.
+
+        Args:
+            model (WriteBaseModel): 게시글 모델
+
+        Returns:
+            List[tuple]: (필드명, 내림차순 여부) 목록
+        """
+        if not self.board.bo_sort_field:
+            return [("wr_num", False), ("wr_reply", False)]
+
+        sort_fields = []
+        for field in self.board.bo_sort_field.split(","):
+            field_parts = field.strip().split(" ")
+            if not hasattr(model, field_parts[0]):
+                continue
+            is_desc = len(field_parts) > 1 and field_parts[1].lower() != "asc"
+            sort_fields.append((field_parts[0], is_desc))
+        return sort_fields
+
     def get_list_sort_query(self, model: WriteBaseModel, query: Select) -> Select:
         """게시글 목록의 정렬을 포함한 query를 반환.
 
@@ -237,17 +265,9 @@ class BoardConfig():
         Returns:
             Select: 게시글 목록 쿼리
         """
-        if self.board.bo_sort_field:
-            sort_fields = self.board.bo_sort_field.split(",")
-            for field in sort_fields:
-                field_parts = field.strip().split(" ")
-                sort_field = getattr(model, field_parts[0])
-                if not sort_field:
-                    continue
-                sort_order = asc(sort_field) if len(field_parts) == 1 or field_parts[1].lower() == "asc" else desc(sort_field)
-                query = query.order_by(sort_order)
-        else:
-            query = query.order_by(model.wr_num, model.wr_reply)
+        for field, is_desc in self.get_list_sort_fields(model):
+            sort_field = getattr(model, field)
+            query = query.order_by(desc(sort_field) if is_desc else asc(sort_field))
 
         return query
 
@@ -486,50 +506,107 @@ def write_search_filter(
     Returns:
         Select: 필터가 적용된 쿼리.
     """
-    with DBConnect().sessionLocal() as db:
-        fields = []
-        is_comment = False
-
-        query = select()
-        # 분류
-        if category:
-            query = query.where(model.ca_name == category)
-
-        # 검색 필드 및 단어 설정
-        # 검색어를 단어로 분리하여 operator에 따라 필터를 생성
-        word_filters = []
-        words = keyword.split(" ")
-        if search_field:
-            # search_field는 {필드명},{코멘트여부} 형식으로 전달됨 (0:댓글, 1:게시글)
-            tmp = search_field.split(",")
-            fields = tmp[0].split("||")
-            is_comment = (tmp[1] == "0") if len(tmp) > 1 else False
-
-            # 패스워드 필드 제거
-            if "wr_password" in fields:
-                fields.remove("wr_password")
-
-            # 필드검색 필터 생성 (or 조건)
-            for word in words:
-                if not word.strip():
-                    continue
-                word_filters.append(or_(
-                    *[getattr(model, field).like(f"%{word}%") for field in fields if hasattr(model, field)]))
-
-        # 분리된 단어 별 검색필터에 or 또는 and를 적용
-        if operator == "and":
-            query = query.where(and_(*word_filters))
-        else:
-            query = query.where(or_(*word_filters))
+    fields = []
+    is_comment = False
+
+    query = select()
+    # 분류
+    if category:
+        query = query.where(model.ca_name == category)
+
+    # 검색 필드 및 단어 설정
+    # 검색어를 단어로 분리하여 operator에 따라 필터를 생성
+    word_filters = []
+    words = keyword.split(" ")
+    fulltext_backend = get_fulltext_backend()
+    if search_field:
+        # search_field는 {필드명},{코멘트여부} 형식으로 전달됨 (0:댓글, 1:게시글)
+        tmp = search_field.split(",")
+        fields = tmp[0].split("||")
+        is_comment = (tmp[1] == "0") if len(tmp) > 1 else False
+
+        # 패스워드 필드 제거
+        if "wr_password" in fields:
+            fields.remove("wr_password")
+
+        # 필드검색 필터 생성 (or 조건)
+        for word in words:
+            if not word.strip():
+                continue
+            word_filter = or_(
+                *[getattr(model, field).like(f"%{word}%") for field in fields if hasattr(model, field)])
+            # 전문검색 색인으로 후보 게시글을 먼저 찾고, LIKE 조건으로 확인합니다.
+            if fulltext_backend:
+                match_clause = fulltext_backend.match_clause(model, fields, word)
+                if match_clause is not None:
+                    word_filter = and_(match_clause, word_filter)
+            word_filters.append(word_filter)
+
+    # 분리된 단어 별 검색필터에 or 또는 and를 적용
+    if operator == "and":
+        query = query.where(and_(*word_filters))
+    else:
+        query = query.where(or_(*word_filters))
 
-        # 댓글 검색
-        if is_comment:
-            query = query.where(model.wr_is_comment == 1)
-            # 원글만 조회해야하므로, wr_parent 목록을 가져와서 in조건으로 재필터링
-            parents = db.scalars(query.add_columns(model)).all()
-            query = select().where(model.wr_id.in_([row.wr_parent for row in parents]))
+    # 댓글 검색
+    if is_comment:
+        query = query.where(model.wr_is_comment == 1)
+        # 원글만 조회해야하므로, 검색된 댓글의 wr_parent 서브쿼리로 재필터링
+        # correlate(None): 같은 테이블을 조회하는 서브쿼리가 바깥 쿼리에 연관되지 않도록 합니다.
+        parent_query = query.add_columns(model.wr_parent).correlate(None)
+        query = select().where(model.wr_id.in_(parent_query))
 
-        return query
+    return query
+
+
+def encode_list_cursor(write: WriteBaseModel, direction: str, offset: int) -> str:
+    """게시글 목록의 커서(seek) 페이징에 사용할 커서 문자열을 생성합니다.
+    - 커서는 (wr_num, wr_reply) 정렬 기준값과 이동 방향, 목록 번호 계산용 offset을 담고 있습니다.
+
+    Args:
+        write (WriteBaseModel): 기준 게시글
+        direction (str): 이동 방향 (next: 다음, prev: 이전)
+        offset (int): 이동할 페이지의 첫번째 게시글 위치
+
+    Returns:
+        str: URL에 사용할 수 있는 커서 문자열
+    """
+    data = {"n": write.wr_num, "r": write.wr_reply, "d": direction, "o": max(offset, 0)}
+    encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
+
+def decode_list_cursor(cursor: str) -> dict:
+    """커서 문자열을 해석합니다.
+
+    Args:
+        cursor (str): encode_list_cursor()로 생성한 커서 문자열. 빈 문자열이면 첫 페이지
+
+    Raises:
+        ValueError: 올바르지 않은 커서
+
+    Returns:
+        dict: wr_num, wr_reply, direction, offset. 첫 페이지이면 빈 dict
+    """
+    if not cursor:
+        return {}
+
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        result = {
+            "wr_num": int(data["n"]),
+            "wr_reply": str(data["r"]),
+            "direction": data["d"],
+            "offset": max(int(data["o"]), 0),
+        }
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("올바르지 않은 커서입니다.") from e
+
+    if result["direction"] not in ("next", "prev"):
+        raise ValueError("올바르지 않은 커서입니다.")
+
+    return result
 
 
 def get_next_num(bo_table: str) -> int:
@@ -547,7 +624,8 @@ def get_next_num(bo_table: str) -> int:
         db.close()
 
 
-def get_list(request: Request, db: Session, write: WriteBaseModel, board_config: BoardConfig, subject_len: int = 0):
+def get_list(request: Request, db: Session, write: WriteBaseModel, board_config: BoardConfig,
+             subject_len: int = 0, file_exists: bool = None):
     """게시글 목록의 출력에 필요한 정보를 추가합니다.
     - 그누보드5의 get_list와 동일한 기능을 합니다.
 
@@ -556,11 +634,12 @@ def get_list(request: Request, db: Session, write: WriteBaseModel, board_config:
         write (WriteBaseModel): 게시글 객체.
         board (Board): 게시판 객체.
         subject_len (int, optional): 게시글 제목 길이. Defaults to 0.
+        file_exists (bool, optional): 첨부파일 존재 여부.
+            미리 조회한 값이 없으면(None) 게시글마다 조회합니다. Defaults to None.
 
     Returns:
         WriteBaseModel: 게시글 목록.
     """
-    file_service = FileService(request, db)
     write.subject = board_config.cut_write_subject(write.wr_subject, subject_len)
     write.name = cut_name(request, write.wr_name)
     write.email = StringEncrypt().encrypt(write.wr_email)
@@ -570,7 +649,9 @@ def get_list(request: Request, db: Session, write: WriteBaseModel, board_config:
     write.icon_secret = "secret" in write.wr_option
     write.icon_hot = board_config.is_icon_hot(write.wr_hit)
     write.icon_new = board_config.is_icon_new(write.wr_datetime)
-    write.icon_file = file_service.is_exist(board_config.board.bo_table, write.wr_id)
+    if file_exists is None:
+        file_exists = FileService(request, db).is_exist(board_config.board.bo_table, write.wr_id)
+    write.icon_file = file_exists
     write.icon_link = write.wr_link1 or write.wr_link2
     write.icon_reply = write.wr_reply
 
@@ -727,8 +808,12 @@ def send_write_mail(request: Request, board: Board, write: WriteBaseModel, origi
             mailer(get_admin_email(request), email, subject, body, get_admin_email_name(request))
 
 
-def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, thumb_width: int, thumb_height: int, **kwargs):
-    """게시글 목록의 섬네일 이미지를 생성한다.
+def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, thumb_width: int, thumb_height: int,
+                       images: List[BoardFile] = None, records: Dict[int, BoardThumbnail] = None, **kwargs):
+    """게시글 목록의 섬네일 이미지를 반환한다.
+    - 저장된 썸네일 정보(board_thumbnail)로 경로를 만들며, 파일시스템을 조회하지 않습니다.
+    - 썸네일 정보가 없는 게시글은 백그라운드에서 생성하는 동안 기본 이미지를 반환하고,
+      요청한 크기의 썸네일이 없으면 백그라운드에서 생성하는 동안 원본 이미지를 반환합니다.
 
     Args:
         request (Request): _description_
@@ -736,54 +821,50 @@ def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, th
         write (WriteBaseModel): _description_
         thumb_width (int, optional): _description_. Defaults to 0.
         thumb_height (int, optional): _description_. Defaults to 0.
+        images (List[BoardFile], optional): 미리 조회한 게시글의 이미지 파일 목록.
+            None이면 게시글의 파일 목록을 조회합니다. Defaults to None.
+        records (Dict[int, BoardThumbnail], optional): 미리 조회한 게시글 아이디별 썸네일 정보.
+            None이면 게시글의 썸네일 정보를 조회합니다. Defaults to None.
     """
     config = request.state.config
-    with DBConnect().sessionLocal() as db:
-        service = FileService(request, db)
-        images, files = service.get_board_files_by_type(board.bo_table, write.wr_id)
-    source_file = None
-    result = {"src": "", "alt": "", "noimg":""}
-
-    if images:
-        # TODO : 게시글의 파일정보를 캐시된 데이터에서 조회한다.
-        # 업로드 파일 목록
-        source_file = images[0].bf_file
-        result["alt"] = images[0].bf_content
-    else:
-        # TODO : 게시글의 본문정보를 캐시된 데이터에서 조회한다.
-        # 게시글 본문
-        editor_images = get_editor_image(write.wr_content, view=False)
-        for image in editor_images:
-            try:
-                ext = image.split(".")[-1].lower()
-
-                # 에디터로 삽입된 이미지의 주소는 웹 경로이기에 os.path로 체크할 수 있도록 경로를 변경한다.
-                # 외부 이미지도 썸네일로 보여지기를 희망하는 경우 썸네일 조건 및 생성 로직을 수정해야한다.
-                image = "./data/editor/" + image.split("/data/editor/")[1]
-
-                # image경로의 파일이 존재하고 이미지파일인지 확인
-                if (os.path.exists(image)
-                        and os.path.isfile(image)
-                        and os.path.getsize(image) > 0
-                        and ext in config.cf_image_extension):
-                    source_file = image
-                    break
-
-            except Exception as e:
-                print(e)
-                continue
+    size = (thumb_width, thumb_height)
+
+    # 썸네일 저장 경로 등 별도 옵션을 지정한 경우에는 저장된 정보를 사용하지 않습니다.
+    if kwargs:
+        if images is None:
+            with DBConnect().sessionLocal() as db:
+                images = get_image_files(db, board.bo_table, write.wr_id, config.cf_image_extension)
+        source_file, alt = select_thumbnail_source(images, write.wr_content, config.cf_image_extension)
+        # 섬네일 생성을 기다리지 않고, 생성되는 동안 원본 이미지를 반환합니다.
+        if not source_file:
+            src = thumbnail(DUMMY_IMAGE, target_path=DUMMY_THUMBNAIL_PATH,
+                            width=thumb_width, height=thumb_height, wait=False, **kwargs)
+            return {"src": src or DUMMY_IMAGE, "alt": "", "noimg": "img_not_found"}
+        src = thumbnail(source_file, width=thumb_width, height=thumb_height, wait=False, **kwargs)
+        return {"src": src or source_file, "alt": alt, "noimg": ""}
+
+    if records is None:
+        with DBConnect().sessionLocal() as db:
+            records = get_thumbnail_records(db, board.bo_table, [write.wr_id])
+    record = records.get(write.wr_id)
+
+    if record is None:
+        # 썸네일 정보가 없는 (이전) 게시글은 백그라운드에서 생성하는 동안 기본 이미지를 반환합니다.
+        schedule_thumbnails(board.bo_table, write.wr_id, [size])
+        return get_dummy_result(thumb_width, thumb_height)
 
-    # 섬네일 생성
-    if source_file:
-        result["src"] = thumbnail(source_file, width=thumb_width, height=thumb_height, **kwargs)
     # 이미지가 없을 때
+    if not record.th_source:
+        return get_dummy_result(thumb_width, thumb_height)
+
+    if size in parse_variants(record.th_variants):
+        src = get_thumbnail_path(record.th_source, thumb_width, thumb_height)
     else:
-        result["src"] = thumbnail("./static/img/dummy-donotremove.png",
-                        target_path="./data/thumbnail_tmp",
-                        width=thumb_width, height=thumb_height, **kwargs)
-        result["noimg"] = "img_not_found"
+        # 새로운 크기의 썸네일은 백그라운드에서 생성합니다.
+        schedule_thumbnails(board.bo_table, write.wr_id, [size])
+        src = record.th_source
 
-    return result
+    return {"src": src, "alt": record.th_alt, "noimg": ""}
 
 
 # 본문의 이미지 태그에 width를 강제로 지정하는 필터함수
@@ -917,44 +998,37 @@ def render_latest_posts(request: Request, skin_name: str = 'basic', bo_table: st
     templates.env.globals["get_list_thumbnail"] = get_list_thumbnail
 
     device = request.state.device
-    file_cache = FileCache()
-    cache_filename = f"latest-{bo_table}-{device}-{skin_name}-{rows}-{subject_len}-{file_cache.get_cache_secret_key()}.html"
-    cache_file = os.path.join(file_cache.cache_dir, cache_filename)
-
-    # 캐시된 파일이 있으면 파일을 읽어서 반환
-    if os.path.exists(cache_file):
-        return file_cache.get(cache_file)
+    cache_key = f"{bo_table}-{device}-{skin_name}-{rows}-{subject_len}"
 
-    with DBConnect().sessionLocal() as db:
-        # 게시판 설정
-        board = db.get(Board, bo_table)
-        if not board:
-            return ""
-
-        board_config = BoardConfig(request, board)
-        board.subject = board_config.subject
-
-        #게시글 목록 조회
-        write_model = dynamic_create_write_table(bo_table)
-        writes = db.scalars(
-            select(write_model)
-            .where(write_model.wr_is_comment == 0)
-            .order_by(write_model.wr_num)
-            .limit(rows)
-        ).all()
-        for write in writes:
-            write = get_list(request, db, write, board_config, subject_len)
-
-    context = {
-        "request": request,
-        "board": board,
-        "writes": writes,
-        "bo_table": bo_table,
-    }
-    temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
-    temp_decode = temp.body.decode("utf-8")
-
-    # 캐시 파일 생성
-    file_cache.create(temp_decode, cache_file)
-
-    return temp_decode
+    def create_latest_posts():
+        with DBConnect().sessionLocal() as db:
+            # 게시판 설정
+            board = db.get(Board, bo_table)
+            if not board:
+                return None
+
+            board_config = BoardConfig(request, board)
+            board.subject = board_config.subject
+
+            #게시글 목록 조회
+            write_model = dynamic_create_write_table(bo_table)
+            writes = db.scalars(
+                select(write_model)
+                .where(write_model.wr_is_comment == 0)
+                .order_by(write_model.wr_num)
+                .limit(rows)
+            ).all()
+            for write in writes:
+                write = get_list(request, db, write, board_config, subject_len)
+
+        context = {
+            "request": request,
+            "board": board,
+            "writes": writes,
+            "bo_table": bo_table,
+        }
+        temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
+        return temp.body.decode("utf-8")
+
+    # 캐시(메모리 → 공유 캐시)에 없으면 생성하여 저장
+    return latest_cache.get_or_create(bo_table, cache_key, create_latest_posts)
@@ -0,0 +1,323 @@
+"""게시글 목록 썸네일 모듈
+
+게시글의 썸네일 원본 이미지와 생성된 썸네일 크기를 board_thumbnail 테이블에 기록하고,
+목록 화면에서는 기록된 정보만으로 썸네일 경로를 만들어 파일시스템을 조회하지 않습니다.
+- 게시글/첨부파일이 변경되면 commit 후 백그라운드 스레드에서 썸네일을 다시 생성합니다.
+- 기록이 없는 (이전) 게시글은 목록에서 처음 출력할 때 한번 생성하여 기록합니다.
+"""
+import os
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import delete, event, inspect, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, object_session
+
+from core.database import DBConnect
+from core.models import Board, BoardFile, BoardThumbnail, WriteBaseModel
+from lib.common import dynamic_create_write_table, get_editor_image, thumbnail
+from lib.config_cache import config_cache
+from lib.fragment_cache import latest_cache
+from lib.fulltext.base import get_bo_table
+
+Size = Tuple[int, int]
+
+DUMMY_IMAGE = "./static/img/dummy-donotremove.png"
+DUMMY_THUMBNAIL_PATH = "./data/thumbnail_tmp"
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbnail")
+# 백그라운드에서 생성중인 게시글 목록 (게시판 테이블명, 게시글 아이디)
+_pending: Set[Tuple[str, int]] = set()
+_pending_lock = threading.Lock()
+_table_ready = False
+
+# 세션의 commit 후 썸네일을 다시 생성할 게시글 목록을 보관하는 session.info 키
+_PENDING_WRITES_KEY = "thumbnail_writes"
+
+
+def ensure_thumbnail_table() -> None:
+    """썸네일 정보 테이블이 없으면 생성합니다. (업데이트 설치 대응)"""
+    global _table_ready
+    if not _table_ready:
+        BoardThumbnail.__table__.create(bind=DBConnect().engine, checkfirst=True)
+        _table_ready = True
+
+
+def get_thumbnail_path(source: str, width: int, height: int) -> str:
+    """원본 이미지의 썸네일 파일 경로 (lib.common.thumbnail과 같은 규칙)"""
+    return os.path.join(os.path.dirname(source), f"thumbnail_{width}x{height}_{os.path.basename(source)}")
+
+
+def parse_variants(variants: str) -> Set[Size]:
+    """'200x150,125x100' 형식의 크기 목록을 변환합니다."""
+    sizes = set()
+    for variant in filter(None, (variants or "").split(",")):
+        width, _, height = variant.partition("x")
+        if width.isdigit() and height.isdigit():
+            sizes.add((int(width), int(height)))
+    return sizes
+
+
+def format_variants(sizes: Iterable[Size]) -> str:
+    return ",".join(f"{width}x{height}" for width, height in sorted(sizes))
+
+
+# 생성된 기본 이미지 썸네일 경로 (크기별)
+_dummy_thumbnails: Dict[Size, str] = {}
+
+
+def get_dummy_thumbnail(width: int, height: int) -> str:
+    """이미지가 없는 게시글의 썸네일 (크기별로 한번만 생성)
+    - 요청 처리 중 생성을 기다리지 않고, 생성되는 동안 기본 이미지를 반환합니다.
+    """
+    src = _dummy_thumbnails.get((width, height))
+    if src is None:
+        src = thumbnail(DUMMY_IMAGE, target_path=DUMMY_THUMBNAIL_PATH, width=width, height=height, wait=False)
+        if not src:
+            return DUMMY_IMAGE
+        _dummy_thumbnails[(width, height)] = src
+    return src
+
+
+def get_dummy_result(width: int, height: int) -> dict:
+    return {"src": get_dummy_thumbnail(width, height), "alt": "", "noimg": "img_not_found"}
+
+
+def get_board_sizes(board: Board) -> Set[Size]:
+    """게시판의 갤러리 썸네일 크기(PC, 모바일) 목록 (BoardConfig.gallery_width/height와 같은 기준)"""
+    return {
+        (board.bo_gallery_width or 200, board.bo_gallery_height or 150),
+        (board.bo_mobile_gallery_width or 200, board.bo_mobile_gallery_height or 150),
+    }
+
+
+def select_thumbnail_source(images: List[BoardFile], content: str,
+                            image_extensions: str) -> Tuple[str, str]:
+    """썸네일 원본 이미지를 선택합니다.
+    - 첨부 이미지가 있으면 첫번째 이미지, 없으면 본문의 에디터 이미지 중 첫번째 이미지를 사용합니다.
+
+    Args:
+        images (List[BoardFile]): 게시글의 이미지 파일 목록
+        content (str): 게시글 본문
+        image_extensions (str): 이미지 확장자 설정값
+
+    Returns:
+        Tuple[str, str]: (원본 이미지 경로, 대체 텍스트). 이미지가 없으면 ("", "")
+    """
+    if images:
+        return images[0].bf_file, images[0].bf_content or ""
+
+    for image in get_editor_image(content, view=False):
+        try:
+            ext = image.split(".")[-1].lower()
+
+            # 에디터로 삽입된 이미지의 주소는 웹 경로이기에 os.path로 체크할 수 있도록 경로를 변경한다.
+            # 외부 이미지도 썸네일로 보여지기를 희망하는 경우 썸네일 조건 및 생성 로직을 수정해야한다.
+            image = "./data/editor/" + image.split("/data/editor/")[1]
+
+            # image경로의 파일이 존재하고 이미지파일인지 확인
+            if (os.path.exists(image)
+                    and os.path.isfile(image)
+                    and os.path.getsize(image) > 0
+                    and ext in image_extensions):
+                return image, ""
+
+        except Exception as e:
+            print(e)
+            continue
+
+    return "", ""
+
+
+def get_image_files(db: Session, bo_table: str, wr_id: int, image_extensions: str) -> List[BoardFile]:
+    """게시글의 이미지 파일 목록 (BoardFileService.split_files_by_type과 같은 기준)"""
+    board_files = db.scalars(
+        select(BoardFile)
+        .where(BoardFile.bo_table == bo_table, BoardFile.wr_id == wr_id)
+        .order_by(BoardFile.bf_no)
+    ).all()
+    return [file for file in board_files if file.bf_source.split(".")[-1] in image_extensions]
+
+
+def get_thumbnail_records(db: Session, bo_table: str, wr_ids: List[int]) -> Dict[int, BoardThumbnail]:
+    """여러 게시글의 썸네일 정보를 한번에 조회합니다.
+
+    Args:
+        db (Session): DB 세션
+        bo_table (str): 게시판 테이블명
+        wr_ids (List[int]): 게시글 아이디 목록
+
+    Returns:
+        Dict[int, BoardThumbnail]: 게시글 아이디별 썸네일 정보
+    """
+    if not wr_ids:
+        return {}
+
+    ensure_thumbnail_table()
+    records = db.scalars(
+        select(BoardThumbnail)
+        .where(BoardThumbnail.bo_table == bo_table, BoardThumbnail.wr_id.in_(wr_ids))
+    ).all()
+    return {record.wr_id: record for record in records}
+
+
+def build_thumbnail(db: Session, bo_table: str, write: WriteBaseModel, images: List[BoardFile],
+                    image_extensions: str, sizes: Iterable[Size]) -> BoardThumbnail:
+    """게시글의 썸네일을 생성하고 썸네일 정보를 저장합니다. (commit은 호출한 쪽에서 처리)
+
+    Args:
+        db (Session): DB 세션
+        bo_table (str): 게시판 테이블명
+        write (WriteBaseModel): 게시글
+        images (List[BoardFile]): 게시글의 이미지 파일 목록
+        image_extensions (str): 이미지 확장자 설정값
+        sizes (Iterable[Size]): 생성할 썸네일 크기 목록
+
+    Returns:
+        BoardThumbnail: 썸네일 정보
+    """
+    ensure_thumbnail_table()
+    source, alt = select_thumbnail_source(images, write.wr_content, image_extensions)
+    record = db.get(BoardThumbnail, {"bo_table": bo_table, "wr_id": write.wr_id})
+    if record is None:
+        record = BoardThumbnail(bo_table=bo_table, wr_id=write.wr_id)
+        db.add(record)
+
+    # 원본 이미지가 같으면 이전에 생성한 크기도 함께 유지합니다.
+    sizes = set(sizes)
+    if record.th_source == source:
+        sizes |= parse_variants(record.th_variants)
+
+    variants = set()
+    if source:
+        for width, height in sizes:
+            if thumbnail(source, width=width, height=height):
+                variants.add((width, height))
+        # 썸네일을 만들 수 없는 이미지는 이미지가 없는 게시글로 처리합니다.
+        if sizes and not variants:
+            source, alt = "", ""
+
+    record.th_source = source
+    record.th_alt = alt[:255]
+    record.th_variants = format_variants(variants)
+    record.th_datetime = datetime.now()
+    return record
+
+
+def generate_thumbnails(bo_table: str, wr_id: int, sizes: Iterable[Size] = ()) -> None:
+    """게시글의 썸네일을 생성합니다. (백그라운드 작업)
+    - 게시판의 갤러리 썸네일 크기(PC, 모바일)는 항상 생성합니다.
+    - 삭제된 게시글이나 댓글이면 썸네일 정보를 삭제합니다.
+    """
+    try:
+        ensure_thumbnail_table()
+        with DBConnect().sessionLocal() as db:
+            board = db.get(Board, bo_table)
+            write = None
+            if board:
+                write_model = dynamic_create_write_table(bo_table)
+                write = db.get(write_model, wr_id)
+            if not write or write.wr_is_comment:
+                db.execute(
+                    delete(BoardThumbnail)
+                    .where(BoardThumbnail.bo_table == bo_table, BoardThumbnail.wr_id == wr_id)
+                )
+                db.commit()
+                return
+
+            config = config_cache.get(db)
+            image_extensions = config.cf_image_extension if config else ""
+            sizes = set(sizes) | get_board_sizes(board)
+            images = get_image_files(db, bo_table, wr_id, image_extensions)
+            record = db.get(BoardThumbnail, {"bo_table": bo_table, "wr_id": wr_id})
+            before = (record.th_source, record.th_variants) if record else None
+            record = build_thumbnail(db, bo_table, write, images, image_extensions, sizes)
+            is_changed = before != (record.th_source, record.th_variants)
+            try:
+                db.commit()
+            except IntegrityError:
+                # 다른 worker에서 먼저 저장한 경우
+                db.rollback()
+                return
+
+        # 원본 이미지로 출력되어 캐시된 최신글을 다시 생성하도록 합니다.
+        if is_changed:
+            latest_cache.invalidate(bo_table)
+    except Exception as e:
+        print("썸네일 생성 실패 : ", e)
+    finally:
+        with _pending_lock:
+            _pending.discard((bo_table, wr_id))
+
+
+def schedule_thumbnails(bo_table: str, wr_id: int, sizes: Iterable[Size] = ()) -> None:
+    """게시글의 썸네일 생성을 백그라운드 스레드에 요청합니다."""
+    with _pending_lock:
+        if (bo_table, wr_id) in _pending:
+            return
+        _pending.add((bo_table, wr_id))
+    _executor.submit(generate_thumbnails, bo_table, wr_id, tuple(sizes))
+
+
+def delete_board_thumbnails(db: Session, bo_table: str) -> None:
+    """게시판의 썸네일 정보를 모두 삭제합니다. (게시판 삭제)"""
+    ensure_thumbnail_table()
+    db.execute(delete(BoardThumbnail).where(BoardThumbnail.bo_table == bo_table))
+
+
+def mark_thumbnail_changed(db: Session, bo_table: str, wr_id: int) -> None:
+    """commit 후 썸네일을 다시 생성할 게시글로 기록합니다.
+    - ORM 이벤트가 발생하지 않는 일괄 처리 쿼리(insert 등)로 첨부파일을 변경한 경우 직접 호출합니다.
+    """
+    db.info.setdefault(_PENDING_WRITES_KEY, set()).add((bo_table, wr_id))
+
+
+def _write_changed(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글 추가/삭제 시 기록 (댓글 제외)"""
+    session = object_session(target)
+    if session is not None and not target.wr_is_comment:
+        mark_thumbnail_changed(session, get_bo_table(target), target.wr_id)
+
+
+def _write_updated(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글 본문이 수정된 경우에만 기록"""
+    if inspect(target).attrs.wr_content.history.has_changes():
+        _write_changed(mapper, connection, target)
+
+
+def _file_changed(mapper, connection, target: BoardFile) -> None:
+    """첨부파일 추가/수정/삭제 시 기록"""
+    session = object_session(target)
+    if session is not None:
+        mark_thumbnail_changed(session, target.bo_table, target.wr_id)
+
+
+def _after_commit(session: Session) -> None:
+    for bo_table, wr_id in session.info.pop(_PENDING_WRITES_KEY, ()):
+        schedule_thumbnails(bo_table, wr_id)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_WRITES_KEY, None)
+
+
+def register_thumbnail_events() -> None:
+    """게시글/첨부파일 변경 시 썸네일을 다시 생성하도록 이벤트를 등록합니다."""
+    listeners = (
+        (WriteBaseModel, ("after_insert", "after_delete"), _write_changed, True),
+        (WriteBaseModel, ("after_update",), _write_updated, True),
+        (BoardFile, ("after_insert", "after_update", "after_delete"), _file_changed, False),
+    )
+    for target, identifiers, listener, propagate in listeners:
+        for identifier in identifiers:
+            if not event.contains(target, identifier, listener):
+                event.listen(target, identifier, listener, propagate=propagate)
+    if not event.contains(Session, "after_commit", _after_commit):
+        event.listen(Session, "after_commit", _after_commit)
+    if not event.contains(Session, "after_rollback", _after_rollback):
+        event.listen(Session, "after_rollback", _after_rollback)
+
+
+register_thumbnail_events()
@@ -4,29 +4,31 @@ import json
 import logging
 import math
 import os
-import random
 import re
 import shutil
 from datetime import date, datetime, timedelta
-from time import sleep
 from typing import Any, List, Optional, Union
 
 import httpx
 from dotenv import load_dotenv
 from fastapi import Request, UploadFile
 from markupsafe import Markup, escape
-from PIL import Image, ImageOps, UnidentifiedImageError
+from PIL import Image, UnidentifiedImageError
 from sqlalchemy import (
     Index, asc, cast, delete, desc, func, select, String, DateTime
 )
-from sqlalchemy.exc import IntegrityError
 from starlette.datastructures import URL
 
 from core.database import DBConnect, db_session, MySQLCharsetMixin
 from core.models import (
-    BoardNew, Config, Member, Memo, UniqId, Visit, WriteBaseModel
+    BoardNew, Config, Member, Memo, Visit, WriteBaseModel
 )
 from core.plugin import get_admin_menu_id_by_path
+from lib.image_service import image_service
+from lib.ip_rule import get_ip_rules
+from lib.unique_id import unique_id_allocator
+from lib.visit_rollup import build_visit_rollup, delete_visit_rollup
+from lib.word_filter import WordMatch, get_word_matcher, get_word_set
 
 load_dotenv()
 
@@ -292,33 +294,14 @@ def get_unique_id(request) -> Optional[str]:
     그누보드 5의 get_uniqid
 
     년월일시분초00 ~ 년월일시분초99
-    년(4) 월(2) 일(2) 시(2) 분(2) 초(2) 100만분의 1초(2)
+    년(4) 월(2) 일(2) 시(2) 분(2) 초(2) 순번(2)
+    - lib/unique_id.py 에서 worker별로 중복되지 않는 고유키를 메모리에서 발급합니다.
     Args:
         request (Request): FastAPI Request 객체
     Returns:
         Optional[str]: 고유 아이디, DB 오류시 None
     """
-
-    ip: str = get_client_ip(request)
-
-    while True:
-        current = datetime.now()
-        ten_milli_sec = str(current.microsecond)[:2].zfill(2)
-        key = f"{current.strftime('%Y%m%d%H%M%S')}{ten_milli_sec}"
-
-        with DBConnect().sessionLocal() as session:
-            try:
-                session.add(UniqId(uq_id=key, uq_ip=ip))
-                session.commit()
-                return key
-
-            except IntegrityError:
-                # key 중복 에러가 발생하면 다시 시도
-                session.rollback()
-                sleep(random.uniform(0.01, 0.02))
-            except Exception as e:
-                logging.log(logging.CRITICAL, 'unique table insert error', exc_info=e)
-                return None
+    return unique_id_allocator.allocate(get_client_ip(request))
 
 
 class StringEncrypt:
@@ -506,7 +489,8 @@ def calculator_image_resize(source_width, source_height, target_width=0, target_
 
 
 
-def thumbnail(source_file: str, target_path: str = None, width: int = 200, height: int = 150, **kwargs) -> str:
+def thumbnail(source_file: str, target_path: str = None, width: int = 200, height: int = 150,
+              wait: bool = True, **kwargs) -> str:
     """섬네일 이미지를 생성한다.
 
     Args:
@@ -514,6 +498,8 @@ def thumbnail(source_file: str, target_path: str = None, width: int = 200, heigh
         target_path (str, optional): 섬네일 이미지 파일 경로. Defaults to None.
         width (int, optional): 섬네일 이미지 너비. Defaults to 200.
         height (int, optional): 섬네일 이미지 높이. Defaults to 150.
+        wait (bool, optional): 섬네일 생성을 기다릴지 여부. Defaults to True.
+            False 이면 생성을 등록만 하고 생성중인 경우 ""를 반환합니다. (요청 처리 중 사용)
 
     Returns:
         str: 섬네일 이미지 파일 경로
@@ -534,31 +520,10 @@ def thumbnail(source_file: str, target_path: str = None, width: int = 200, heigh
             if os.path.getmtime(source_file) < os.path.getmtime(thumbnail_file):
                 return thumbnail_file
 
-        # 이미지 객체 생성
-        # 파일이 없가나 이미지가 아닐 경우 예외가 발생하므로 검사를 따로 하지 않음.
-        source_image = Image.open(source_file)
-        source_width, source_height = source_image.size
-
-        # 이미지가 섬네일이미지보다 작을 경우
-        if source_width < width or source_height < height:
-            # 확장 이미지 생성
-            expanded_img = Image.new("RGB", (width, height), (255, 255, 255))
-            # 기존 이미지를 확장된 이미지 중앙에 삽입
-            left = (width - source_width) // 2
-            top = (height - source_height) // 2
-            expanded_img.paste(source_image, (left, top))
-            expanded_img.save(thumbnail_file)
-        else:
-            # 이미지를 지정한 크기로 자르고 저장
-            ImageOps.fit(source_image, (width, height)).save(thumbnail_file)
-            # source_image.thumbnail((width, height))
-            # source_image.save(thumbnail_file)
-
-        return thumbnail_file
-
-    except UnidentifiedImageError as e:
-        print("원본 이미지 객체 생성 실패 : ", e)
-        return ""
+        # 이미지 디코딩/리사이즈는 이미지 처리 프로세스에서 실행
+        if not wait:
+            return image_service.thumbnail_nowait(source_file, thumbnail_file, width, height) or ""
+        return image_service.thumbnail(source_file, thumbnail_file, width, height)
 
     except Exception as e:
         print("섬네일 생성 실패 : ", e)
@@ -641,6 +606,9 @@ def delete_old_records():
             result = db.execute(
                 delete(Visit).where(concat_expr < base_date)
             )
+            # 삭제한 방문자기록의 집계 삭제 (기준일은 남은 기록으로 다시 집계)
+            delete_visit_rollup(db, lambda column: column < base_date.date())
+            build_visit_rollup(db, base_date.date())
             print("방문자기록 삭제 기준일 : ", base_date, f"{result.rowcount}건 삭제")
 
         # 인기검색어 삭제
@@ -727,21 +695,12 @@ def check_ip_list(request: Request, current_ip: str, ip_list: str, allow: bool)
     if request.state.is_super_admin:
         return allow
 
-    ip_list = ip_list.strip()
-    if not ip_list:
+    # 설정이 변경된 경우에만 IP 규칙을 다시 컴파일합니다.
+    ip_rules = get_ip_rules(ip_list or "")
+    if not ip_rules:
         return allow
 
-    ip_patterns = ip_list.split("\n")
-    for pattern in ip_patterns:
-        pattern = pattern.strip()
-        if not pattern:
-            continue
-        pattern = pattern.replace(".", r"\.")
-        pattern = pattern.replace("+", r"[0-9\.]+")
-        if re.match(f"^{pattern}$", current_ip):
-            return True
-
-    return False
+    return ip_rules.match(current_ip)
 
 
 def filter_words(request: Request, contents: str) -> str:
@@ -754,16 +713,24 @@ def filter_words(request: Request, contents: str) -> str:
     Returns:
         str: 필터링된 단어가 있으면 해당 단어, 없으면 빈 문자열
     """
-    cf_filter = request.state.config.cf_filter
-    words = cf_filter.split(",")
-    for word in words:
-        word = word.strip()
-        if not word:
-            continue
-        if word in contents:
-            return word
+    # 설정이 변경된 경우에만 단어 목록을 다시 컴파일합니다.
+    matcher = get_word_matcher(request.state.config.cf_filter)
+    return matcher.search(contents)
 
-    return ''
+
+def find_filter_words(request: Request, contents: str) -> List[WordMatch]:
+    """글 내용에 포함된 모든 필터링 단어와 위치를 반환하는 함수
+    - 에디터 등에서 필터링된 단어를 강조 표시할 때 사용합니다.
+
+    Args:
+        request (Request): FastAPI Request 객체
+        contents (str): 글 내용
+
+    Returns:
+        List[WordMatch]: (단어, 시작 위치, 끝 위치) 목록
+    """
+    matcher = get_word_matcher(request.state.config.cf_filter)
+    return matcher.find_all(contents)
 
 
 def check_prohibit_words(request: Request, contents: str) -> str:
@@ -777,10 +744,9 @@ def check_prohibit_words(request: Request, contents: str) -> str:
     Returns:
         str: 금지된 단어가 있으면 해당 단어, 없으면 빈 문자열
     """
-    prohibit_list = getattr(request.state.config, "cf_prohibit_id", "").split(",")
-    prohibit_list = [id.strip().lower() for id in prohibit_list]
+    prohibit_words = get_word_set(getattr(request.state.config, "cf_prohibit_id", ""))
 
-    if contents.lower() in prohibit_list:
+    if contents.lower() in prohibit_words:
         return contents
 
     return ''
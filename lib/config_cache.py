@@ -0,0 +1,101 @@
+"""기본환경설정(Config) 캐시 모듈
+
+매 요청마다 기본환경설정 테이블을 조회하지 않도록
+프로세스(worker)별로 읽기 전용 스냅샷을 보관합니다.
+- 관리자 설정 저장 시 버전 파일의 수정시간(mtime)을 갱신하여
+  다른 uvicorn worker 에서도 스냅샷을 다시 읽도록 합니다.
+"""
+import os
+import time
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.models import Config
+
+
+class ConfigSnapshot:
+    """기본환경설정의 읽기 전용 스냅샷
+
+    - 세션에 바인딩되지 않은 값 객체이므로 요청이 끝난 후에도 안전하게 재사용할 수 있습니다.
+    - Config 모델과 같은 속성 이름(cf_*)으로 접근합니다.
+    """
+    __slots__ = tuple(column.key for column in Config.__table__.columns)
+
+    def __init__(self, config: Config) -> None:
+        for name in self.__slots__:
+            object.__setattr__(self, name, getattr(config, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("기본환경설정 스냅샷은 수정할 수 없습니다.")
+
+    def __delattr__(self, name):
+        raise AttributeError("기본환경설정 스냅샷은 수정할 수 없습니다.")
+
+    def __repr__(self) -> str:
+        return f"<ConfigSnapshot cf_id={getattr(self, 'cf_id', None)}>"
+
+
+class ConfigCache:
+    """기본환경설정 스냅샷 캐시 클래스"""
+    version_file_path = os.path.join("data", "config_version.txt")
+    # 관리자 저장 이외의 경로(방문자 수 등)로 변경되는 값을 반영하기 위한 최대 보관시간 (단위: 초)
+    max_age = 60
+
+    def __init__(self) -> None:
+        # (버전, 적재시간, 스냅샷)을 하나의 튜플로 교체하여 읽는 쪽에서 일관된 값을 보도록 합니다.
+        self._entry: Tuple[int, float, Optional[ConfigSnapshot]] = (0, 0.0, None)
+
+    @classmethod
+    def get_version(cls) -> int:
+        """버전 파일의 수정시간(ns)을 반환합니다.
+
+        Returns:
+            int: 버전 스탬프. 파일이 없으면 0
+        """
+        try:
+            return os.stat(cls.version_file_path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def get(self, db: Session) -> Optional[ConfigSnapshot]:
+        """기본환경설정 스냅샷을 반환합니다.
+        - 버전 스탬프가 바뀌었거나 보관시간이 지난 경우에만 DB에서 다시 조회합니다.
+
+        Args:
+            db (Session): 스냅샷이 없을 때 사용할 DB 세션
+
+        Returns:
+            Optional[ConfigSnapshot]: 기본환경설정 스냅샷
+        """
+        version = self.get_version()
+        cached_version, loaded_at, snapshot = self._entry
+        if (snapshot is not None
+                and cached_version == version
+                and time.monotonic() - loaded_at < self.max_age):
+            return snapshot
+
+        config = db.scalar(select(Config))
+        if config is None:
+            return None
+
+        snapshot = ConfigSnapshot(config)
+        self._entry = (version, time.monotonic(), snapshot)
+        return snapshot
+
+    def clear(self) -> None:
+        """현재 worker의 스냅샷만 비웁니다."""
+        self._entry = (0, 0.0, None)
+
+    def invalidate(self) -> None:
+        """모든 worker의 스냅샷을 무효화합니다.
+        - 현재 worker의 스냅샷을 비우고, 버전 파일을 갱신합니다.
+        """
+        self.clear()
+        os.makedirs(os.path.dirname(self.version_file_path), exist_ok=True)
+        with open(self.version_file_path, "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+
+
+config_cache = ConfigCache()
@@ -13,7 +13,7 @@ def get_login_member(
 ) -> Member:
     """현재 로그인 여부 검사 진행 후 로그인 멤버를 반환한다."""
     mb_id = request.session.get("ss_mb_id", "")
-    member: Member = service.fetch_member_by_id(mb_id)
+    member: Member = service.fetch_cached_member_by_id(mb_id)
     if not member or not mb_id:
         path = request.url.path
         url = request.url_for("login_form").replace_query_params(url=path)
@@ -28,5 +28,5 @@ def get_login_member_optional(
 ) -> Union[Member, None]:
     """현재 로그인 멤버를 반환한다. 로그인이 되어 있지 않으면 None을 반환한다."""
     mb_id = request.session.get("ss_mb_id", "")
-    member: Member = service.fetch_member_by_id(mb_id)
+    member: Member = service.fetch_cached_member_by_id(mb_id)
     return member
@@ -5,7 +5,6 @@ from fastapi import (
     Depends, Form, HTTPException, Path, Query, Request, Response
 )
 from sqlalchemy import exists, inspect, select
-from sqlalchemy.exc import ProgrammingError
 
 from core.database import DBConnect
 from core.exception import AlertException, TemplateDisabledException
@@ -16,6 +15,7 @@ from lib.captcha import get_current_captcha_cls
 from lib.common import get_client_ip, get_current_admin_menu_id
 from lib.dependency.auth import get_login_member_optional
 from lib.member import get_admin_type
+from lib.presence_tracker import presence_tracker
 from lib.token import check_token
 from service.current_connect_service import CurrentConnectService
 from service.menu_service import MenuService
@@ -234,26 +234,14 @@ async def set_template_basic_data(
 
 async def set_current_connect(
         request: Request,
-        service: Annotated[CurrentConnectService, Depends()],
         member: Annotated[Member, Depends(get_login_member_optional)]):
-    """현재 접속자 정보 설정"""
-    try:
+    """현재 접속자 정보 설정
+    - 메모리에 기록하고, 테이블 저장과 오래된 접속자 삭제는 백그라운드에서 처리합니다.
+    """
+    if not request.state.is_super_admin:
         current_ip = get_client_ip(request)
-        path = request.url.path
         mb_id = getattr(member, "mb_id", "")
-
-        if not request.state.is_super_admin:
-            current_login = service.fetch_current_connect(current_ip)
-            if current_login:
-                service.update_current_connect(current_login, path, mb_id)
-            else:
-                service.create_current_connect(current_ip, path, mb_id)
-
-        # 현재 로그인한 이력 삭제
-        service.delete_current_connect()
-
-    except ProgrammingError as e:
-        print(e)
+        presence_tracker.touch(current_ip, mb_id, request.url.path)
 
 
 def validate_login_url(request: Request, url: str = Form(default="/")):
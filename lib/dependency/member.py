@@ -10,7 +10,8 @@ from core.formclass import RegisterMemberForm, UpdateMemberForm
 from core.models import Member
 from lib.common import is_none_datetime
 from lib.dependency.auth import get_login_member
-from lib.pbkdf2 import create_hash, validate_password
+from lib.password_hasher import password_hasher
+from lib.pbkdf2 import validate_password
 from service.member_service import MemberService, ValidateMember
 
 
@@ -89,7 +90,7 @@ def validate_password_reset(
     if mb_password != mb_password_confirm:
         raise AlertException("비밀번호가 일치하지 않습니다.", 400)
 
-    return create_hash(mb_password)
+    return password_hasher.hash(mb_password)
 
 
 def validate_certify_email_member(
@@ -2,6 +2,7 @@ import logging
 import os
 import uuid
 from datetime import datetime
+from io import BytesIO
 
 from fastapi import APIRouter, File, Request, UploadFile
 from PIL import Image
@@ -10,6 +11,7 @@ from starlette.responses import JSONResponse
 from core.models import Config
 from core.settings import settings
 from lib.common import calculator_image_resize
+from lib.image_service import ImageServiceBusy, image_service
 
 router = APIRouter(prefix="/ckeditor4")
 
@@ -45,7 +47,8 @@ async def image_upload(request: Request, upload: UploadFile = File(...)):
         if ext not in config.cf_image_extension:
             return JSONResponse(status_code=400, content="허용되지 않는 파일입니다.")
 
-        if os.path.getsize(upload.file.tell()) > _IMAGE_RESIZE_LIMIT:
+        data = await upload.read()
+        if len(data) > _IMAGE_RESIZE_LIMIT:
             return JSONResponse(status_code=400, content="이미지 허용된 용량보다 큽니다.")
 
         # 파일 저장
@@ -57,20 +60,20 @@ async def image_upload(request: Request, upload: UploadFile = File(...)):
         os.makedirs(upload_path, exist_ok=True)
 
         try:
-            image: Image.Image = Image.open(upload.file)
+            resize = None
             if _IS_IMAGE_RESIZE:
-                width, height = image.size
+                # 크기 계산은 헤더만 읽고, 디코딩/리사이즈/저장은 이미지 처리 프로세스에서 실행
+                with Image.open(BytesIO(data)) as image:
+                    width, height = image.size
                 size_result = calculator_image_resize(
                     width, height, _IMAGE_RESIZE_WIDTH, _IMAGE_RESIZE_HEIGHT)
                 if size_result:
-                    image = image.resize((size_result['width'], size_result['height']), Image.LANCZOS)
-                image = image.convert("RGB")
-                image.save(f"{upload_path}/{filename}",
-                           format="JPEG",
-                           quality=_IMAGE_RESIZE_QUALITY,
-                           optimize=True)
-            image.save(f"{upload_path}/{filename}")
-            image.close()
+                    resize = (size_result['width'], size_result['height'])
+            await image_service.save_upload_image(
+                data, f"{upload_path}/{filename}", resize, _IS_IMAGE_RESIZE, _IMAGE_RESIZE_QUALITY)
+
+        except ImageServiceBusy:
+            return JSONResponse(status_code=503, content="이미지 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요.")
 
         except Exception as e:
             logging.critical(f"파일 저장에 실패했습니다.", exc_info=e)
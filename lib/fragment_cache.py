@@ -0,0 +1,274 @@
+"""화면 조각(HTML fragment) 캐시 모듈
+
+최신글 위젯처럼 자주 출력되는 HTML 조각을 2단계로 캐시합니다.
+- 1단계: 프로세스(worker)별 메모리 캐시 (LRU + TTL, 바이트 용량 제한)
+- 2단계: worker 간 공유 캐시 (기본: data/fragment_cache/store.db SQLite 파일)
+- 캐시는 태그(게시판 테이블명) 단위로 무효화하며,
+  태그별 버전 파일의 수정시간(mtime)으로 다른 worker의 메모리 캐시도 무효화합니다.
+- 게시글이 ORM으로 추가/수정/삭제되면 commit 후 해당 게시판의 캐시를 자동으로 무효화합니다.
+  수정은 최신글에 출력되는 필드가 변경된 경우에만 무효화합니다. (조회수만 변경된 경우 제외)
+  (일괄 처리 쿼리로 변경한 경우 invalidate()를 직접 호출합니다.)
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from core.models import WriteBaseModel
+from core.settings import settings
+from lib.fulltext.base import get_bo_table
+
+Version = Tuple[int, int]
+
+
+class SQLiteFragmentStore:
+    """worker 간 공유 캐시 저장소 (SQLite 파일)
+
+    - 저장소 오류는 캐시 미적중으로 처리하여 화면 출력에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._initialized = False
+
+    def connect(self) -> sqlite3.Connection:
+        """저장소에 연결합니다. (처음 연결할 때 테이블을 생성합니다.)"""
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fragment ("
+                "key TEXT PRIMARY KEY, tag TEXT NOT NULL, version TEXT NOT NULL, "
+                "value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS fragment_tag ON fragment (tag)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def execute(self, sql: str, params: tuple = ()) -> list:
+        """쿼리를 실행하고 결과를 반환합니다."""
+        try:
+            conn = self.connect()
+            try:
+                with conn:
+                    return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            self._initialized = False
+            return []
+
+    def get(self, key: str, version: Version) -> Optional[str]:
+        rows = self.execute(
+            "SELECT value FROM fragment WHERE key = ? AND version = ? AND expires_at > ?",
+            (key, repr(version), time.time())
+        )
+        return rows[0][0] if rows else None
+
+    def set(self, key: str, tag: str, version: Version, value: str, ttl: int) -> None:
+        self.execute(
+            "INSERT OR REPLACE INTO fragment (key, tag, version, value, expires_at) VALUES (?, ?, ?, ?, ?)",
+            (key, tag, repr(version), value, time.time() + ttl)
+        )
+
+    def delete_tag(self, tag: str) -> None:
+        self.execute("DELETE FROM fragment WHERE tag = ? OR expires_at <= ?", (tag, time.time()))
+
+    def clear(self) -> None:
+        self.execute("DELETE FROM fragment")
+
+
+class FragmentCache:
+    """2단계 화면 조각 캐시 클래스"""
+    cache_dir = os.path.join("data", "fragment_cache")
+    # 전체 무효화(clear)에 사용하는 버전 태그
+    ALL_TAG = "__all__"
+
+    def __init__(self, name: str, max_bytes: int, ttl: int, shared: bool = True):
+        """
+        Args:
+            name (str): 캐시 이름 (버전 파일, 공유 캐시 키의 접두어로 사용)
+            max_bytes (int): 프로세스별 메모리 캐시 용량 (bytes)
+            ttl (int): 보관시간 (초)
+            shared (bool, optional): worker 간 공유 캐시 사용 여부. Defaults to True.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.memory = TTLCache(maxsize=max_bytes, ttl=ttl, getsizeof=self.get_entry_size)
+        self.store = SQLiteFragmentStore(os.path.join(self.cache_dir, "store.db")) if shared else None
+        self.version_dir = os.path.join(self.cache_dir, "versions", name)
+        self.lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "shared_hits": 0, "misses": 0, "invalidations": 0}
+        os.makedirs(self.version_dir, exist_ok=True)
+
+    @staticmethod
+    def get_entry_size(entry: Tuple[Version, str]) -> int:
+        """메모리 캐시 항목(버전, 값)의 크기(bytes)"""
+        return len(entry[1].encode("utf-8"))
+
+    def get_version(self, tag: str) -> Version:
+        """(전체, 태그) 버전 파일의 수정시간(ns)을 반환합니다. 파일이 없으면 0"""
+        versions = []
+        for name in (self.ALL_TAG, tag):
+            try:
+                versions.append(os.stat(os.path.join(self.version_dir, name)).st_mtime_ns)
+            except OSError:
+                versions.append(0)
+        return tuple(versions)
+
+    def touch_version(self, tag: str) -> None:
+        """버전 파일을 갱신하여 다른 worker의 메모리 캐시를 무효화합니다."""
+        os.makedirs(self.version_dir, exist_ok=True)
+        with open(os.path.join(self.version_dir, tag), "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+
+    def get_or_create(self, tag: str, key: str, creator: Callable[[], Optional[str]]) -> str:
+        """캐시된 HTML 조각을 반환합니다. 캐시에 없으면 생성하여 저장합니다.
+        - 생성 중에 무효화된 값이 저장되지 않도록 생성 전의 버전으로 저장합니다.
+
+        Args:
+            tag (str): 무효화 단위 태그 (게시판 테이블명)
+            key (str): 캐시 키
+            creator (Callable[[], Optional[str]]): 캐시에 없을 때 값을 생성하는 함수.
+                None을 반환하면 캐시하지 않습니다.
+
+        Returns:
+            str: HTML 조각
+        """
+        version = self.get_version(tag)
+        store_key = f"{self.name}:{key}"
+        with self.lock:
+            entry = self.memory.get((tag, key))
+            if entry and entry[0] == version:
+                self.stats["memory_hits"] += 1
+                return entry[1]
+
+        value = self.store.get(store_key, version) if self.store else None
+        if value is not None:
+            with self.lock:
+                self.stats["shared_hits"] += 1
+                self._set_memory(tag, key, version, value)
+            return value
+
+        with self.lock:
+            self.stats["misses"] += 1
+        value = creator()
+        if value is None:
+            return ""
+
+        with self.lock:
+            self._set_memory(tag, key, version, value)
+        if self.store:
+            self.store.set(store_key, tag, version, value, self.ttl)
+        return value
+
+    def _set_memory(self, tag: str, key: str, version: Version, value: str) -> None:
+        try:
+            self.memory[(tag, key)] = (version, value)
+        except ValueError:
+            # 메모리 캐시 용량보다 큰 값은 메모리에 보관하지 않습니다.
+            pass
+
+    def invalidate(self, tag: str) -> None:
+        """태그(게시판)의 캐시를 모든 worker에서 무효화합니다.
+
+        Args:
+            tag (str): 무효화 단위 태그 (게시판 테이블명)
+        """
+        with self.lock:
+            for cache_key in [cache_key for cache_key in list(self.memory.keys()) if cache_key[0] == tag]:
+                self.memory.pop(cache_key, None)
+            self.stats["invalidations"] += 1
+        self.touch_version(tag)
+        if self.store:
+            self.store.delete_tag(tag)
+
+    def clear(self) -> None:
+        """모든 캐시를 모든 worker에서 무효화합니다. (테마 변경, 캐시 일괄삭제)"""
+        with self.lock:
+            self.memory.clear()
+            self.stats["invalidations"] += 1
+        self.touch_version(self.ALL_TAG)
+        if self.store:
+            self.store.clear()
+
+    def get_stats(self) -> dict:
+        """현재 worker의 캐시 통계를 반환합니다."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.memory)
+            stats["bytes"] = self.memory.currsize
+        requests = stats["memory_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["name"] = self.name
+        stats["max_bytes"] = self.memory.maxsize
+        stats["ttl"] = self.ttl
+        stats["shared"] = self.store is not None
+        stats["hit_ratio"] = round((requests - stats["misses"]) / requests * 100, 1) if requests else 0
+        return stats
+
+
+latest_cache = FragmentCache(
+    "latest",
+    max_bytes=settings.FRAGMENT_CACHE_MEMORY_SIZE * 1024 * 1024,
+    ttl=settings.FRAGMENT_CACHE_TTL,
+    shared=settings.FRAGMENT_CACHE_SHARED,
+)
+
+# 세션의 commit 후 무효화할 게시판 목록을 보관하는 session.info 키
+_PENDING_TAGS_KEY = "latest_cache_tags"
+# 최신글 목록에 출력되거나 목록 순서/대상을 정하는 게시글 필드
+# (조회수(wr_hit)의 인기글 아이콘은 캐시 보관시간이 지나면 반영됩니다.)
+LATEST_FIELDS = (
+    "wr_num", "wr_reply", "wr_is_comment", "wr_comment", "ca_name", "wr_option",
+    "wr_subject", "wr_content", "wr_link1", "wr_link2", "mb_id", "wr_name",
+    "wr_email", "wr_homepage", "wr_datetime", "wr_file",
+)
+
+
+def _mark_write_changed(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글 추가/수정/삭제 시 commit 후 무효화할 게시판으로 기록"""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_TAGS_KEY, set()).add(get_bo_table(target))
+
+
+def _mark_write_updated(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글 수정 시 최신글에 출력되는 필드가 변경된 경우에만 무효화할 게시판으로 기록"""
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in LATEST_FIELDS):
+        _mark_write_changed(mapper, connection, target)
+
+
+def _after_commit(session: Session) -> None:
+    """commit 후 변경된 게시판의 최신글 캐시를 무효화"""
+    for bo_table in session.info.pop(_PENDING_TAGS_KEY, ()):
+        latest_cache.invalidate(bo_table)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_TAGS_KEY, None)
+
+
+def register_fragment_cache_invalidation() -> None:
+    """모든 게시판 모델(WriteBaseModel 상속)에 최신글 캐시 무효화 이벤트를 등록합니다."""
+    listeners = (
+        ("after_insert", _mark_write_changed),
+        ("after_update", _mark_write_updated),
+        ("after_delete", _mark_write_changed),
+    )
+    for identifier, listener in listeners:
+        if not event.contains(WriteBaseModel, identifier, listener):
+            event.listen(WriteBaseModel, identifier, listener, propagate=True)
+    if not event.contains(Session, "after_commit", _after_commit):
+        event.listen(Session, "after_commit", _after_commit)
+    if not event.contains(Session, "after_rollback", _after_rollback):
+        event.listen(Session, "after_rollback", _after_rollback)
+
+
+register_fragment_cache_invalidation()
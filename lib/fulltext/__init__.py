@@ -0,0 +1,17 @@
+"""게시판 전문검색(Full-Text Search) 모듈
+
+.env 파일에 USE_FULLTEXT_SEARCH = "True" 로 설정하면 사용합니다.
+- MySQL(FULLTEXT ngram), PostgreSQL(tsvector/GIN), SQLite(FTS5)를 지원합니다.
+- 기존 게시판은 색인을 생성해야 검색에 사용됩니다.
+  $ python -m lib.fulltext rebuild [게시판 테이블명 ...]
+- 사용하지 않는 동안에는 색인이 갱신되지 않으므로, 다시 사용할 때는 색인을 재생성해야 합니다.
+"""
+from lib.fulltext.base import FullTextBackend
+from lib.fulltext.indexer import (
+    create_fulltext_backend, create_fulltext_index, delete_fulltext_index,
+    drop_fulltext_index, get_fulltext_backend, rebuild_fulltext_index,
+    register_fulltext_indexer
+)
+from lib.fulltext.tokenizer import ngram_tokenize
+
+register_fulltext_indexer()
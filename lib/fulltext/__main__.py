@@ -0,0 +1,53 @@
+"""전문검색 색인 재생성 명령
+
+사용법:
+    $ python -m lib.fulltext rebuild            # 전체 게시판
+    $ python -m lib.fulltext rebuild free qa    # 지정한 게시판
+    $ python -m lib.fulltext drop free          # 색인 삭제 (LIKE 검색으로 돌아감)
+"""
+import argparse
+import sys
+
+from sqlalchemy import select
+
+from core.database import DBConnect
+from core.models import Board
+from lib.common import dynamic_create_write_table
+from lib.fulltext.indexer import create_fulltext_backend
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m lib.fulltext", description="게시판 전문검색 색인 관리")
+    parser.add_argument("command", choices=["rebuild", "drop"], help="rebuild: 색인 재생성, drop: 색인 삭제")
+    parser.add_argument("bo_tables", nargs="*", help="게시판 테이블명 (생략하면 전체 게시판)")
+    args = parser.parse_args()
+
+    db_connect = DBConnect()
+    backend = create_fulltext_backend(db_connect.engine)
+    if not backend:
+        print(f"전문검색을 지원하지 않는 데이터베이스입니다. ({db_connect.engine.dialect.name})")
+        return 1
+
+    with db_connect.sessionLocal() as db:
+        bo_tables = db.scalars(select(Board.bo_table).order_by(Board.bo_table)).all()
+    if args.bo_tables:
+        unknown = set(args.bo_tables) - set(bo_tables)
+        if unknown:
+            print(f"존재하지 않는 게시판입니다. ({', '.join(sorted(unknown))})")
+            return 1
+        bo_tables = args.bo_tables
+
+    for bo_table in bo_tables:
+        if args.command == "rebuild":
+            count = backend.rebuild(bo_table, dynamic_create_write_table(bo_table))
+            print(f"{bo_table}: {count}건 색인 완료")
+        else:
+            with backend.engine.begin() as conn:
+                backend.drop_index(conn, bo_table)
+            print(f"{bo_table}: 색인 삭제 완료")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
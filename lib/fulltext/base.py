@@ -0,0 +1,156 @@
+"""전문검색(Full-Text Search) 백엔드 기본 클래스 모듈"""
+import abc
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy import Connection, Engine, column, inspect, select, table, text
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.database import DBConnect
+from core.models import WriteBaseModel
+
+# 색인에 저장하는 게시글 데이터 (wr_id, wr_subject, wr_content)
+IndexRow = Tuple[int, str, str]
+
+
+def get_bo_table(model: WriteBaseModel) -> str:
+    """게시글 모델의 게시판 테이블명을 반환합니다."""
+    prefix = DBConnect().table_prefix + "write_"
+    return model.__tablename__[len(prefix):]
+
+
+class FullTextBackend(metaclass=abc.ABCMeta):
+    """전문검색 백엔드 기본 클래스
+
+    - 게시판마다 `{prefix}fts_{bo_table}` 색인 테이블을 사용하며, wr_id로 게시글과 연결합니다.
+    - 색인 테이블이 존재하면(재생성 완료) 검색에 사용하고, 없으면 기존 LIKE 검색을 그대로 사용합니다.
+    """
+    # 색인하는 필드
+    FIELDS = ("wr_subject", "wr_content")
+    # n-gram 크기
+    NGRAM_SIZE = 2
+    # 재생성 시 한번에 색인할 게시글 수
+    BATCH_SIZE = 1000
+    # 색인 테이블에서 게시글 아이디(wr_id)를 저장하는 컬럼
+    KEY_COLUMN = "wr_id"
+
+    # 색인 테이블 존재 여부 캐시 (다른 worker에서 재생성한 경우에도 반영되도록 짧게 유지)
+    ready_cache = TTLCache(maxsize=1024, ttl=60)
+    ready_cache_lock = threading.Lock()
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    def get_table_name(self, bo_table: str) -> str:
+        """색인 테이블명을 반환합니다."""
+        return DBConnect().table_prefix + "fts_" + bo_table
+
+    def quote(self, name: str) -> str:
+        """테이블명을 DB에 맞게 인용합니다."""
+        return self.engine.dialect.identifier_preparer.quote(name)
+
+    def get_table(self, bo_table: str):
+        """색인 테이블의 SQLAlchemy 테이블 객체를 반환합니다."""
+        return table(self.get_table_name(bo_table),
+                     column(self.KEY_COLUMN), *[column(field) for field in self.FIELDS])
+
+    def is_ready(self, bo_table: str) -> bool:
+        """게시판의 색인 테이블이 있는지 확인합니다."""
+        table_name = self.get_table_name(bo_table)
+        with self.ready_cache_lock:
+            ready = self.ready_cache.get(table_name)
+        if ready is None:
+            ready = inspect(self.engine).has_table(table_name)
+            with self.ready_cache_lock:
+                self.ready_cache[table_name] = ready
+        return ready
+
+    def get_match_fields(self, fields: Iterable[str]) -> List[str]:
+        """검색 필드가 모두 색인된 필드인 경우에만 필드 목록을 색인 필드 순서로 반환합니다."""
+        fields = [field for field in fields if field]
+        if not fields or any(field not in self.FIELDS for field in fields):
+            return []
+        return [field for field in self.FIELDS if field in fields]
+
+    def create_index(self, conn: Connection, bo_table: str) -> None:
+        """색인 테이블을 생성합니다."""
+        for statement in self.get_create_statements(bo_table):
+            conn.execute(text(statement))
+
+    def drop_index(self, conn: Connection, bo_table: str) -> None:
+        """색인 테이블을 삭제합니다."""
+        conn.execute(text(f"DROP TABLE IF EXISTS {self.quote(self.get_table_name(bo_table))}"))
+
+    def clear_ready(self, bo_table: str) -> None:
+        """색인 테이블 존재 여부 캐시를 비웁니다. (색인 테이블 생성/삭제 후 호출)"""
+        with self.ready_cache_lock:
+            self.ready_cache.pop(self.get_table_name(bo_table), None)
+
+    def delete(self, conn: Connection, bo_table: str, wr_ids: Iterable[int]) -> None:
+        """색인에서 게시글을 삭제합니다."""
+        wr_ids = list(wr_ids)
+        if not wr_ids:
+            return
+        fts_table = self.get_table(bo_table)
+        conn.execute(fts_table.delete().where(fts_table.c[self.KEY_COLUMN].in_(wr_ids)))
+
+    def upsert(self, conn: Connection, bo_table: str, rows: List[IndexRow]) -> None:
+        """게시글을 색인합니다. 이미 색인된 게시글은 다시 색인합니다."""
+        if not rows:
+            return
+        self.delete(conn, bo_table, [row[0] for row in rows])
+        self.insert(conn, bo_table, rows)
+
+    def rebuild(self, bo_table: str, write_model: WriteBaseModel) -> int:
+        """게시판의 색인을 처음부터 다시 생성합니다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+            write_model (WriteBaseModel): 게시글 모델
+
+        Returns:
+            int: 색인된 게시글 수
+        """
+        count = 0
+        with self.engine.begin() as conn:
+            self.drop_index(conn, bo_table)
+            self.create_index(conn, bo_table)
+
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    select(write_model.wr_id, write_model.wr_subject, write_model.wr_content)
+                    .where(write_model.wr_id > last_id)
+                    .order_by(write_model.wr_id)
+                    .limit(self.BATCH_SIZE)
+                ).all()
+                if not rows:
+                    break
+                self.insert(conn, bo_table, [tuple(row) for row in rows])
+                count += len(rows)
+                last_id = rows[-1][0]
+        self.clear_ready(bo_table)
+
+        return count
+
+    @abc.abstractmethod
+    def get_create_statements(self, bo_table: str) -> List[str]:
+        """색인 테이블 생성 DDL 목록을 반환합니다."""
+
+    @abc.abstractmethod
+    def insert(self, conn: Connection, bo_table: str, rows: List[IndexRow]) -> None:
+        """게시글을 색인 테이블에 추가합니다."""
+
+    @abc.abstractmethod
+    def match_clause(self, model: WriteBaseModel, fields: List[str], word: str) -> Optional[ColumnElement]:
+        """검색어가 포함될 수 있는 게시글(wr_id)을 색인으로 찾는 조건을 반환합니다.
+
+        Args:
+            model (WriteBaseModel): 게시글 모델
+            fields (List[str]): 검색 필드
+            word (str): 검색어
+
+        Returns:
+            Optional[ColumnElement]: `wr_id IN (색인 조회)` 조건. 색인을 사용할 수 없으면 None
+        """
@@ -0,0 +1,135 @@
+"""전문검색(Full-Text Search) 색인 동기화 모듈
+
+게시글이 추가/수정/삭제될 때 같은 트랜잭션에서 색인 테이블을 함께 갱신합니다.
+- ORM(Session.add, Session.delete)으로 처리되는 게시글은 mapper 이벤트로 자동 반영됩니다.
+- delete(), insert() 등 일괄 처리 쿼리로 변경한 게시글은 아래 함수를 직접 호출해야 합니다.
+"""
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import Engine, event, inspect
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import WriteBaseModel
+from core.settings import settings
+from lib.fulltext.base import FullTextBackend, get_bo_table
+from lib.fulltext.mysql import MySQLFullText
+from lib.fulltext.postgresql import PostgreSQLFullText
+from lib.fulltext.sqlite import SQLiteFullText
+
+FULLTEXT_BACKENDS = {
+    "mysql": MySQLFullText,
+    "postgresql": PostgreSQLFullText,
+    "sqlite": SQLiteFullText,
+}
+_backends: Dict[Engine, Optional[FullTextBackend]] = {}
+
+
+def create_fulltext_backend(engine: Engine) -> Optional[FullTextBackend]:
+    """DB 엔진에 맞는 전문검색 백엔드를 생성합니다.
+
+    Args:
+        engine (Engine): SQLAlchemy 엔진
+
+    Returns:
+        Optional[FullTextBackend]: 전문검색 백엔드. 지원하지 않는 DB이면 None
+    """
+    backend_class = FULLTEXT_BACKENDS.get(engine.dialect.name)
+    return backend_class(engine) if backend_class else None
+
+
+def get_fulltext_backend() -> Optional[FullTextBackend]:
+    """현재 사용중인 전문검색 백엔드를 반환합니다.
+
+    Returns:
+        Optional[FullTextBackend]: 전문검색 백엔드. 사용하지 않거나 지원하지 않는 DB이면 None
+    """
+    if not settings.USE_FULLTEXT_SEARCH:
+        return None
+
+    engine = DBConnect().engine
+    if engine not in _backends:
+        _backends[engine] = create_fulltext_backend(engine)
+    return _backends[engine]
+
+
+def create_fulltext_index(bo_table: str) -> None:
+    """새 게시판의 (비어있는) 색인 테이블을 생성합니다."""
+    backend = get_fulltext_backend()
+    if backend:
+        with backend.engine.begin() as conn:
+            backend.create_index(conn, bo_table)
+        backend.clear_ready(bo_table)
+
+
+def drop_fulltext_index(bo_table: str) -> None:
+    """게시판의 색인 테이블을 삭제합니다.
+    - 같은 이름으로 게시판을 다시 만들 때 이전 색인이 남지 않도록 사용 설정과 관계없이 삭제합니다.
+    """
+    backend = create_fulltext_backend(DBConnect().engine)
+    if backend:
+        with backend.engine.begin() as conn:
+            backend.drop_index(conn, bo_table)
+        backend.clear_ready(bo_table)
+
+
+def rebuild_fulltext_index(bo_table: str) -> int:
+    """게시판의 색인을 다시 생성합니다.
+
+    Returns:
+        int: 색인된 게시글 수. 전문검색을 사용하지 않으면 0
+    """
+    # Lazy import
+    from lib.common import dynamic_create_write_table
+
+    backend = get_fulltext_backend()
+    if not backend:
+        return 0
+    return backend.rebuild(bo_table, dynamic_create_write_table(bo_table))
+
+
+def delete_fulltext_index(db: Session, bo_table: str, wr_ids: Iterable[int]) -> None:
+    """일괄 삭제한 게시글을 색인에서 삭제합니다. (db 세션의 트랜잭션에서 처리)"""
+    backend = get_fulltext_backend()
+    if backend and backend.is_ready(bo_table):
+        backend.delete(db.connection(), bo_table, wr_ids)
+
+
+def _after_insert_write(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글 추가 시 색인"""
+    backend = get_fulltext_backend()
+    bo_table = get_bo_table(target)
+    if backend and backend.is_ready(bo_table):
+        backend.insert(connection, bo_table, [(target.wr_id, target.wr_subject, target.wr_content)])
+
+
+def _after_update_write(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글의 제목/내용이 수정된 경우에만 다시 색인"""
+    backend = get_fulltext_backend()
+    bo_table = get_bo_table(target)
+    if not backend or not backend.is_ready(bo_table):
+        return
+
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in backend.FIELDS):
+        backend.upsert(connection, bo_table, [(target.wr_id, target.wr_subject, target.wr_content)])
+
+
+def _after_delete_write(mapper, connection, target: WriteBaseModel) -> None:
+    """게시글 삭제 시 색인에서 삭제"""
+    backend = get_fulltext_backend()
+    bo_table = get_bo_table(target)
+    if backend and backend.is_ready(bo_table):
+        backend.delete(connection, bo_table, [target.wr_id])
+
+
+def register_fulltext_indexer() -> None:
+    """모든 게시판 모델(WriteBaseModel 상속)에 색인 이벤트를 등록합니다."""
+    listeners = (
+        ("after_insert", _after_insert_write),
+        ("after_update", _after_update_write),
+        ("after_delete", _after_delete_write),
+    )
+    for identifier, listener in listeners:
+        if not event.contains(WriteBaseModel, identifier, listener):
+            event.listen(WriteBaseModel, identifier, listener, propagate=True)
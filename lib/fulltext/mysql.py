@@ -0,0 +1,59 @@
+"""MySQL FULLTEXT 전문검색 백엔드 모듈"""
+from typing import List, Optional
+
+from sqlalchemy import Connection, select, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.database import DBConnect
+from core.models import WriteBaseModel
+from lib.fulltext.base import FullTextBackend, IndexRow, get_bo_table
+from lib.fulltext.tokenizer import ngram_query_tokens
+
+
+class MySQLFullText(FullTextBackend):
+    """MySQL FULLTEXT 전문검색 백엔드
+
+    - 내장 ngram 파서(WITH PARSER ngram)를 사용하므로 원문을 그대로 저장합니다.
+    - n-gram 크기는 MySQL 서버의 ngram_token_size(기본 2)와 같아야 합니다.
+    """
+
+    def get_create_statements(self, bo_table: str) -> List[str]:
+        table_name = self.quote(self.get_table_name(bo_table))
+        return [
+            f"CREATE TABLE IF NOT EXISTS {table_name} ("
+            "wr_id INT NOT NULL PRIMARY KEY, "
+            "wr_subject VARCHAR(255) NOT NULL DEFAULT '', "
+            "wr_content MEDIUMTEXT NOT NULL, "
+            "FULLTEXT KEY ft_subject (wr_subject) WITH PARSER ngram, "
+            "FULLTEXT KEY ft_content (wr_content) WITH PARSER ngram, "
+            "FULLTEXT KEY ft_subject_content (wr_subject, wr_content) WITH PARSER ngram"
+            f") ENGINE=InnoDB DEFAULT CHARSET={DBConnect().charset}"
+        ]
+
+    def create_index(self, conn: Connection, bo_table: str) -> None:
+        # 불용어가 포함된 n-gram이 색인에서 빠지지 않도록 불용어 처리를 끈 상태로 생성합니다.
+        conn.execute(text("SET SESSION innodb_ft_enable_stopword = OFF"))
+        super().create_index(conn, bo_table)
+
+    def insert(self, conn: Connection, bo_table: str, rows: List[IndexRow]) -> None:
+        conn.execute(self.get_table(bo_table).insert(), [
+            {"wr_id": wr_id, "wr_subject": wr_subject, "wr_content": wr_content}
+            for wr_id, wr_subject, wr_content in rows
+        ])
+
+    def match_clause(self, model: WriteBaseModel, fields: List[str], word: str) -> Optional[ColumnElement]:
+        bo_table = get_bo_table(model)
+        fields = self.get_match_fields(fields)
+        if (not fields
+                or '"' in word
+                or not ngram_query_tokens(word, self.NGRAM_SIZE)
+                or not self.is_ready(bo_table)):
+            return None
+
+        # 따옴표로 감싼 구문 검색은 ngram 파서에서 연속된 n-gram 검색으로 변환됩니다.
+        fts_table = self.get_table(bo_table)
+        return model.wr_id.in_(
+            select(fts_table.c.wr_id)
+            .where(match(*[fts_table.c[field] for field in fields], against=f'"{word}"').in_boolean_mode())
+        )
@@ -0,0 +1,57 @@
+"""PostgreSQL tsvector 전문검색 백엔드 모듈"""
+from typing import List, Optional
+
+from sqlalchemy import Connection, bindparam, func, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.models import WriteBaseModel
+from lib.fulltext.base import FullTextBackend, IndexRow, get_bo_table
+from lib.fulltext.tokenizer import ngram_document, ngram_query_tokens
+
+
+class PostgreSQLFullText(FullTextBackend):
+    """PostgreSQL tsvector/GIN 전문검색 백엔드
+
+    - n-gram 토큰 문자열을 'simple' 설정의 tsvector로 저장하고 필드별 GIN 인덱스로 조회합니다.
+    """
+    TS_CONFIG = "simple"
+
+    def get_create_statements(self, bo_table: str) -> List[str]:
+        table_name = self.get_table_name(bo_table)
+        quoted_name = self.quote(table_name)
+        columns = ", ".join(f"{field} TSVECTOR NOT NULL" for field in self.FIELDS)
+        statements = [f"CREATE TABLE IF NOT EXISTS {quoted_name} (wr_id INTEGER PRIMARY KEY, {columns})"]
+        for field in self.FIELDS:
+            index_name = self.quote(f"{table_name}_{field}_idx")
+            statements.append(f"CREATE INDEX IF NOT EXISTS {index_name} ON {quoted_name} USING GIN ({field})")
+        return statements
+
+    def insert(self, conn: Connection, bo_table: str, rows: List[IndexRow]) -> None:
+        fts_table = self.get_table(bo_table)
+        statement = fts_table.insert().values(
+            wr_id=bindparam("id"),
+            **{field: func.to_tsvector(self.TS_CONFIG, bindparam(f"{field}_doc")) for field in self.FIELDS}
+        )
+        conn.execute(statement, [
+            {
+                "id": wr_id,
+                "wr_subject_doc": ngram_document(wr_subject, self.NGRAM_SIZE),
+                "wr_content_doc": ngram_document(wr_content, self.NGRAM_SIZE),
+            }
+            for wr_id, wr_subject, wr_content in rows
+        ])
+
+    def match_clause(self, model: WriteBaseModel, fields: List[str], word: str) -> Optional[ColumnElement]:
+        bo_table = get_bo_table(model)
+        fields = self.get_match_fields(fields)
+        tokens = ngram_query_tokens(word, self.NGRAM_SIZE)
+        if not fields or not tokens or not self.is_ready(bo_table):
+            return None
+
+        # plainto_tsquery는 토큰을 모두 포함(&)하는 조건으로 변환합니다.
+        ts_query = func.plainto_tsquery(self.TS_CONFIG, " ".join(tokens))
+        fts_table = self.get_table(bo_table)
+        return model.wr_id.in_(
+            select(fts_table.c.wr_id)
+            .where(or_(*[fts_table.c[field].op("@@")(ts_query) for field in fields]))
+        )
@@ -0,0 +1,49 @@
+"""SQLite FTS5 전문검색 백엔드 모듈"""
+from typing import List, Optional
+
+from sqlalchemy import Connection, literal_column, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.models import WriteBaseModel
+from lib.fulltext.base import FullTextBackend, IndexRow, get_bo_table
+from lib.fulltext.tokenizer import ngram_document, ngram_query_tokens
+
+
+class SQLiteFullText(FullTextBackend):
+    """SQLite FTS5 전문검색 백엔드
+
+    - n-gram 토큰 문자열을 FTS5 가상 테이블에 저장하며, rowid를 wr_id로 사용합니다.
+    """
+    KEY_COLUMN = "rowid"
+
+    def get_create_statements(self, bo_table: str) -> List[str]:
+        table_name = self.quote(self.get_table_name(bo_table))
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table_name} "
+            f"USING fts5({', '.join(self.FIELDS)}, tokenize='unicode61 remove_diacritics 0')"
+        ]
+
+    def insert(self, conn: Connection, bo_table: str, rows: List[IndexRow]) -> None:
+        conn.execute(self.get_table(bo_table).insert(), [
+            {
+                "rowid": wr_id,
+                "wr_subject": ngram_document(wr_subject, self.NGRAM_SIZE),
+                "wr_content": ngram_document(wr_content, self.NGRAM_SIZE),
+            }
+            for wr_id, wr_subject, wr_content in rows
+        ])
+
+    def match_clause(self, model: WriteBaseModel, fields: List[str], word: str) -> Optional[ColumnElement]:
+        bo_table = get_bo_table(model)
+        fields = self.get_match_fields(fields)
+        tokens = ngram_query_tokens(word, self.NGRAM_SIZE)
+        if not fields or not tokens or not self.is_ready(bo_table):
+            return None
+
+        # {필드1 필드2} : ("토큰1" "토큰2") => 지정한 필드에 모든 토큰이 포함된 게시글
+        match_query = "{%s} : (%s)" % (" ".join(fields), " ".join(f'"{token}"' for token in tokens))
+        fts_table = self.get_table(bo_table)
+        return model.wr_id.in_(
+            select(fts_table.c.rowid)
+            .where(literal_column(self.quote(self.get_table_name(bo_table))).op("MATCH")(match_query))
+        )
@@ -0,0 +1,65 @@
+"""전문검색(Full-Text Search) 색인에 사용하는 n-gram 토크나이저 모듈
+
+한글은 띄어쓰기 단위로 조사/어미가 붙어 단어 기준 색인으로는 부분 검색이 되지 않으므로
+글자 단위 n-gram(기본 2글자)으로 색인합니다.
+- 기존 LIKE '%검색어%' 검색과 같은 결과를 보장하기 위해, 검색어의 n-gram이 모두 포함된
+  게시글을 후보로 찾은 후 LIKE 조건으로 한번 더 확인합니다.
+"""
+import re
+from typing import List
+
+# 색인 대상 문자열 (문자/숫자의 연속, 밑줄 제외)
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def ngram_tokenize(text: str, size: int = 2) -> List[str]:
+    """문자열을 n-gram 토큰 목록으로 변환합니다.
+    - 영문은 소문자로 변환하며, n보다 짧은 단어는 그대로 토큰으로 사용합니다.
+
+    Args:
+        text (str): 색인할 문자열
+        size (int, optional): n-gram 크기. Defaults to 2.
+
+    Returns:
+        List[str]: 중복이 제거된 토큰 목록
+    """
+    tokens = {}
+    for run in WORD_PATTERN.findall((text or "").lower()):
+        if len(run) <= size:
+            tokens[run] = None
+            continue
+        for i in range(len(run) - size + 1):
+            tokens[run[i:i + size]] = None
+
+    return list(tokens)
+
+
+def ngram_query_tokens(word: str, size: int = 2) -> List[str]:
+    """검색어를 색인 조회용 n-gram 토큰 목록으로 변환합니다.
+    - n보다 짧은 조각이 포함된 검색어는 색인으로 찾을 수 없으므로 빈 목록을 반환합니다.
+
+    Args:
+        word (str): 검색어
+        size (int, optional): n-gram 크기. Defaults to 2.
+
+    Returns:
+        List[str]: 토큰 목록. 색인을 사용할 수 없으면 빈 목록
+    """
+    runs = WORD_PATTERN.findall((word or "").lower())
+    if not runs or any(len(run) < size for run in runs):
+        return []
+
+    return ngram_tokenize(" ".join(runs), size)
+
+
+def ngram_document(text: str, size: int = 2) -> str:
+    """색인 테이블에 저장할 n-gram 문서 문자열을 생성합니다.
+
+    Args:
+        text (str): 색인할 문자열
+        size (int, optional): n-gram 크기. Defaults to 2.
+
+    Returns:
+        str: 공백으로 구분된 토큰 문자열
+    """
+    return " ".join(ngram_tokenize(text, size))
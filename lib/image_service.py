@@ -0,0 +1,223 @@
+"""이미지 처리 프로세스 풀 모듈
+
+PIL 이미지 디코딩/리사이즈/인코딩을 별도 프로세스에서 처리하여
+요청을 처리하는 이벤트 루프와 스레드를 막지 않도록 합니다.
+- 같은 작업(같은 썸네일 파일 등)이 동시에 요청되면 한번만 처리하고 결과를 공유합니다.
+- 처리 대기중인 작업 수를 제한하며, 대기시간을 넘기면 ImageServiceBusy 예외가 발생합니다.
+- 작업 함수는 자식 프로세스에서 import 되므로 이 모듈은 DB, 웹 프레임워크 모듈을 import 하지 않습니다.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from core.settings import settings
+
+
+class ImageServiceBusy(RuntimeError):
+    """처리 대기중인 이미지 작업이 너무 많은 경우"""
+
+
+def create_thumbnail_file(source_file: str, thumbnail_file: str, width: int, height: int) -> str:
+    """섬네일 이미지 파일을 생성한다. (자식 프로세스에서 실행)
+
+    Returns:
+        str: 섬네일 이미지 파일 경로. 생성에 실패하면 ""
+    """
+    try:
+        # 이미지 객체 생성
+        # 파일이 없가나 이미지가 아닐 경우 예외가 발생하므로 검사를 따로 하지 않음.
+        source_image = Image.open(source_file)
+        source_width, source_height = source_image.size
+
+        # 이미지가 섬네일이미지보다 작을 경우
+        if source_width < width or source_height < height:
+            # 확장 이미지 생성
+            expanded_img = Image.new("RGB", (width, height), (255, 255, 255))
+            # 기존 이미지를 확장된 이미지 중앙에 삽입
+            left = (width - source_width) // 2
+            top = (height - source_height) // 2
+            expanded_img.paste(source_image, (left, top))
+            expanded_img.save(thumbnail_file)
+        else:
+            # 이미지를 지정한 크기로 자르고 저장
+            ImageOps.fit(source_image, (width, height)).save(thumbnail_file)
+
+        return thumbnail_file
+
+    except UnidentifiedImageError as e:
+        print("원본 이미지 객체 생성 실패 : ", e)
+        return ""
+
+    except Exception as e:
+        print("섬네일 생성 실패 : ", e)
+        return ""
+
+
+def save_upload_image(data: bytes, save_file: str, resize: Optional[Tuple[int, int]] = None,
+                      convert_jpeg: bool = False, quality: int = 80) -> bool:
+    """업로드 이미지를 저장한다. (자식 프로세스에서 실행)
+
+    Args:
+        data (bytes): 업로드 파일 내용
+        save_file (str): 저장할 파일 경로
+        resize (Tuple[int, int], optional): 리사이즈할 (너비, 높이). Defaults to None.
+        convert_jpeg (bool, optional): RGB 변환 및 JPEG 품질 적용 여부. Defaults to False.
+        quality (int, optional): JPEG 품질. Defaults to 80.
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    image = Image.open(BytesIO(data))
+    try:
+        if convert_jpeg:
+            if resize:
+                image = image.resize(resize, Image.LANCZOS)
+            image = image.convert("RGB")
+            image.save(save_file, format="JPEG", quality=quality, optimize=True)
+        image.save(save_file)
+    finally:
+        image.close()
+    return True
+
+
+class ImageService:
+    """이미지 처리 프로세스 풀 클래스"""
+
+    def __init__(self, max_workers: int = 0, max_pending: int = 64, timeout: int = 30):
+        """
+        Args:
+            max_workers (int, optional): 프로세스 수. 0이면 CPU 수. Defaults to 0.
+            max_pending (int, optional): 동시에 처리/대기할 수 있는 작업 수. Defaults to 64.
+            timeout (int, optional): 작업 대기 및 처리 제한시간 (초). Defaults to 30.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[Hashable, Future] = {}
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 (처음 사용할 때 생성합니다.)
+        - 스레드를 사용하는 부모 프로세스를 fork 하지 않도록 spawn 방식으로 생성합니다.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def submit(self, key: Hashable, func: Callable, *args, block: bool = True) -> Future:
+        """작업을 프로세스 풀에 등록합니다.
+        - 같은 key의 작업이 처리중이면 새로 등록하지 않고 처리중인 작업을 반환합니다.
+
+        Args:
+            key (Hashable): 작업 식별 키 (None이면 병합하지 않음)
+            func (Callable): 자식 프로세스에서 실행할 함수 (모듈 최상위 함수)
+            block (bool, optional): 대기 가능한 작업 수를 넘었을 때 기다릴지 여부. Defaults to True.
+
+        Raises:
+            ImageServiceBusy: 대기 가능한 작업 수를 넘은 상태가 제한시간 동안 계속된 경우
+
+        Returns:
+            Future: 작업 결과
+        """
+        with self._lock:
+            future = self._inflight.get(key) if key is not None else None
+        if future is not None:
+            return future
+
+        if not self._slots.acquire(blocking=block, timeout=self.timeout if block else None):
+            raise ImageServiceBusy("이미지 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요.")
+
+        with self._lock:
+            # 대기하는 동안 같은 작업이 등록된 경우
+            future = self._inflight.get(key) if key is not None else None
+            if future is not None:
+                self._slots.release()
+                return future
+            try:
+                try:
+                    future = self.executor.submit(func, *args)
+                except BrokenProcessPool:
+                    # 자식 프로세스가 비정상 종료된 경우 프로세스 풀을 다시 생성합니다.
+                    self.shutdown()
+                    future = self.executor.submit(func, *args)
+            except Exception:
+                self._slots.release()
+                raise
+            if key is not None:
+                self._inflight[key] = future
+
+        future.add_done_callback(lambda _: self._done(key, future))
+        return future
+
+    def _done(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if key is not None and self._inflight.get(key) is future:
+                del self._inflight[key]
+        self._slots.release()
+
+    def run(self, key: Hashable, func: Callable, *args):
+        """작업을 처리하고 결과를 반환합니다. (동기 함수, 스레드에서 사용)"""
+        return self.submit(key, func, *args).result(timeout=self.timeout)
+
+    async def run_async(self, key: Hashable, func: Callable, *args):
+        """작업을 처리하고 결과를 반환합니다. (비동기 함수, 이벤트 루프를 막지 않음)"""
+        try:
+            future = self.submit(key, func, *args, block=False)
+        except ImageServiceBusy:
+            # 대기 가능한 작업 수를 넘은 경우 이벤트 루프 밖에서 기다립니다.
+            future = await asyncio.to_thread(self.submit, key, func, *args)
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+
+    def thumbnail(self, source_file: str, thumbnail_file: str, width: int, height: int) -> str:
+        """섬네일 이미지를 생성합니다. (같은 섬네일 파일의 동시 요청은 한번만 생성)"""
+        key = ("thumbnail", thumbnail_file)
+        return self.run(key, create_thumbnail_file, source_file, thumbnail_file, width, height)
+
+    def thumbnail_nowait(self, source_file: str, thumbnail_file: str, width: int, height: int) -> Optional[str]:
+        """섬네일 이미지 생성을 등록하고 기다리지 않습니다. (요청 처리 중 사용)
+
+        Returns:
+            Optional[str]: 이미 생성된 경우 섬네일 이미지 파일 경로, 생성중이면 None
+        """
+        key = ("thumbnail", thumbnail_file)
+        try:
+            future = self.submit(key, create_thumbnail_file, source_file, thumbnail_file,
+                                 width, height, block=False)
+        except ImageServiceBusy:
+            return None
+        return future.result() if future.done() else None
+
+    async def save_upload_image(self, data: bytes, save_file: str, resize: Optional[Tuple[int, int]] = None,
+                                convert_jpeg: bool = False, quality: int = 80) -> bool:
+        """업로드 이미지를 저장합니다."""
+        return await self.run_async(("upload", save_file), save_upload_image,
+                                    data, save_file, resize, convert_jpeg, quality)
+
+    def shutdown(self) -> None:
+        """프로세스 풀을 종료합니다."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+image_service = ImageService(
+    max_workers=settings.IMAGE_PROCESS_WORKERS,
+    max_pending=settings.IMAGE_PROCESS_MAX_PENDING,
+    timeout=settings.IMAGE_PROCESS_TIMEOUT,
+)
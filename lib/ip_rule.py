@@ -0,0 +1,159 @@
+"""접근가능/접근차단 IP 규칙 모듈
+
+기본환경설정의 접근가능 IP(cf_possible_ip), 접근차단 IP(cf_intercept_ip) 목록을
+요청마다 정규식으로 변환하지 않도록 한번만 컴파일하여 재사용합니다.
+- 그누보드 규칙: 한 줄에 하나씩 입력하며 '+'는 숫자와 점(.)의 반복을 의미합니다.
+  예) 123.123.+ : 123.123. 으로 시작하는 모든 IP
+- CIDR 표기법(IPv4, IPv6)을 지원합니다.
+  예) 192.168.0.0/16, 2001:db8::/32
+- 목록 문자열이 같으면 컴파일한 규칙을 재사용하므로
+  기본환경설정이 변경된 경우에만 다시 컴파일합니다.
+"""
+import ipaddress
+import logging
+import re
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from cachetools import LRUCache, cached
+
+# 정규식 특수문자가 없는 IP 문자열 (IPv4, IPv6)
+LITERAL_PATTERN = re.compile(r"^[0-9A-Za-z.:%]*$")
+# '+'가 대체하는 문자
+WILDCARD_CHARS = frozenset("0123456789.")
+
+_TERMINAL = ""  # 접두사 트리에서 규칙의 끝을 표시하는 키 (IP 문자는 빈 문자열이 될 수 없음)
+
+
+class IpRuleSet:
+    """컴파일된 IP 규칙 목록 클래스
+
+    - 정확히 일치하는 IP: 집합(set)
+    - 끝이 '+'인 규칙(접두사): 문자 단위 접두사 트리 (IP 길이만큼만 탐색)
+    - CIDR: IP 버전별로 정렬 후 병합한 구간 목록 (이진 탐색)
+    - 그 외의 규칙('+'가 중간에 있는 경우 등): 하나로 합친 정규식
+    """
+
+    def __init__(self, ip_list: str):
+        """
+        Args:
+            ip_list (str): 줄바꿈으로 구분된 IP 규칙 목록
+        """
+        self.exact = set()
+        self.prefixes: Dict[str, dict] = {}
+        self.networks: Dict[int, Tuple[List[int], List[int]]] = {}
+        self.regex: Optional[re.Pattern] = None
+
+        ranges: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        regex_patterns = []
+        for rule in (ip_list or "").split("\n"):
+            rule = rule.strip()
+            if not rule:
+                continue
+            if "/" in rule:
+                try:
+                    network = ipaddress.ip_network(rule, strict=False)
+                except ValueError:
+                    logging.warning("잘못된 IP 규칙입니다: %s", rule)
+                    continue
+                ranges[network.version].append(
+                    (int(network.network_address), int(network.broadcast_address)))
+            elif LITERAL_PATTERN.match(rule):
+                self.exact.add(rule)
+            elif rule.endswith("+") and LITERAL_PATTERN.match(rule[:-1]):
+                self._add_prefix(rule[:-1])
+            else:
+                pattern = rule.replace(".", r"\.").replace("+", r"[0-9\.]+")
+                try:
+                    re.compile(pattern)
+                except re.error:
+                    logging.warning("잘못된 IP 규칙입니다: %s", rule)
+                    continue
+                regex_patterns.append(pattern)
+
+        for version, items in ranges.items():
+            if items:
+                self.networks[version] = self._merge_ranges(items)
+        if regex_patterns:
+            self.regex = re.compile("|".join(f"(?:{p})" for p in regex_patterns))
+
+    def __bool__(self) -> bool:
+        return bool(self.exact or self.prefixes or self.networks or self.regex)
+
+    def match(self, ip: str) -> bool:
+        """IP가 규칙 목록에 속하는지 확인합니다.
+
+        Args:
+            ip (str): IP
+
+        Returns:
+            bool: 규칙 목록에 속하면 True, 아니면 False
+        """
+        if ip in self.exact:
+            return True
+        if self.prefixes and self._match_prefix(ip):
+            return True
+        if self.networks and self._match_network(ip):
+            return True
+        if self.regex and self.regex.fullmatch(ip):
+            return True
+        return False
+
+    def _add_prefix(self, prefix: str) -> None:
+        node = self.prefixes
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = True
+
+    def _match_prefix(self, ip: str) -> bool:
+        """접두사 규칙 확인
+        - 접두사 뒤의 나머지 문자열이 숫자와 점(.)으로만 이루어져 있어야 합니다. ('+' 규칙)
+        """
+        # 숫자와 점(.)으로만 이루어진 가장 긴 끝 부분의 시작 위치
+        start = len(ip)
+        while start > 0 and ip[start - 1] in WILDCARD_CHARS:
+            start -= 1
+
+        node = self.prefixes
+        for index, char in enumerate(ip):
+            if index >= start and _TERMINAL in node:
+                return True
+            node = node.get(char)
+            if node is None:
+                return False
+        return False
+
+    def _match_network(self, ip: str) -> bool:
+        """CIDR 규칙 확인"""
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        ranges = self.networks.get(address.version)
+        if not ranges:
+            return False
+        starts, ends = ranges
+        value = int(address)
+        index = bisect_right(starts, value) - 1
+        return index >= 0 and value <= ends[index]
+
+    @staticmethod
+    def _merge_ranges(items: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        """겹치는 구간을 병합하여 (시작 목록, 끝 목록)을 반환합니다."""
+        starts, ends = [], []
+        for start, end in sorted(items):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
+
+
+@cached(LRUCache(maxsize=16), lock=threading.Lock())
+def get_ip_rules(ip_list: str) -> IpRuleSet:
+    """IP 규칙 목록을 컴파일하여 반환합니다.
+    - 같은 목록 문자열은 컴파일한 규칙을 재사용합니다.
+    """
+    return IpRuleSet(ip_list)
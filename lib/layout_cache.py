@@ -0,0 +1,122 @@
+"""레이아웃 데이터 캐시 모듈
+
+모든 페이지의 레이아웃(메뉴, 최신 설문조사, 인기검색어)에 출력하는 데이터를
+요청마다 조회하지 않도록 worker별 메모리에 보관합니다.
+- DB 세션에 바인딩된 ORM 객체가 아닌 읽기 전용 값 객체(LayoutSnapshot)로 보관하므로
+  요청이 끝난 후에도 안전하게 재사용할 수 있습니다.
+- 관리자 메뉴/설문조사 변경, 인기검색어 삭제에서만 invalidate()를 호출합니다.
+  검색할 때 등록되는 인기검색어는 무효화하지 않으며 보관시간(60초)이 지난 후 반영됩니다.
+- LAYOUT_CACHE_SHARED 설정을 사용하면 항목별 버전 파일의 수정시간(mtime)으로
+  다른 worker의 캐시도 무효화합니다. (사용하지 않으면 다른 worker는 보관시간이 지난 후 반영)
+"""
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from core.settings import settings
+
+# 캐시 항목
+LAYOUT_MENUS = "menus"
+LAYOUT_POLL = "poll"
+LAYOUT_POPULARS = "populars"
+
+
+class LayoutSnapshot:
+    """레이아웃 데이터의 읽기 전용 값 객체
+    - ORM 객체와 같은 속성 이름으로 접근합니다.
+    """
+
+    def __init__(self, **values: Any) -> None:
+        self.__dict__.update(values)
+
+    @classmethod
+    def from_model(cls, instance: Any, **extra: Any) -> "LayoutSnapshot":
+        """ORM 객체의 컬럼 값으로 스냅샷을 생성합니다."""
+        values = {column.key: getattr(instance, column.key) for column in instance.__table__.columns}
+        return cls(**values, **extra)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("레이아웃 데이터는 수정할 수 없습니다.")
+
+    def __delattr__(self, name):
+        raise AttributeError("레이아웃 데이터는 수정할 수 없습니다.")
+
+    def __repr__(self) -> str:
+        return f"<LayoutSnapshot {self.__dict__}>"
+
+
+class LayoutCache:
+    """레이아웃 데이터 캐시 클래스"""
+    version_dir = os.path.join("data", "layout_cache")
+
+    def __init__(self, max_age: int = 600, shared: bool = True):
+        """
+        Args:
+            max_age (int, optional): 최대 보관시간 (초). Defaults to 600.
+            shared (bool, optional): 버전 파일로 다른 worker의 캐시 무효화. Defaults to True.
+        """
+        self.max_age = max_age
+        self.shared = shared
+        # (항목, 키) → (버전, 적재시간, 데이터)
+        self._entries: Dict[Tuple[str, Hashable], Tuple[int, float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_version(self, name: str) -> int:
+        """항목별 버전 파일의 수정시간(ns)을 반환합니다. (공유하지 않으면 0)"""
+        if not self.shared:
+            return 0
+        try:
+            return os.stat(os.path.join(self.version_dir, name)).st_mtime_ns
+        except OSError:
+            return 0
+
+    def get(self, name: str, loader: Callable[[], Any],
+            key: Hashable = None, ttl: Optional[int] = None) -> Any:
+        """캐시된 데이터를 반환합니다. 없거나 무효화된 경우 loader()로 다시 조회합니다.
+
+        Args:
+            name (str): 캐시 항목 (LAYOUT_MENUS, LAYOUT_POLL, LAYOUT_POPULARS)
+            loader (Callable[[], Any]): 데이터 조회 함수 (세션에 바인딩되지 않은 데이터를 반환)
+            key (Hashable, optional): 같은 항목의 조회 조건. Defaults to None.
+            ttl (Optional[int], optional): 보관시간 (초). Defaults to None. (최대 보관시간)
+
+        Returns:
+            Any: 캐시된 데이터
+        """
+        version = self.get_version(name)
+        max_age = min(ttl, self.max_age) if ttl else self.max_age
+        entry = self._entries.get((name, key))
+        if entry and entry[0] == version and time.monotonic() - entry[1] < max_age:
+            return entry[2]
+
+        value = loader()
+        with self._lock:
+            self._entries[(name, key)] = (version, time.monotonic(), value)
+        return value
+
+    def invalidate(self, name: str) -> None:
+        """항목의 캐시를 무효화합니다. (공유 설정시 다른 worker 포함)
+
+        Args:
+            name (str): 캐시 항목
+        """
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == name]:
+                del self._entries[entry_key]
+
+        if self.shared:
+            os.makedirs(self.version_dir, exist_ok=True)
+            with open(os.path.join(self.version_dir, name), "w", encoding="utf-8") as f:
+                f.write(str(time.time_ns()))
+
+    def clear(self) -> None:
+        """현재 worker의 캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+
+
+layout_cache = LayoutCache(
+    max_age=settings.LAYOUT_CACHE_TTL,
+    shared=settings.LAYOUT_CACHE_SHARED,
+)
@@ -0,0 +1,209 @@
+"""회원 정보 캐시 모듈
+
+로그인 세션/JWT 인증 시 요청마다 회원 테이블을 조회하지 않도록
+회원아이디별 회원 정보를 worker별 메모리에 짧은 시간 동안 보관합니다.
+- 세션에 바인딩되지 않은(detached) 회원 정보의 복사본을 보관하고,
+  조회할 때 현재 DB 세션에 쿼리 없이 병합(merge)하여 반환합니다.
+  (반환된 회원 정보를 수정하고 commit 하면 기존처럼 저장됩니다.)
+- 존재하지 않는 회원아이디도 보관하여 반복 조회하지 않습니다. (MEMBER_CACHE_NEGATIVE)
+- 회원 정보가 ORM 또는 일괄 처리 쿼리로 추가/수정/삭제되면 commit 후 캐시를 무효화합니다.
+  (회원정보 수정, 탈퇴, 차단, 권한 변경 등은 invalidate()를 직접 호출합니다.)
+- 버전 파일의 수정시간(mtime)으로 다른 worker의 캐시도 무효화합니다.
+  - 회원아이디를 해시한 버킷별 버전 파일을 사용하므로
+    한 회원을 무효화하면 다른 worker에서도 같은 버킷의 회원만 다시 조회합니다.
+  - 전체 무효화는 전체 버전 파일(version)을 사용합니다.
+"""
+import os
+import threading
+import time
+import zlib
+from typing import Callable, Optional, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+
+from core.models import Member
+from core.settings import settings
+
+# 존재하지 않는 회원아이디를 표시하는 값
+_NOT_FOUND = object()
+# 전체 무효화를 표시하는 값
+_ALL = "*"
+
+
+class MemberCache:
+    """회원 정보 캐시 클래스"""
+    version_dir = os.path.join("data", "member_cache")
+    version_path = os.path.join(version_dir, "version")
+    # 회원별 버전 파일 버킷 수
+    buckets = 256
+
+    def __init__(self, ttl: int = 10, maxsize: int = 10000, negative: bool = True):
+        """
+        Args:
+            ttl (int, optional): 보관시간 (초). 0 이하이면 사용하지 않습니다. Defaults to 10.
+            maxsize (int, optional): 보관할 회원 수. Defaults to 10000.
+            negative (bool, optional): 존재하지 않는 회원아이디 보관. Defaults to True.
+        """
+        self.ttl = ttl
+        self.negative = negative
+        self._members = TTLCache(maxsize=maxsize, ttl=max(ttl, 1))
+        self._version = self.get_version()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stat_version(path: str) -> int:
+        """버전 파일의 수정시간(ns)을 반환합니다. 파일이 없으면 0"""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _touch_version(path: str) -> None:
+        """버전 파일의 수정시간을 갱신합니다."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+
+    def get_version(self) -> int:
+        """전체 버전 파일의 수정시간(ns)을 반환합니다."""
+        return self._stat_version(self.version_path)
+
+    def get_bucket_path(self, mb_id: str) -> str:
+        """회원아이디의 버킷 버전 파일 경로를 반환합니다."""
+        bucket = zlib.crc32(mb_id.encode("utf-8")) % self.buckets
+        return os.path.join(self.version_dir, f"bucket_{bucket}")
+
+    def get(self, db: Session, mb_id: str, loader: Callable[[], Optional[Member]]) -> Optional[Member]:
+        """회원 정보를 반환합니다. 없거나 만료된 경우 loader()로 다시 조회합니다.
+
+        Args:
+            db (Session): 회원 정보를 병합할 DB 세션
+            mb_id (str): 회원아이디
+            loader (Callable[[], Optional[Member]]): 회원 정보 조회 함수
+
+        Returns:
+            Optional[Member]: 현재 DB 세션에 병합된 회원 정보. 없으면 None
+        """
+        if self.ttl <= 0 or not mb_id:
+            return loader()
+
+        version = self.get_version()
+        bucket_version = self._stat_version(self.get_bucket_path(mb_id))
+        with self._lock:
+            if version != self._version:
+                self._members.clear()
+                self._version = version
+            entry: Optional[Tuple[object, int]] = self._members.get(mb_id)
+        # 다른 worker에서 같은 버킷의 회원이 변경된 경우 다시 조회합니다.
+        snapshot = entry[0] if entry and entry[1] == bucket_version else None
+
+        if snapshot is _NOT_FOUND:
+            return None
+        if snapshot is not None:
+            return db.merge(snapshot, load=False)
+
+        member = loader()
+        if member is not None:
+            snapshot = self._snapshot(member)
+        elif self.negative:
+            snapshot = _NOT_FOUND
+        if snapshot is not None:
+            with self._lock:
+                if version == self._version:
+                    self._members[mb_id] = (snapshot, bucket_version)
+        return member
+
+    def invalidate(self, mb_id: Optional[str] = None) -> None:
+        """회원 정보 캐시를 무효화합니다. (다른 worker 포함)
+
+        Args:
+            mb_id (Optional[str], optional): 회원아이디. Defaults to None. (전체)
+        """
+        with self._lock:
+            if mb_id is None:
+                self._members.clear()
+            else:
+                self._members.pop(mb_id, None)
+
+        if self.ttl <= 0:
+            return
+        if mb_id is None:
+            self._touch_version(self.version_path)
+            with self._lock:
+                self._version = self.get_version()
+        else:
+            self._touch_version(self.get_bucket_path(mb_id))
+
+    @staticmethod
+    def _snapshot(member: Member) -> Member:
+        """세션에 바인딩되지 않은 회원 정보의 복사본을 생성합니다."""
+        snapshot = Member(**{
+            attr.key: getattr(member, attr.key) for attr in inspect(Member).column_attrs
+        })
+        make_transient_to_detached(snapshot)
+        return snapshot
+
+
+member_cache = MemberCache(
+    ttl=settings.MEMBER_CACHE_TTL,
+    maxsize=settings.MEMBER_CACHE_SIZE,
+    negative=settings.MEMBER_CACHE_NEGATIVE,
+)
+
+# 세션의 commit 후 무효화할 회원아이디 목록을 보관하는 session.info 키
+_PENDING_MEMBERS_KEY = "member_cache_ids"
+
+
+def _mark_member_changed(mapper, connection, target: Member) -> None:
+    """회원 정보 추가/수정/삭제 시 commit 후 무효화할 회원으로 기록"""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_MEMBERS_KEY, set()).add(target.mb_id)
+
+
+def _mark_bulk_changed(orm_execute_state) -> None:
+    """회원 테이블을 일괄 수정/삭제하는 쿼리는 commit 후 무효화할 회원으로 기록
+    - 한 회원만 수정하는 쿼리는 execution_options(mb_id=회원아이디)로 지정합니다.
+      지정하지 않으면 전체를 무효화합니다.
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) == Member.__tablename__:
+        mb_id = orm_execute_state.execution_options.get("mb_id") or _ALL
+        orm_execute_state.session.info.setdefault(_PENDING_MEMBERS_KEY, set()).add(mb_id)
+
+
+def _after_commit(session: Session) -> None:
+    """commit 후 변경된 회원 정보 캐시를 무효화"""
+    mb_ids = session.info.pop(_PENDING_MEMBERS_KEY, None)
+    if not mb_ids:
+        return
+    if _ALL in mb_ids:
+        member_cache.invalidate()
+    else:
+        for mb_id in mb_ids:
+            member_cache.invalidate(mb_id)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_MEMBERS_KEY, None)
+
+
+def register_member_cache_invalidation() -> None:
+    """회원 모델에 회원 정보 캐시 무효화 이벤트를 등록합니다."""
+    for identifier in ("after_insert", "after_update", "after_delete"):
+        if not event.contains(Member, identifier, _mark_member_changed):
+            event.listen(Member, identifier, _mark_member_changed)
+    if not event.contains(Session, "do_orm_execute", _mark_bulk_changed):
+        event.listen(Session, "do_orm_execute", _mark_bulk_changed)
+    if not event.contains(Session, "after_commit", _after_commit):
+        event.listen(Session, "after_commit", _after_commit)
+    if not event.contains(Session, "after_rollback", _after_rollback):
+        event.listen(Session, "after_rollback", _after_rollback)
+
+
+register_member_cache_invalidation()
@@ -0,0 +1,84 @@
+"""비밀번호 암호화/검증 모듈
+
+PBKDF2 비밀번호 검증은 CPU 비용이 큰 작업이므로
+비동기 라우터(로그인 등)에서 직접 실행하면 검증하는 동안 이벤트 루프가 멈춥니다.
+- 검증은 크기가 제한된 스레드 풀에서 실행합니다.
+  (hashlib.pbkdf2_hmac은 실행 중 GIL을 해제하므로 여러 스레드에서 동시에 실행됩니다.)
+- 비밀번호 형식은 lib/pbkdf2.py 와 같습니다. (그누보드5 호환)
+- 로그인할 때 저장된 비밀번호의 반복 횟수가 설정(PASSWORD_HASH_ITERATIONS)보다 낮으면
+  설정한 반복 횟수로 다시 암호화하여 저장합니다.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from core.settings import settings
+from lib.pbkdf2 import (
+    PBKDF2_COMPAT_ITERATIONS, create_hash, needs_upgrade, validate_password
+)
+
+
+class PasswordHasher:
+    """비밀번호 암호화/검증 클래스"""
+
+    def __init__(self, iterations: int = PBKDF2_COMPAT_ITERATIONS, max_workers: int = 4):
+        """
+        Args:
+            iterations (int, optional): 암호화 반복 횟수. Defaults to PBKDF2_COMPAT_ITERATIONS.
+            max_workers (int, optional): 검증 스레드 수. Defaults to 4.
+        """
+        self.iterations = max(iterations, 1)
+        self.max_workers = max(max_workers, 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """스레드 풀 (처음 사용할 때 생성합니다.)"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="password_hasher")
+        return self._executor
+
+    def hash(self, password: str) -> str:
+        """비밀번호를 설정한 반복 횟수로 암호화합니다."""
+        return create_hash(password, iterations=self.iterations)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """비밀번호를 검증합니다."""
+        if not hashed_password:
+            return False
+        try:
+            return validate_password(password, hashed_password)
+        except (ValueError, TypeError):
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 비밀번호를 다시 암호화해야 하는지 확인합니다."""
+        return needs_upgrade(hashed_password or "", self.iterations)
+
+    async def hash_async(self, password: str) -> str:
+        """hash()를 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.hash, password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """verify()를 스레드 풀에서 실행합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.verify, password, hashed_password)
+
+    def shutdown(self) -> None:
+        """스레드 풀을 종료합니다."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher(
+    iterations=settings.PASSWORD_HASH_ITERATIONS,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+)
@@ -11,10 +11,10 @@ PBKDF2_COMPAT_SALT_BYTES = 24
 PBKDF2_COMPAT_HASH_BYTES = 24
 
 
-def create_hash(password, force_compat=False):
+def create_hash(password, force_compat=False, iterations=None):
     salt = base64.b64encode(os.urandom(PBKDF2_COMPAT_SALT_BYTES)).decode('utf-8')
     algo = PBKDF2_COMPAT_HASH_ALGORITHM.lower()
-    iterations = PBKDF2_COMPAT_ITERATIONS
+    iterations = iterations or PBKDF2_COMPAT_ITERATIONS
     
     pbkdf2 = pbkdf2_default(algo, password, salt, iterations, PBKDF2_COMPAT_HASH_BYTES)
     return f"{algo}:{iterations}:{salt}:{base64.b64encode(pbkdf2).decode('utf-8')}"
@@ -29,22 +29,25 @@ def validate_password(password, hash):
     return slow_equals(pbkdf2, pbkdf2_check)
 
 def slow_equals(a, b):
-    diff = len(a) ^ len(b)
-    for char_a, char_b in zip(a, b):
-        # If the inputs are strings, convert characters to ASCII values
-        val_a = ord(char_a) if isinstance(char_a, str) else char_a
-        val_b = ord(char_b) if isinstance(char_b, str) else char_b
-        
-        diff |= val_a ^ val_b
-    return diff == 0
+    # Constant-time comparison (hmac.compare_digest)
+    if isinstance(a, str):
+        a = a.encode('utf-8')
+    if isinstance(b, str):
+        b = b.encode('utf-8')
+    return hmac.compare_digest(a, b)
 
-def needs_upgrade(hash):
+def needs_upgrade(hash, iterations=PBKDF2_COMPAT_ITERATIONS):
     params = hash.split(':')
     if len(params) < 4:
         return True
     
-    # You can add more conditions to check if the hash needs an upgrade
-    return False
+    # Upgrade if the algorithm differs or the iteration count is lower than required
+    if params[0].lower() != PBKDF2_COMPAT_HASH_ALGORITHM.lower():
+        return True
+    try:
+        return int(params[1]) < iterations
+    except ValueError:
+        return True
 
 def pbkdf2_default(algo, password, salt, count, key_length):
     if count <= 0 or key_length <= 0:
@@ -63,6 +66,12 @@ def pbkdf2_default(algo, password, salt, count, key_length):
         else:
             raise ValueError('PBKDF2 ERROR: Hash algorithm not supported.')
     
+    # Native implementation (OpenSSL), same output as the loop below
+    try:
+        return hashlib.pbkdf2_hmac(algo, password.encode(), salt, count, key_length)
+    except ValueError:
+        pass
+
     hash_length = len(hashlib.new(algo).digest())
     block_count = ceil(key_length / hash_length)
     
@@ -0,0 +1,216 @@
+"""현재 접속자 추적 모듈
+
+요청마다 현재 접속자 테이블(Login)을 조회/수정/삭제하지 않도록
+worker별 메모리에 접속자 정보(IP → 회원아이디, 위치, 최근 접속시간)를 보관합니다.
+- 일정 시간(CURRENT_CONNECT_SYNC_INTERVAL)마다 변경된 접속자를 한번에 테이블에 저장하고,
+  다른 worker의 접속자를 포함한 전체 접속자 목록을 다시 읽어옵니다.
+- 현재 접속자 수는 메모리에서 계산합니다. (다른 worker의 접속자는 최대 저장 간격만큼 늦게 반영)
+- 접속 유지시간(cf_login_minutes)이 지난 접속자는 메모리에서 제외하고,
+  테이블의 오래된 접속자는 스케줄러(lib/scheduler/scheduled_jobs/interval_schedules.py)가 삭제합니다.
+"""
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from cachetools import TTLCache
+from filelock import FileLock
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Login
+from core.settings import settings
+from lib.config_cache import config_cache
+
+
+class PresenceEntry(NamedTuple):
+    """접속자 정보"""
+    mb_id: str
+    path: str
+    last_seen: datetime
+
+
+class PresenceTracker:
+    """현재 접속자 추적 클래스"""
+    lock_file_path = os.path.join("data", "current_connect.lock")
+
+    def __init__(self, sync_interval: int = 5):
+        """
+        Args:
+            sync_interval (int, optional): 테이블 저장 간격 (초). Defaults to 5.
+        """
+        self.sync_interval = sync_interval
+        # 접속 유지시간 (분). 접속자 수를 계산할 때 기본환경설정 값으로 갱신됩니다.
+        self.login_minutes = 10
+        # 현재 worker의 접속자
+        self._local: Dict[str, PresenceEntry] = {}
+        self._dirty: Set[str] = set()
+        # 테이블에서 읽어온 전체 worker의 접속자 (IP → (회원아이디, 최근 접속시간))
+        self._shared: Dict[str, Tuple[str, datetime]] = {}
+        # 접속자 수 계산 결과는 1초 동안 재사용합니다.
+        self._counts = TTLCache(maxsize=16, ttl=1)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def touch(self, ip: str, mb_id: str, path: str) -> None:
+        """접속자 정보를 갱신합니다.
+
+        Args:
+            ip (str): 접속 IP
+            mb_id (str): 회원아이디 (비회원은 빈 문자열)
+            path (str): 접속 위치(경로)
+        """
+        with self._lock:
+            self._local[ip] = PresenceEntry(mb_id or "", path, datetime.now())
+            self._dirty.add(ip)
+        self.start()
+
+    def count(self, login_minutes: int, admin: str, only_member: bool = False) -> int:
+        """현재 접속자 수를 반환합니다. (최고관리자 제외)
+
+        Args:
+            login_minutes (int): 접속 유지시간 (분)
+            admin (str): 최고관리자 아이디
+            only_member (bool, optional): 회원만 계산. Defaults to False.
+
+        Returns:
+            int: 현재 접속자 수
+        """
+        self.login_minutes = login_minutes
+        key = (login_minutes, admin, only_member)
+        count = self._counts.get(key)
+        if count is not None:
+            return count
+
+        base_date = datetime.now() - timedelta(minutes=login_minutes)
+        with self._lock:
+            connects = dict(self._shared)
+            connects.update((ip, (entry.mb_id, entry.last_seen)) for ip, entry in self._local.items())
+        count = sum(
+            1 for ip, (mb_id, last_seen) in connects.items()
+            if ip and mb_id != admin and last_seen > base_date and (mb_id or not only_member)
+        )
+        self._counts[key] = count
+        return count
+
+    def sync(self) -> int:
+        """변경된 접속자 정보를 테이블에 저장하고, 전체 접속자 목록을 다시 읽어옵니다.
+
+        Returns:
+            int: 저장한 접속자 수
+        """
+        with self._sync_lock:
+            with self._lock:
+                entries = {ip: self._local[ip] for ip in self._dirty}
+                self._dirty.clear()
+
+            try:
+                with DBConnect().sessionLocal() as db:
+                    if entries:
+                        with FileLock(self.lock_file_path, timeout=30):
+                            self._save(db, entries)
+                    shared = self._load(db)
+            except Exception as e:
+                logging.error("현재 접속자 저장 실패: %s건", len(entries), exc_info=e)
+                # 저장하지 못한 접속자는 다음 저장 때 다시 저장합니다.
+                with self._lock:
+                    self._dirty.update(ip for ip, entry in entries.items() if self._local.get(ip) == entry)
+                return 0
+
+            base_date = datetime.now() - timedelta(minutes=self.login_minutes)
+            with self._lock:
+                self._shared = shared
+                for ip in [ip for ip, entry in self._local.items() if entry.last_seen < base_date]:
+                    if ip not in self._dirty:
+                        del self._local[ip]
+            return len(entries)
+
+    def _save(self, db: Session, entries: Dict[str, PresenceEntry]) -> None:
+        """접속자 정보를 한번에 수정/추가합니다."""
+        ips = list(entries)
+        exists_ips = set()
+        for i in range(0, len(ips), 500):
+            exists_ips.update(db.scalars(
+                select(Login.lo_ip).where(Login.lo_ip.in_(ips[i:i + 500]))
+            ).all())
+
+        updates: List[dict] = []
+        inserts: List[dict] = []
+        for ip, entry in entries.items():
+            values = {
+                "mb_id": entry.mb_id,
+                "lo_datetime": entry.last_seen,
+                "lo_location": entry.path,
+                "lo_url": entry.path,
+            }
+            if ip in exists_ips:
+                updates.append({"b_ip": ip, **{f"b_{k}": v for k, v in values.items()}})
+            else:
+                inserts.append({"lo_ip": ip, **values})
+
+        if updates:
+            table = Login.__table__
+            db.execute(
+                update(table).where(table.c.lo_ip == bindparam("b_ip"))
+                .values({key: bindparam(f"b_{key}") for key in
+                         ("mb_id", "lo_datetime", "lo_location", "lo_url")}),
+                updates
+            )
+        if inserts:
+            db.execute(insert(Login), inserts)
+        db.commit()
+
+    def _load(self, db: Session) -> Dict[str, Tuple[str, datetime]]:
+        """접속 유지시간 이내의 전체 접속자를 읽어옵니다."""
+        base_date = datetime.now() - timedelta(minutes=self.login_minutes)
+        rows = db.execute(
+            select(Login.lo_ip, Login.mb_id, Login.lo_datetime)
+            .where(Login.lo_datetime > base_date)
+        ).all()
+        return {ip: (mb_id, lo_datetime) for ip, mb_id, lo_datetime in rows}
+
+    def start(self) -> None:
+        """저장 스레드를 시작합니다. (처음 접속할 때 시작)"""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="presence_tracker", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """저장 스레드를 종료하고 변경된 접속자 정보를 저장합니다. (서버 종료)"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._wakeup.set()
+            thread.join(timeout=self.sync_interval)
+            self.sync()
+
+    def _run(self) -> None:
+        while self._thread is threading.current_thread():
+            self._wakeup.wait(self.sync_interval)
+            self._wakeup.clear()
+            self.sync()
+
+
+def delete_current_connect_job() -> None:
+    """접속 유지시간이 지난 현재 접속자 삭제 예약 작업"""
+    try:
+        with DBConnect().sessionLocal() as db:
+            config = config_cache.get(db)
+            login_minutes = getattr(config, "cf_login_minutes", 10)
+            db.execute(
+                delete(Login)
+                .where(Login.lo_datetime < datetime.now() - timedelta(minutes=login_minutes))
+            )
+            db.commit()
+    except Exception as e:
+        logging.error("현재 접속자 삭제 실패", exc_info=e)
+
+
+presence_tracker = PresenceTracker(sync_interval=settings.CURRENT_CONNECT_SYNC_INTERVAL)
@@ -1,4 +1,5 @@
 from lib.common import delete_old_records
+from service.point_service import expire_points_job
 
 
 cron_jobs = [
@@ -7,6 +8,11 @@ cron_jobs = [
         'job_func': delete_old_records,
         'expression': {'hour': 5, 'minute': 30, 'second': 0}
     },
+    {
+        'job_id': 'cron_point_expire',
+        'job_func': expire_points_job,
+        'expression': {'hour': 0, 'minute': 5, 'second': 0}
+    },
 ]
 
 
@@ -1,7 +1,9 @@
 """
 주석된 부분은 스케줄 작업을 등록하는 예시입니다.
 """
-# from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from lib.visit_rollup import update_visit_rollup_job
 
 # def print_date_job():
 #     print("Date job running", datetime.now())
@@ -12,4 +14,10 @@ date_jobs = [
     #     'job_func': print_date_job,
     #     'expression': {'run_date': datetime(2024, 2, 27, 11, 31, 10)}
     # },
+    {
+        # 이전 방문자 이력의 집계가 없으면 서버 시작 후 한번 생성합니다.
+        'job_id': 'date_visit_rollup_backfill',
+        'job_func': update_visit_rollup_job,
+        'expression': {'run_date': datetime.now(timezone.utc) + timedelta(seconds=30)}
+    },
 ]
\ No newline at end of file
@@ -4,6 +4,10 @@
 
 #from datetime import datetime
 
+from lib.presence_tracker import delete_current_connect_job
+from lib.session_store import delete_expired_sessions_job
+from lib.visit_rollup import update_visit_rollup_job
+
 
 # def interval_print_date_time():
 #     print(f"interval print: {datetime.now()}")
@@ -14,4 +18,19 @@ interval_jobs = [
     #     'job_func': interval_print_date_time,
     #     'expression': {'seconds': 2}
     # },
-]
\ No newline at end of file
+    {
+        'job_id': 'interval_visit_rollup',
+        'job_func': update_visit_rollup_job,
+        'expression': {'minutes': 10}
+    },
+    {
+        'job_id': 'interval_current_connect',
+        'job_func': delete_current_connect_job,
+        'expression': {'minutes': 1}
+    },
+    {
+        'job_id': 'interval_expired_sessions',
+        'job_func': delete_expired_sessions_job,
+        'expression': {'minutes': 10}
+    },
+]
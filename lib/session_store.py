@@ -0,0 +1,281 @@
+"""서버 세션 저장소 모듈
+
+세션 데이터를 쿠키에 서명하여 저장하지 않고 서버의 저장소에 보관합니다.
+쿠키에는 임의의 세션 아이디만 저장하므로 세션에 저장하는 값이 늘어도 쿠키 크기는 같습니다.
+- SESSION_BACKEND 설정으로 저장소를 선택합니다.
+  - cookie: 서명된 쿠키에 저장 (Starlette SessionMiddleware, 기본값)
+  - memory: worker별 메모리에 저장 (worker가 1개인 경우에만 사용)
+  - sqlite: data/session.db 파일에 저장 (같은 서버의 worker 간 공유)
+  - redis: Redis 프로토콜 호환 서버에 저장 (SESSION_REDIS_URL, 여러 서버 간 공유)
+- 세션 데이터는 JSON 으로 저장하며, 보관시간(TTL)이 지난 세션은 조회되지 않습니다.
+- 만료된 세션은 스케줄러(lib/scheduler/scheduled_jobs/interval_schedules.py)가 삭제합니다.
+"""
+import abc
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from cachetools import TTLCache
+
+from core.settings import settings
+
+# (세션 데이터, 만료시간(timestamp))
+SessionRecord = Tuple[Dict[str, Any], float]
+
+
+class SessionStore(metaclass=abc.ABCMeta):
+    """세션 저장소 기본 클래스"""
+    # 저장소 조회/저장이 블로킹 I/O 인지 여부 (True 이면 스레드풀에서 실행)
+    blocking = True
+
+    @abc.abstractmethod
+    def load(self, session_id: str) -> Optional[SessionRecord]:
+        """세션을 조회합니다. 없거나 만료된 경우 None을 반환합니다."""
+
+    @abc.abstractmethod
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        """세션을 저장합니다. (만료시간: 현재 + ttl초)"""
+
+    @abc.abstractmethod
+    def delete(self, session_id: str) -> None:
+        """세션을 삭제합니다."""
+
+    def cleanup(self) -> int:
+        """만료된 세션을 삭제하고 삭제한 세션 수를 반환합니다."""
+        return 0
+
+
+class MemorySessionStore(SessionStore):
+    """worker별 메모리 세션 저장소"""
+    blocking = False
+
+    def __init__(self, max_age: int, maxsize: int = 100000):
+        """
+        Args:
+            max_age (int): 세션 최대 보관시간 (초)
+            maxsize (int, optional): 보관할 세션 수. Defaults to 100000.
+        """
+        self._sessions = TTLCache(maxsize=maxsize, ttl=max_age)
+        self._lock = threading.Lock()
+
+    def load(self, session_id: str) -> Optional[SessionRecord]:
+        with self._lock:
+            record = self._sessions.get(session_id)
+        if not record or record[1] < time.time():
+            return None
+        return json.loads(record[0]), record[1]
+
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        with self._lock:
+            self._sessions[session_id] = (json.dumps(data), time.time() + ttl)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def cleanup(self) -> int:
+        with self._lock:
+            count = len(self._sessions)
+            self._sessions.expire()
+            return count - len(self._sessions)
+
+
+class SqliteSessionStore(SessionStore):
+    """SQLite 파일 세션 저장소"""
+
+    def __init__(self, path: str = os.path.join("data", "session.db")):
+        """
+        Args:
+            path (str, optional): SQLite 파일 경로. Defaults to "data/session.db".
+        """
+        self.path = path
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환합니다. (처음 연결할 때 테이블 생성)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._init_lock:
+                if not self._initialized:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS session"
+                        " (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)")
+                    connection.execute(
+                        "CREATE INDEX IF NOT EXISTS session_expires ON session (expires)")
+                    self._initialized = True
+            self._local.connection = connection
+        return connection
+
+    def load(self, session_id: str) -> Optional[SessionRecord]:
+        row = self._connection().execute(
+            "SELECT data, expires FROM session WHERE id = ? AND expires > ?",
+            (session_id, time.time())
+        ).fetchone()
+        if not row:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO session (id, data, expires) VALUES (?, ?, ?)",
+            (session_id, json.dumps(data), time.time() + ttl)
+        )
+
+    def delete(self, session_id: str) -> None:
+        self._connection().execute("DELETE FROM session WHERE id = ?", (session_id,))
+
+    def cleanup(self) -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM session WHERE expires <= ?", (time.time(),))
+        return cursor.rowcount
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 프로토콜(RESP) 호환 서버 세션 저장소
+    - GET, SET(EX), DEL 명령만 사용하므로 Redis, Valkey, KeyDB 등에서 사용할 수 있습니다.
+    - 만료된 세션은 서버가 삭제합니다. (EX)
+    """
+    key_prefix = "g6:session:"
+
+    def __init__(self, url: str = "redis://localhost:6379/0", timeout: float = 5.0):
+        """
+        Args:
+            url (str, optional): 접속 URL (redis://[:비밀번호@]호스트:포트/DB번호).
+                Defaults to "redis://localhost:6379/0".
+            timeout (float, optional): 접속/응답 대기시간 (초). Defaults to 5.0.
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.strip("/") or 0)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def load(self, session_id: str) -> Optional[SessionRecord]:
+        value = self._command("GET", self.key_prefix + session_id)
+        if not value:
+            return None
+        record = json.loads(value)
+        return record["data"], record["expires"]
+
+    def save(self, session_id: str, data: Dict[str, Any], ttl: int) -> None:
+        value = json.dumps({"data": data, "expires": time.time() + ttl})
+        self._command("SET", self.key_prefix + session_id, value, "EX", str(ttl))
+
+    def delete(self, session_id: str) -> None:
+        self._command("DEL", self.key_prefix + session_id)
+
+    def _command(self, *args: str) -> Any:
+        """명령을 실행하고 응답을 반환합니다. 연결이 끊어진 경우 한번 다시 연결합니다."""
+        for retry in (False, True):
+            try:
+                return self._execute(self._connection(), args)
+            except (ConnectionError, OSError):
+                self._close()
+                if retry:
+                    raise
+
+    def _connection(self):
+        """스레드별 연결을 반환합니다."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            connection = (sock, sock.makefile("rb"))
+            self._local.connection = connection
+            if self.password:
+                auth = ("AUTH", self.username, self.password) if self.username else ("AUTH", self.password)
+                self._execute(connection, auth)
+            if self.db:
+                self._execute(connection, ("SELECT", str(self.db)))
+        return connection
+
+    def _close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection:
+            try:
+                connection[1].close()
+                connection[0].close()
+            except OSError:
+                pass
+
+    def _execute(self, connection, args) -> Any:
+        sock, reader = connection
+        payload = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg.encode("utf-8")
+            payload.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+        sock.sendall(b"".join(payload))
+        return self._read_reply(reader)
+
+    def _read_reply(self, reader) -> Any:
+        line = reader.readline()
+        if not line:
+            raise ConnectionError("세션 저장소 연결이 끊어졌습니다.")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            raise RuntimeError(f"세션 저장소 오류: {body.decode()}")
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            return reader.read(length + 2)[:-2].decode("utf-8")
+        if prefix == b"*":
+            length = int(body)
+            return None if length < 0 else [self._read_reply(reader) for _ in range(length)]
+        raise ConnectionError("세션 저장소 응답을 해석할 수 없습니다.")
+
+
+def create_session_store(backend: str, max_age: int) -> Optional[SessionStore]:
+    """설정에 따라 세션 저장소를 생성합니다.
+
+    Args:
+        backend (str): 저장소 종류 (cookie, memory, sqlite, redis)
+        max_age (int): 세션 최대 보관시간 (초)
+
+    Returns:
+        Optional[SessionStore]: 세션 저장소. cookie 인 경우 None
+    """
+    backend = (backend or "cookie").lower()
+    if backend == "memory":
+        return MemorySessionStore(max_age)
+    if backend == "sqlite":
+        return SqliteSessionStore()
+    if backend == "redis":
+        return RedisSessionStore(settings.SESSION_REDIS_URL)
+    if backend != "cookie":
+        logging.warning("지원하지 않는 세션 저장소입니다: %s (cookie 사용)", backend)
+    return None
+
+
+SESSION_MAX_AGE = 60 * 60 * 3  # 세션 최대 보관시간 (초)
+
+session_store = create_session_store(settings.SESSION_BACKEND, SESSION_MAX_AGE)
+
+
+def delete_expired_sessions_job() -> None:
+    """만료된 세션 삭제 예약 작업"""
+    if session_store is None:
+        return
+    try:
+        session_store.cleanup()
+    except Exception as e:
+        logging.error("만료된 세션 삭제 실패", exc_info=e)
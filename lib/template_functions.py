@@ -321,6 +321,39 @@ def get_paging(request: Request,
     return '<div class="pagination">' + ''.join(page_links) + '</div>'
 
 
+def get_cursor_paging(request: Request,
+                      prev_cursor: str = None, next_cursor: str = None,
+                      add_url: str = ""):
+    """커서(seek) 페이징 출력 함수
+    - 전체 페이지 번호 대신 처음/이전/다음 링크만 출력합니다.
+
+    Args:
+        request (Request): FastAPI Request 객체
+        prev_cursor (str, optional): 이전 페이지 커서. Defaults to None.
+        next_cursor (str, optional): 다음 페이지 커서. Defaults to None.
+        add_url (str, optional): 페이지 링크의 추가 URL. Defaults to "".
+
+    Returns:
+        str: 페이징 HTML 코드
+    """
+    url_prefix = request.url
+    page_links = []
+
+    if request.query_params.get("cursor"):
+        start_url = f"{url_prefix.include_query_params(cursor='')}{add_url}"
+        page_links.append(f'<a href="{start_url}" class="page start" title="처음 페이지"><i class="fa fa-backward-fast"></i><span class="blind">처음</span></a>')
+
+    if prev_cursor:
+        prev_url = f"{url_prefix.include_query_params(cursor=prev_cursor)}{add_url}"
+        page_links.append(f'<a href="{prev_url}" class="page prev" title="이전 페이지"><i class="fa fa-caret-left"></i><span class="blind">이전</span></a>')
+
+    if next_cursor:
+        next_url = f"{url_prefix.include_query_params(cursor=next_cursor)}{add_url}"
+        page_links.append(f'<a href="{next_url}" class="page next" title="다음 페이지"><i class="fa fa-caret-right"></i><span class="blind">다음</span></a>')
+
+    return '<div class="pagination">' + ''.join(page_links) + '</div>'
+
+
 def subject_sort_link(request: Request,
                       column: str, query_string: str = '', flag: str = 'asc') -> str:
     """현재 페이지에서 컬럼을 기준으로 정렬하는 링크를 생성한다.
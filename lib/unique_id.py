@@ -0,0 +1,209 @@
+"""고유키 발급 모듈
+
+그누보드 5의 get_uniqid와 같은 16자리 고유키(년월일시분초 + 2자리)를
+요청마다 고유키 테이블(UniqId)에 INSERT 하여 중복을 확인하지 않고 메모리에서 발급합니다.
+- worker(프로세스)마다 슬롯 번호를 하나씩 점유하고(슬롯 잠금 파일),
+  끝 2자리를 (슬롯 수 + 1)로 나눈 나머지가 슬롯 번호와 같은 값만 발급하므로 worker 간에 중복되지 않습니다.
+  예) 슬롯 10개: 0번 worker는 00, 11, 22 ... 99 / 1번 worker는 01, 12, 23 ... 89
+- 나머지가 슬롯 수와 같은 값(예: 10, 21, 32 ... 98)은 어느 슬롯도 사용하지 않으며,
+  점유할 수 있는 슬롯이 없는 경우(worker 수 > UNIQUE_ID_WORKER_SLOTS)에만
+  이 값으로 고유키 테이블에 INSERT 하여 중복을 확인합니다. (슬롯을 점유한 worker와 중복되지 않음)
+- 같은 초에 발급할 수 있는 수를 넘으면 다음 초의 고유키를 발급합니다. (항상 증가)
+  다음 초를 미리 사용한 경우 슬롯별 파일에 마지막 발급 시간을 기록하고,
+  슬롯을 다시 점유한 프로세스는 기록된 시간 이후의 고유키부터 발급합니다. (재시작 후 중복 방지)
+- UNIQUE_ID_AUDIT 설정을 사용하면 발급한 고유키를 모아서 고유키 테이블에 한번에 기록합니다.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from filelock import FileLock, Timeout
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from core.database import DBConnect
+from core.models import UniqId
+from core.settings import settings
+
+# 끝 2자리로 표현할 수 있는 값의 수 (00 ~ 99)
+SEQUENCE_SIZE = 100
+
+
+class UniqueIdAllocator:
+    """고유키 발급 클래스"""
+    lock_dir = os.path.join("data", "uniqid")
+    # 기록 대기중인 고유키가 이 수를 넘거나 일정 시간이 지나면 한번에 기록합니다.
+    audit_batch_size = 100
+    audit_interval = 60  # 초
+
+    def __init__(self, slots: int = 10, audit: bool = False):
+        """
+        Args:
+            slots (int, optional): 슬롯(worker) 수 (1 ~ 99). Defaults to 10.
+            audit (bool, optional): 발급한 고유키를 테이블에 기록. Defaults to False.
+        """
+        self.slots = max(1, min(slots, SEQUENCE_SIZE - 1))
+        # 끝 2자리의 간격 (마지막 나머지는 슬롯을 점유하지 못한 worker가 사용)
+        self.stride = self.slots + 1
+        self.audit = audit
+        self._slot: Optional[int] = None  # 점유한 슬롯 번호 (점유하지 못한 경우 -1)
+        self._slot_lock: Optional[FileLock] = None
+        self._pid = None
+        self._second = 0  # 마지막으로 발급한 고유키의 시간 (초)
+        self._sequence = 0  # 같은 초에 발급한 순번
+        self._pending: List[Tuple[str, str]] = []
+        self._last_recorded = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def slot(self) -> int:
+        """현재 프로세스가 점유한 슬롯 번호 (점유하지 못한 경우 -1)"""
+        if self._slot is None or self._pid != os.getpid():
+            with self._lock:
+                if self._slot is None or self._pid != os.getpid():
+                    self._slot = self._claim_slot()
+                    self._pid = os.getpid()
+        return self._slot
+
+    def _claim_slot(self) -> int:
+        """비어있는 슬롯의 잠금 파일을 프로세스가 종료될 때까지 점유합니다."""
+        try:
+            os.makedirs(self.lock_dir, exist_ok=True)
+        except OSError as e:
+            logging.error("고유키 슬롯 디렉토리 생성 실패", exc_info=e)
+            return -1
+
+        for slot in range(self.slots):
+            lock = FileLock(os.path.join(self.lock_dir, f"slot_{slot}.lock"))
+            try:
+                lock.acquire(timeout=0)
+            except Timeout:
+                continue
+            self._slot_lock = lock
+            self._restore_last_second(slot)
+            return slot
+
+        logging.warning("고유키 슬롯이 부족합니다. UNIQUE_ID_WORKER_SLOTS를 worker 수 이상으로 설정하세요.")
+        return -1
+
+    def _last_second_path(self, slot: int) -> str:
+        return os.path.join(self.lock_dir, f"slot_{slot}.last")
+
+    def _restore_last_second(self, slot: int) -> None:
+        """슬롯에서 마지막으로 발급한 시간 이후부터 발급하도록 설정합니다.
+        - 이전 프로세스가 같은 초 또는 다음 초를 미리 사용했을 수 있으므로
+          기록된 시간과 현재 시간 중 늦은 시간의 다음 초부터 발급합니다.
+        """
+        try:
+            with open(self._last_second_path(slot), encoding="utf-8") as f:
+                last_second = int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            last_second = 0
+        self._second = max(last_second, int(time.time()))
+        self._sequence = SEQUENCE_SIZE  # 다음 발급시 다음 초로 넘어갑니다.
+
+    def _save_last_second(self, slot: int, second: int) -> None:
+        """슬롯에서 미리 사용한 시간(초)을 기록합니다."""
+        try:
+            with open(self._last_second_path(slot), "w", encoding="utf-8") as f:
+                f.write(str(second))
+        except OSError as e:
+            logging.error("고유키 발급 시간 기록 실패", exc_info=e)
+
+    def allocate(self, ip: str = "") -> Optional[str]:
+        """고유키를 발급합니다.
+
+        Args:
+            ip (str, optional): 요청한 IP (기록용). Defaults to "".
+
+        Returns:
+            Optional[str]: 16자리 고유키, DB 오류시 None
+        """
+        slot = self.slot
+        if slot < 0:
+            return self._allocate_with_db(ip)
+
+        # 같은 초에 발급할 수 있는 수 (슬롯 번호 + 간격 * 순번 < 100)
+        capacity = (SEQUENCE_SIZE - slot + self.stride - 1) // self.stride
+        with self._lock:
+            now = int(time.time())
+            if now > self._second:
+                self._second = now
+                self._sequence = 0
+            else:
+                self._sequence += 1
+                if self._sequence >= capacity:
+                    self._second += 1
+                    self._sequence = 0
+                    if self._second > now:
+                        # 다음 초를 미리 사용하는 경우 재시작 후 중복되지 않도록 기록합니다.
+                        self._save_last_second(slot, self._second)
+            second, sequence = self._second, self._sequence
+
+        key = f"{datetime.fromtimestamp(second).strftime('%Y%m%d%H%M%S')}{slot + sequence * self.stride:02d}"
+        if self.audit:
+            self._record(key, ip)
+        return key
+
+    def _allocate_with_db(self, ip: str) -> Optional[str]:
+        """고유키 테이블에 INSERT 하여 중복을 확인하고 발급합니다. (슬롯을 점유하지 못한 경우)
+        - 끝 2자리는 어느 슬롯도 사용하지 않는 값(나머지가 슬롯 수인 값) 중에서 선택합니다.
+        """
+        reserved = range(self.slots, SEQUENCE_SIZE, self.stride)
+        while True:
+            current = datetime.now()
+            key = f"{current.strftime('%Y%m%d%H%M%S')}{random.choice(reserved):02d}"
+
+            with DBConnect().sessionLocal() as session:
+                try:
+                    session.add(UniqId(uq_id=key, uq_ip=ip))
+                    session.commit()
+                    return key
+
+                except IntegrityError:
+                    # key 중복 에러가 발생하면 다시 시도
+                    session.rollback()
+                    time.sleep(random.uniform(0.01, 0.02))
+                except Exception as e:
+                    logging.log(logging.CRITICAL, 'unique table insert error', exc_info=e)
+                    return None
+
+    def _record(self, key: str, ip: str) -> None:
+        """발급한 고유키를 기록 대기 목록에 추가하고, 조건이 되면 한번에 기록합니다."""
+        with self._lock:
+            self._pending.append((key, ip))
+            if (len(self._pending) < self.audit_batch_size
+                    and time.monotonic() - self._last_recorded < self.audit_interval):
+                return
+        self.flush()
+
+    def flush(self) -> int:
+        """기록 대기중인 고유키를 고유키 테이블에 저장합니다.
+
+        Returns:
+            int: 저장한 고유키 수
+        """
+        with self._lock:
+            records, self._pending = self._pending, []
+            self._last_recorded = time.monotonic()
+        if not records:
+            return 0
+
+        try:
+            with DBConnect().sessionLocal() as db:
+                db.execute(insert(UniqId), [{"uq_id": key, "uq_ip": ip} for key, ip in records])
+                db.commit()
+            return len(records)
+        except Exception as e:
+            logging.error("고유키 기록 실패: %s건", len(records), exc_info=e)
+            return 0
+
+
+unique_id_allocator = UniqueIdAllocator(
+    slots=settings.UNIQUE_ID_WORKER_SLOTS,
+    audit=settings.UNIQUE_ID_AUDIT,
+)
@@ -0,0 +1,109 @@
+"""User-Agent 분석 캐시 모듈
+
+User-Agent 분석(user_agents.parse)은 정규식을 순서대로 검사하므로 CPU 비용이 큽니다.
+같은 User-Agent 문자열은 같은 결과를 반환하므로
+worker별로 최근 분석 결과를 LRU 캐시에 보관하여 재사용합니다.
+- 미들웨어(모바일 접속 판단), 방문자 이력 저장, 관리자 접속자집계에서 함께 사용합니다.
+"""
+import threading
+from typing import Dict, Iterable, NamedTuple
+
+from cachetools import LRUCache
+from user_agents import parse
+
+from core.settings import settings
+
+
+class UserAgentInfo(NamedTuple):
+    """User-Agent 분석 결과"""
+    browser: str
+    os: str
+    device: str  # pc, mobile, tablet, unknown
+    is_mobile: bool
+    is_tablet: bool
+
+
+def parse_user_agent(user_agent: str) -> UserAgentInfo:
+    """User-Agent 문자열을 분석합니다. (캐시 미사용)"""
+    ua = parse(user_agent or "")
+    browser = getattr(ua.browser, 'family', 'unknown')
+    os = getattr(ua.os, 'family', 'unknown')
+    device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
+    return UserAgentInfo(browser, os, device, ua.is_mobile, ua.is_tablet)
+
+
+class UserAgentCache:
+    """User-Agent 분석 결과 LRU 캐시 클래스"""
+    # 비정상적으로 긴 User-Agent는 캐시하지 않습니다. (메모리 사용량 제한)
+    max_key_length = 1024
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize (int, optional): 보관할 User-Agent 수. Defaults to 4096.
+        """
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def classify(self, user_agent: str) -> UserAgentInfo:
+        """User-Agent 문자열을 분석합니다.
+
+        Args:
+            user_agent (str): User-Agent 헤더 값
+
+        Returns:
+            UserAgentInfo: (browser, os, device, is_mobile, is_tablet)
+        """
+        user_agent = user_agent or ""
+        if len(user_agent) > self.max_key_length:
+            return parse_user_agent(user_agent)
+
+        with self._lock:
+            info = self._cache.get(user_agent)
+            if info is not None:
+                self.hits += 1
+                return info
+            self.misses += 1
+
+        # 분석은 잠금 밖에서 실행합니다. (동시에 분석하더라도 결과는 같습니다.)
+        info = parse_user_agent(user_agent)
+        with self._lock:
+            self._cache[user_agent] = info
+        return info
+
+    def classify_many(self, user_agents: Iterable[str]) -> Dict[str, UserAgentInfo]:
+        """여러 User-Agent 문자열을 한번에 분석합니다.
+        - 중복된 문자열은 한번만 분석합니다.
+
+        Args:
+            user_agents (Iterable[str]): User-Agent 문자열 목록
+
+        Returns:
+            Dict[str, UserAgentInfo]: User-Agent 문자열별 분석 결과
+        """
+        return {user_agent: self.classify(user_agent) for user_agent in set(user_agents)}
+
+    def stats(self) -> dict:
+        """캐시 적중률 통계를 반환합니다."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "name": "user_agent",
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "size": self._cache.currsize,
+                "maxsize": self._cache.maxsize,
+            }
+
+    def clear(self) -> None:
+        """캐시와 통계를 초기화합니다."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+user_agent_cache = UserAgentCache(maxsize=settings.USER_AGENT_CACHE_SIZE)
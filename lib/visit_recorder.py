@@ -0,0 +1,112 @@
+"""방문자 접속 이력 기록 모듈
+
+요청마다 DB에 접속 이력을 저장하지 않고 메모리에 모아두었다가
+일정 건수(VISIT_FLUSH_SIZE) 또는 일정 시간(VISIT_FLUSH_INTERVAL)마다 한번에 저장합니다.
+- 저장은 worker별 백그라운드 스레드에서 실행되므로 응답을 지연시키지 않습니다.
+- 같은 날짜, 같은 IP의 중복 저장은 VisitService.save_visits()에서 방지합니다.
+  (파일 잠금으로 여러 worker의 저장을 순서대로 처리)
+- 서버가 비정상 종료되면 저장하지 못한 접속 이력(최대 VISIT_FLUSH_INTERVAL 초)은 유실됩니다.
+"""
+import logging
+import threading
+from datetime import date
+from typing import List, Set, Tuple
+
+from fastapi import Request
+
+from core.database import DBConnect
+from core.settings import settings
+from service.visit_service import VisitService
+
+
+class VisitRecorder:
+    """접속 이력 지연 기록(write-behind) 클래스"""
+
+    def __init__(self, flush_size: int = 100, flush_interval: int = 5):
+        """
+        Args:
+            flush_size (int, optional): 저장할 접속 이력 건수. Defaults to 100.
+            flush_interval (int, optional): 저장 간격 (초). Defaults to 5.
+        """
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._buffer: List[dict] = []
+        # 현재 worker에서 오늘 기록한 (날짜, IP) 목록
+        self._seen: Set[Tuple[date, str]] = set()
+        self._seen_date = date.today()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def record(self, request: Request) -> bool:
+        """접속 이력을 저장 대기열에 추가합니다.
+
+        Returns:
+            bool: 추가 여부 (현재 worker에서 오늘 이미 추가한 IP이면 False)
+        """
+        record = VisitService.make_visit_record(request)
+        key = (record["vi_date"], record["vi_ip"])
+        with self._lock:
+            if self._seen_date != record["vi_date"]:
+                self._seen.clear()
+                self._seen_date = record["vi_date"]
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            self._buffer.append(record)
+            is_full = len(self._buffer) >= self.flush_size
+
+        self.start()
+        if is_full:
+            self._wakeup.set()
+        return True
+
+    def flush(self) -> int:
+        """대기중인 접속 이력을 저장합니다.
+
+        Returns:
+            int: 저장한 접속 이력 건수
+        """
+        with self._flush_lock:
+            with self._lock:
+                records, self._buffer = self._buffer, []
+            if not records:
+                return 0
+
+            try:
+                with DBConnect().sessionLocal() as db:
+                    return len(VisitService(None, db).save_visits(records))
+            except Exception as e:
+                logging.error("방문자 접속 이력 저장 실패: %s건", len(records), exc_info=e)
+                return 0
+
+    def start(self) -> None:
+        """저장 스레드를 시작합니다. (처음 기록할 때 시작)"""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="visit_recorder", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """저장 스레드를 종료하고 대기중인 접속 이력을 저장합니다. (서버 종료)"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread:
+            self._wakeup.set()
+            thread.join(timeout=self.flush_interval)
+        self.flush()
+
+    def _run(self) -> None:
+        while self._thread is threading.current_thread():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+visit_recorder = VisitRecorder(
+    flush_size=settings.VISIT_FLUSH_SIZE,
+    flush_interval=settings.VISIT_FLUSH_INTERVAL,
+)
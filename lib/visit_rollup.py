@@ -0,0 +1,236 @@
+"""방문자 집계(rollup) 모듈
+
+관리자 접속자집계 화면에서 방문자 이력(visit) 전체를 조회하지 않도록
+날짜별로 시간별 방문자 수(visit_hour_sum)와 항목별 방문자 수(visit_dimension_sum)를 미리 집계합니다.
+- 스케줄러(lib/scheduler/scheduled_jobs/interval_schedules.py)가 주기적으로 집계합니다.
+  집계가 없는 날짜와 오늘, 어제(지연 저장된 접속 이력 반영)는 다시 집계합니다.
+- 이전 방문자 이력의 집계는 서버 시작 후 스케줄러(date_schedules.py)가 한번 생성합니다.
+  (직접 실행: python -m lib.visit_rollup)
+- 관리자 화면에서는 조회 전에 오늘, 어제만 다시 집계하므로 항상 최신 방문자 수를 출력합니다.
+"""
+import logging
+import os
+import re
+from collections import Counter
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Union
+
+from filelock import FileLock, Timeout
+from sqlalchemy import case, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Visit, VisitDimensionSum, VisitHourSum
+from lib.user_agent import user_agent_cache
+
+# 항목별 집계 종류
+DIMENSION_BROWSER = "browser"
+DIMENSION_OS = "os"
+DIMENSION_DEVICE = "device"
+DIMENSION_REFERER = "referer"
+
+LOCK_FILE_PATH = os.path.join("data", "visit_rollup.lock")
+
+_tables_ready = False
+
+
+def ensure_rollup_tables() -> None:
+    """방문자 집계 테이블이 없으면 생성합니다. (업데이트 설치 대응)"""
+    global _tables_ready
+    if not _tables_ready:
+        engine = DBConnect().engine
+        VisitHourSum.__table__.create(bind=engine, checkfirst=True)
+        VisitDimensionSum.__table__.create(bind=engine, checkfirst=True)
+        _tables_ready = True
+
+
+def get_referer(referer: str) -> str:
+    """접속경로(referer) 집계값을 반환합니다. (http(s) 주소가 아니면 '')"""
+    match = re.search(r'^http[s]*\S+', referer or "")
+    if not match:
+        return ""
+    return re.sub(r"^(www\.|search\.|dirsearch\.|dir\.search\.|dir\.|kr\.search\.|myhome\.)(.*)",
+                  "\\2", match.group())
+
+
+def get_hour_expression(dialect: str):
+    """데이터베이스별 접속 시간(시) 표현식"""
+    if dialect == 'mysql':
+        return func.hour(Visit.vi_time)
+    if dialect == 'postgresql':
+        return func.to_char(Visit.vi_time, 'HH24')
+    return func.strftime('%H', Visit.vi_time)
+
+
+def build_visit_rollup(db: Session, visit_date: date) -> None:
+    """날짜의 방문자 집계를 다시 생성합니다. (commit은 호출한 쪽에서 처리)"""
+    db.execute(delete(VisitHourSum).where(VisitHourSum.vh_date == visit_date))
+    db.execute(delete(VisitDimensionSum).where(VisitDimensionSum.vd_date == visit_date))
+
+    # 시간별 방문자 수
+    hour = get_hour_expression(db.bind.dialect.name).label("hour")
+    hour_rows = db.execute(
+        select(hour, func.count().label("count"))
+        .where(Visit.vi_date == visit_date)
+        .group_by(hour)
+    ).all()
+    if not hour_rows:
+        return
+    db.execute(insert(VisitHourSum), [
+        {"vh_date": visit_date, "vh_hour": int(row.hour), "vh_count": row.count}
+        for row in hour_rows
+    ])
+
+    # 브라우저, OS, 접속기기별 방문자 수
+    # - 브라우저, OS 정보가 없는 이력만 User-Agent를 분석합니다. (User-Agent 분석 캐시 사용)
+    counts: Dict[str, Counter] = {
+        DIMENSION_BROWSER: Counter(), DIMENSION_OS: Counter(),
+        DIMENSION_DEVICE: Counter(), DIMENSION_REFERER: Counter(),
+    }
+    agent = case(
+        (or_(Visit.vi_browser == "", Visit.vi_os == ""), Visit.vi_agent),
+        else_=""
+    ).label("agent")
+    rows = db.execute(
+        select(Visit.vi_browser, Visit.vi_os, Visit.vi_device, agent, func.count().label("count"))
+        .where(Visit.vi_date == visit_date)
+        .group_by(Visit.vi_browser, Visit.vi_os, Visit.vi_device, agent)
+    ).all()
+    agents = user_agent_cache.classify_many(
+        row.agent for row in rows if not (row.vi_browser and row.vi_os))
+    for row in rows:
+        info = agents.get(row.agent)
+        counts[DIMENSION_BROWSER][row.vi_browser or info.browser] += row.count
+        counts[DIMENSION_OS][row.vi_os or info.os] += row.count
+        counts[DIMENSION_DEVICE][row.vi_device or ""] += row.count
+
+    # 접속경로별 방문자 수
+    for row in db.execute(
+        select(Visit.vi_referer, func.count().label("count"))
+        .where(Visit.vi_date == visit_date)
+        .group_by(Visit.vi_referer)
+    ):
+        counts[DIMENSION_REFERER][get_referer(row.vi_referer)[:255]] += row.count
+
+    db.execute(insert(VisitDimensionSum), [
+        {"vd_date": visit_date, "vd_type": dimension, "vd_value": value, "vd_count": count}
+        for dimension, counter in counts.items()
+        for value, count in counter.items()
+    ])
+
+
+def update_visit_rollup(db: Session, today: Optional[date] = None) -> List[date]:
+    """집계가 필요한 날짜의 방문자 집계를 생성합니다.
+    - 마지막 집계일의 전날부터 오늘까지, 접속 이력이 있는 날짜를 다시 집계합니다.
+      (집계가 없으면 전체 날짜)
+    - 여러 worker가 동시에 집계하지 않도록 파일 잠금을 사용합니다.
+
+    Returns:
+        List[date]: 집계한 날짜 목록
+    """
+    ensure_rollup_tables()
+    today = today or date.today()
+    with FileLock(LOCK_FILE_PATH, timeout=60):
+        last_date = db.scalar(select(func.max(VisitHourSum.vh_date)))
+        query = select(Visit.vi_date).distinct()
+        if last_date:
+            query = query.where(Visit.vi_date >= min(last_date, today) - timedelta(days=1))
+        dates = set(db.scalars(query).all())
+        # 오늘, 어제는 접속 이력이 없어도 다시 집계합니다. (삭제된 접속 이력 반영)
+        dates.update((today - timedelta(days=1), today))
+
+        for visit_date in sorted(dates):
+            build_visit_rollup(db, visit_date)
+        db.commit()
+    return sorted(dates)
+
+
+def refresh_visit_rollup(db: Session, today: Optional[date] = None, timeout: int = 10) -> List[date]:
+    """오늘, 어제의 방문자 집계만 다시 생성합니다. (관리자 화면 조회용)
+    - 다른 worker에서 집계중인 경우 timeout초 동안 기다리고, 넘으면 집계하지 않습니다.
+
+    Returns:
+        List[date]: 집계한 날짜 목록
+    """
+    ensure_rollup_tables()
+    today = today or date.today()
+    dates = [today - timedelta(days=1), today]
+    try:
+        with FileLock(LOCK_FILE_PATH, timeout=timeout):
+            for visit_date in dates:
+                build_visit_rollup(db, visit_date)
+            db.commit()
+    except Timeout:
+        logging.warning("방문자 집계중이므로 이전 집계를 출력합니다.")
+        return []
+    return dates
+
+
+def update_visit_rollup_job() -> None:
+    """방문자 집계 예약 작업"""
+    try:
+        with DBConnect().sessionLocal() as db:
+            update_visit_rollup(db)
+    except Exception as e:
+        logging.error("방문자 집계 실패", exc_info=e)
+
+
+def delete_visit_rollup(db: Session, condition: Callable) -> None:
+    """방문자 이력 삭제 조건에 해당하는 날짜의 집계를 삭제합니다. (commit은 호출한 쪽에서 처리)
+
+    Args:
+        condition (Callable): 집계 날짜 컬럼에 적용할 조건을 반환하는 함수
+            예) lambda column: column < delete_date
+    """
+    ensure_rollup_tables()
+    db.execute(delete(VisitHourSum).where(condition(VisitHourSum.vh_date)))
+    db.execute(delete(VisitDimensionSum).where(condition(VisitDimensionSum.vd_date)))
+
+
+def get_visit_total(db: Session, from_date: Union[str, date], to_date: Union[str, date]) -> int:
+    """기간의 전체 방문자 수"""
+    return db.scalar(
+        select(func.coalesce(func.sum(VisitHourSum.vh_count), 0))
+        .where(VisitHourSum.vh_date.between(from_date, to_date))
+    )
+
+
+def get_visit_hour_counts(db: Session, from_date: Union[str, date], to_date: Union[str, date]) -> Dict[int, int]:
+    """기간의 시간별(0 ~ 23) 방문자 수"""
+    rows = db.execute(
+        select(VisitHourSum.vh_hour, func.sum(VisitHourSum.vh_count))
+        .where(VisitHourSum.vh_date.between(from_date, to_date))
+        .group_by(VisitHourSum.vh_hour)
+    ).all()
+    return {hour: int(count) for hour, count in rows}
+
+
+def get_visit_date_counts(db: Session, from_date: Union[str, date], to_date: Union[str, date]) -> Dict[date, int]:
+    """기간의 날짜별 방문자 수 (날짜순)"""
+    rows = db.execute(
+        select(VisitHourSum.vh_date, func.sum(VisitHourSum.vh_count))
+        .where(VisitHourSum.vh_date.between(from_date, to_date))
+        .group_by(VisitHourSum.vh_date)
+        .order_by(VisitHourSum.vh_date)
+    ).all()
+    return {visit_date: int(count) for visit_date, count in rows}
+
+
+def get_visit_dimension_counts(db: Session, dimension: str,
+                               from_date: Union[str, date], to_date: Union[str, date]) -> Dict[str, int]:
+    """기간의 항목별 방문자 수 (방문자 수가 많은 순)"""
+    total = func.sum(VisitDimensionSum.vd_count)
+    rows = db.execute(
+        select(VisitDimensionSum.vd_value, total)
+        .where(VisitDimensionSum.vd_type == dimension,
+               VisitDimensionSum.vd_date.between(from_date, to_date))
+        .group_by(VisitDimensionSum.vd_value)
+        .order_by(total.desc(), VisitDimensionSum.vd_value)
+    ).all()
+    return {value: int(count) for value, count in rows}
+
+
+if __name__ == "__main__":
+    # 이전 방문자 이력 전체 집계 (업데이트 설치 후 한번 실행)
+    with DBConnect().sessionLocal() as session:
+        print(f"방문자 집계: {len(update_visit_rollup(session))}일")
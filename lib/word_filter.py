@@ -0,0 +1,151 @@
+"""단어 필터링 모듈
+
+기본환경설정의 단어 필터링(cf_filter) 목록을 요청마다 단어별로 검사하지 않도록
+Aho-Corasick 오토마톤으로 한번만 컴파일하여 재사용합니다.
+- 글 내용을 한번만 읽어서 목록의 모든 단어를 찾습니다. (단어 수와 무관)
+- 찾은 단어의 위치(start, end)를 함께 반환하므로 에디터 등에서 강조 표시할 수 있습니다.
+- 목록 문자열이 같으면 컴파일한 오토마톤을 재사용하므로
+  기본환경설정이 변경된 경우에만 다시 컴파일합니다.
+"""
+import re
+import threading
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple
+
+from cachetools import LRUCache, cached
+
+
+class WordMatch(NamedTuple):
+    """찾은 단어 정보"""
+    word: str
+    start: int  # 시작 위치
+    end: int  # 끝 위치 (포함하지 않음)
+
+
+class WordMatcher:
+    """Aho-Corasick 다중 단어 검색 클래스"""
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Args:
+            words (Iterable[str]): 검색할 단어 목록 (목록 순서가 우선순위)
+        """
+        self.words: List[str] = []
+        # 상태별 전이(goto), 실패(fail) 링크, 출력(단어 번호 목록)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        index_by_word = {}
+        for word in words:
+            if not word or word in index_by_word:
+                continue
+            index_by_word[word] = len(self.words)
+            self.words.append(word)
+            self._add_word(word, index_by_word[word])
+        self._build_fail_links()
+        self._start_pattern = re.compile(
+            "[" + "".join(re.escape(char) for char in self._goto[0]) + "]" if self._goto[0] else "(?!)")
+
+    def __bool__(self) -> bool:
+        return bool(self.words)
+
+    def _add_word(self, word: str, index: int) -> None:
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_fail_links(self) -> None:
+        """너비 우선 탐색으로 실패 링크를 만들고, 실패 상태의 출력을 합칩니다."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                if self._output[fail]:
+                    self._output[next_state] = self._output[next_state] + self._output[fail]
+
+    def _scan(self, text: str):
+        """(끝 위치, 단어 번호)를 차례로 반환합니다."""
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        length = len(text)
+        state = 0
+        position = 0
+        while position < length:
+            if not state:
+                # 단어의 첫 글자가 아닌 문자는 정규식으로 건너뜁니다.
+                found = self._start_pattern.search(text, position)
+                if not found:
+                    return
+                position = found.start()
+                state = root[text[position]]
+            else:
+                char = text[position]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+            position += 1
+            if output[state]:
+                for index in output[state]:
+                    yield position, index
+
+    def find_all(self, text: str) -> List[WordMatch]:
+        """글 내용에서 모든 단어를 찾습니다. (겹치는 단어 포함)
+
+        Args:
+            text (str): 글 내용
+
+        Returns:
+            List[WordMatch]: 찾은 단어 목록 (위치순)
+        """
+        matches = [
+            WordMatch(self.words[index], end - len(self.words[index]), end)
+            for end, index in self._scan(text or "")
+        ]
+        matches.sort(key=lambda match: (match.start, match.end))
+        return matches
+
+    def search(self, text: str) -> str:
+        """글 내용에 포함된 단어 중 목록에서 가장 앞에 있는 단어를 반환합니다.
+
+        Args:
+            text (str): 글 내용
+
+        Returns:
+            str: 찾은 단어. 없으면 빈 문자열
+        """
+        found = min((index for _, index in self._scan(text or "")), default=None)
+        return "" if found is None else self.words[found]
+
+
+def split_words(words: str, separator: str = ",") -> List[str]:
+    """구분자로 나누고 공백을 제거한 단어 목록을 반환합니다."""
+    return [word.strip() for word in (words or "").split(separator) if word.strip()]
+
+
+@cached(LRUCache(maxsize=16), lock=threading.Lock())
+def get_word_matcher(words: str) -> WordMatcher:
+    """쉼표(,)로 구분된 단어 목록을 컴파일하여 반환합니다.
+    - 같은 목록 문자열은 컴파일한 오토마톤을 재사용합니다.
+    """
+    return WordMatcher(split_words(words))
+
+
+@cached(LRUCache(maxsize=16), lock=threading.Lock())
+def get_word_set(words: str) -> FrozenSet[str]:
+    """쉼표(,)로 구분된 단어 목록을 소문자 집합으로 반환합니다."""
+    return frozenset(word.lower() for word in split_words(words))
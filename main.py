@@ -2,16 +2,16 @@ import os
 import re
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from typing import Optional
 
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, Path, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from sqlalchemy import delete, insert, select
 from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
 from starlette.staticfiles import StaticFiles
 
-from core import models
-from core.database import DBConnect
+from core.database import threaded_session
 from core.exception import AlertException, regist_core_exception_handler, template_response
 from core.middleware import regist_core_middleware, should_run_middleware
 from core.plugin import (
@@ -25,13 +25,18 @@ from core.template import register_theme_statics
 from lib.common import (
     get_client_ip, is_intercept_ip, is_possible_ip, session_member_key
 )
+from lib.config_cache import config_cache
 from lib.dependency.dependencies import check_use_template
+from lib.image_service import image_service
+from lib.presence_tracker import presence_tracker
 from lib.member import is_super_admin
+from lib.password_hasher import password_hasher
 from lib.scheduler import scheduler
 from lib.token import create_session_token
+from lib.unique_id import unique_id_allocator
+from lib.visit_recorder import visit_recorder
 from service.member_service import MemberService
 from service.point_service import PointService
-from service.visit_service import VisitService
 
 from admin.admin import router as admin_router
 from install.router import router as install_router
@@ -53,6 +58,11 @@ async def lifespan(app: FastAPI):
     """
     yield
     scheduler.remove_flag()
+    image_service.shutdown()
+    password_hasher.shutdown()
+    visit_recorder.stop()
+    presence_tracker.stop()
+    unique_id_allocator.flush()
 
 app = FastAPI(
     debug=settings.APP_IS_DEBUG,  # 디버그 모드가 활성화 설정
@@ -87,6 +97,109 @@ app.include_router(install_router)
 app.include_router(login_router)
 
 
+def set_request_state(db: Session, request: Request) -> Optional[Response]:
+    """기본환경설정, 로그인 회원 정보를 조회하여 request.state에 설정합니다.
+    - 요청을 더 진행할 수 없는 경우 응답을 반환합니다.
+    - main_middleware에서 run_sync()로 실행되므로 이벤트 루프를 막지 않습니다.
+    """
+    config = None
+    try:
+        if not os.path.exists(ENV_PATH):
+            raise AlertException(".env 파일이 없습니다. 설치를 진행해 주세요.", 400, "/install")
+        # 기본환경설정 조회
+        # - worker별 스냅샷을 사용하고, 설정이 변경된 경우에만 테이블을 다시 조회합니다.
+        config = config_cache.get(db)
+
+    except AlertException as e:
+        context = {"request": request, "errors": e.detail, "url": e.url}
+        return template_response("alert.html", context, e.status_code)
+
+    except ProgrammingError as e:
+        context = {
+            "request": request,
+            "errors": "DB 테이블 또는 설정정보가 존재하지 않습니다. 설치를 다시 진행해 주세요.",
+            "url": "/install"
+        }
+        return template_response("alert.html", context, 400)
+
+    # 기본환경설정 조회 및 설정
+    request.state.config = config
+    request.state.title = config.cf_title
+
+    # 에디터 전역변수
+    request.state.editor = config.cf_editor
+    request.state.use_editor = True if config.cf_editor else False
+
+    # 쿠키도메인 전역변수
+    request.state.cookie_domain = settings.COOKIE_DOMAIN
+
+    # 자동로그인 쿠키 재설정에 사용할 키 (자동로그인 한 경우에만 설정)
+    request.state.autologin_key = None
+
+    member = None
+    session_mb_id = request.session.get("ss_mb_id", "")
+    cookie_mb_id = request.cookies.get("ck_mb_id", "")
+    current_ip = get_client_ip(request)
+
+    try:
+        member_service = MemberService(request, db)
+        # 로그인 세션 유지 중이라면
+        if session_mb_id:
+            member = member_service.get_member(session_mb_id)
+            # 회원 정보가 없거나 탈퇴한 회원이라면 세션을 초기화
+            if not member_service.is_activated(member)[0]:
+                request.session.clear()
+                member = None
+
+        # 자동 로그인 쿠키가 있다면
+        elif cookie_mb_id:
+            mb_id = re.sub("[^a-zA-Z0-9_]", "", cookie_mb_id)[:20]
+            member = member_service.get_member(session_mb_id)
+
+            # 최고관리자는 보안상 자동로그인 기능을 사용하지 않는다.
+            if (not is_super_admin(request, mb_id)
+                    and member_service.is_member_email_certified(member)[0]
+                    and member_service.is_activated(member)[0]):
+                # 쿠키에 저장된 키와 서버에서 생성한 키가 일치하는지 검사
+                ss_mb_key = session_member_key(request, member)
+                if request.cookies.get("ck_auto") == ss_mb_key:
+                    request.session["ss_mb_id"] = cookie_mb_id
+                    request.state.autologin_key = ss_mb_key
+    except AlertException as e:
+        context = {"request": request, "errors": e.detail, "url": "/"}
+        response = template_response("alert.html", context, e.status_code)
+        response.delete_cookie("ck_auto")
+        response.delete_cookie("ck_mb_id")
+        request.session.clear()
+        return response
+
+    if member:
+        # 오늘 처음 로그인 이라면 포인트 지급 및 로그인 정보 업데이트
+        ymd_str = datetime.now().strftime("%Y-%m-%d")
+        if member.mb_today_login.strftime("%Y-%m-%d") != ymd_str:
+            point_service = PointService(request, db, member_service)
+            point_service.save_point(
+                member.mb_id, config.cf_login_point, ymd_str + " 첫로그인",
+                "@login", member.mb_id, ymd_str)
+
+            member.mb_today_login = datetime.now()
+            member.mb_login_ip = request.client.host
+            db.commit()
+
+    # 로그인한 회원 정보
+    request.state.login_member = member
+    # 최고관리자 여부
+    request.state.is_super_admin = is_super_admin(request, getattr(member, "mb_id", None))
+
+    # 접근가능/차단 IP 체크
+    # - IP 체크 기능을 사용할 때 is_super_admin 여부를 확인하기 때문에 로그인 코드 이후에 실행
+    if not is_possible_ip(request, current_ip):
+        return HTMLResponse("<meta charset=utf-8>접근이 허용되지 않은 IP 입니다.")
+    if is_intercept_ip(request, current_ip):
+        return HTMLResponse("<meta charset=utf-8>접근이 차단된 IP 입니다.")
+    return None
+
+
 @app.middleware("http")
 async def main_middleware(request: Request, call_next):
     """요청마다 항상 실행되는 미들웨어"""
@@ -95,126 +208,36 @@ async def main_middleware(request: Request, call_next):
         return await call_next(request)
 
     # 데이터베이스 설치여부 체크
-    with DBConnect().sessionLocal() as db:
-        url_path = request.url.path
-        config = None
-
-        try:
-            if not url_path.startswith("/install"):
-                if not os.path.exists(ENV_PATH):
-                    raise AlertException(".env 파일이 없습니다. 설치를 진행해 주세요.", 400, "/install")
-                # 기본환경설정 테이블 조회
-                config = db.scalar(select(models.Config))
-            else:
-                return await call_next(request)
-
-        except AlertException as e:
-            context = {"request": request, "errors": e.detail, "url": e.url}
-            return template_response("alert.html", context, e.status_code)
-
-        except ProgrammingError as e:
-            context = {
-                "request": request,
-                "errors": "DB 테이블 또는 설정정보가 존재하지 않습니다. 설치를 다시 진행해 주세요.",
-                "url": "/install"
-            }
-            return template_response("alert.html", context, 400)
-
-        # 기본환경설정 조회 및 설정
-        request.state.config = config
-        request.state.title = config.cf_title
-
-        # 에디터 전역변수
-        request.state.editor = config.cf_editor
-        request.state.use_editor = True if config.cf_editor else False
-
-        # 쿠키도메인 전역변수
-        request.state.cookie_domain = cookie_domain = settings.COOKIE_DOMAIN
-
-        member = None
-        is_autologin = False
-        ss_mb_key = None
-        session_mb_id = request.session.get("ss_mb_id", "")
-        cookie_mb_id = request.cookies.get("ck_mb_id", "")
-        current_ip = get_client_ip(request)
-
-        try:
-            member_service = MemberService(request, db)
-            # 로그인 세션 유지 중이라면
-            if session_mb_id:
-                member = member_service.get_member(session_mb_id)
-                # 회원 정보가 없거나 탈퇴한 회원이라면 세션을 초기화
-                if not member_service.is_activated(member)[0]:
-                    request.session.clear()
-                    member = None
-
-            # 자동 로그인 쿠키가 있다면
-            elif cookie_mb_id:
-                mb_id = re.sub("[^a-zA-Z0-9_]", "", cookie_mb_id)[:20]
-                member = member_service.get_member(session_mb_id)
-
-                # 최고관리자는 보안상 자동로그인 기능을 사용하지 않는다.
-                if (not is_super_admin(request, mb_id)
-                        and member_service.is_member_email_certified(member)[0]
-                        and member_service.is_activated(member)[0]):
-                    # 쿠키에 저장된 키와 서버에서 생성한 키가 일치하는지 검사
-                    ss_mb_key = session_member_key(request, member)
-                    if request.cookies.get("ck_auto") == ss_mb_key:
-                        request.session["ss_mb_id"] = cookie_mb_id
-                        is_autologin = True
-        except AlertException as e:
-            context = {"request": request, "errors": e.detail, "url": "/"}
-            response = template_response("alert.html", context, e.status_code)
-            response.delete_cookie("ck_auto")
-            response.delete_cookie("ck_mb_id")
-            request.session.clear()
-            return response
+    if request.url.path.startswith("/install"):
+        return await call_next(request)
 
-        if member:
-            # 오늘 처음 로그인 이라면 포인트 지급 및 로그인 정보 업데이트
-            ymd_str = datetime.now().strftime("%Y-%m-%d")
-            if member.mb_today_login.strftime("%Y-%m-%d") != ymd_str:
-                point_service = PointService(request, db, member_service)
-                point_service.save_point(
-                    member.mb_id, config.cf_login_point, ymd_str + " 첫로그인",
-                    "@login", member.mb_id, ymd_str)
-
-                member.mb_today_login = datetime.now()
-                member.mb_login_ip = request.client.host
-                db.commit()
-
-        # 로그인한 회원 정보
-        request.state.login_member = member
-        # 최고관리자 여부
-        request.state.is_super_admin = is_super_admin(request, getattr(member, "mb_id", None))
-
-        # 접근가능/차단 IP 체크
-        # - IP 체크 기능을 사용할 때 is_super_admin 여부를 확인하기 때문에 로그인 코드 이후에 실행
-        if not is_possible_ip(request, current_ip):
-            return HTMLResponse("<meta charset=utf-8>접근이 허용되지 않은 IP 입니다.")
-        if is_intercept_ip(request, current_ip):
-            return HTMLResponse("<meta charset=utf-8>접근이 차단된 IP 입니다.")
+    async with threaded_session() as db:
+        response = await db.run_sync(set_request_state, request)
+        if response:
+            return response
 
     # 응답 객체 설정
     response: Response = await call_next(request)
 
-    with DBConnect().sessionLocal() as db:
-        age_1day = 60 * 60 * 24
-
-        # 자동로그인 쿠키 재설정
-        # is_autologin과 세션을 확인해서 로그아웃 처리 이후 쿠키가 재설정되는 것을 방지
-        if is_autologin and request.session.get("ss_mb_id"):
-            response.set_cookie(key="ck_mb_id", value=cookie_mb_id,
-                                max_age=age_1day * 30, domain=cookie_domain)
-            response.set_cookie(key="ck_auto", value=ss_mb_key,
-                                max_age=age_1day * 30, domain=cookie_domain)
-        # 방문자 이력 기록
-        ck_visit_ip = request.cookies.get('ck_visit_ip', None)
-        if ck_visit_ip != current_ip:
-            response.set_cookie(key="ck_visit_ip", value=current_ip,
-                                max_age=age_1day, domain=cookie_domain)
-            visit_service = VisitService(request, db)
-            visit_service.create_visit_record()
+    age_1day = 60 * 60 * 24
+    cookie_domain = request.state.cookie_domain
+    current_ip = get_client_ip(request)
+
+    # 자동로그인 쿠키 재설정
+    # is_autologin과 세션을 확인해서 로그아웃 처리 이후 쿠키가 재설정되는 것을 방지
+    ss_mb_key = request.state.autologin_key
+    if ss_mb_key and request.session.get("ss_mb_id"):
+        response.set_cookie(key="ck_mb_id", value=request.cookies.get("ck_mb_id", ""),
+                            max_age=age_1day * 30, domain=cookie_domain)
+        response.set_cookie(key="ck_auto", value=ss_mb_key,
+                            max_age=age_1day * 30, domain=cookie_domain)
+    # 방문자 이력 기록
+    # - 저장 대기열에 추가하고, 백그라운드에서 일정 건수/시간마다 한번에 저장합니다.
+    ck_visit_ip = request.cookies.get('ck_visit_ip', None)
+    if ck_visit_ip != current_ip:
+        response.set_cookie(key="ck_visit_ip", value=current_ip,
+                            max_age=age_1day, domain=cookie_domain)
+        visit_recorder.record(request)
 
     return response
 
@@ -1,4 +1,4 @@
-from typing_extensions import Union, List
+from typing_extensions import Dict, Union, List
 from datetime import datetime
 
 from fastapi import Request
@@ -87,6 +87,22 @@ class AJAXService:
                 result["nogood"] += 1
         return result
 
+    def get_ajax_good_data_by_wr_ids(self, bo_table: str, wr_ids: List[int]) -> Dict[int, dict]:
+        """여러 게시글의 추천/비추천 수를 한번에 확인"""
+        result = {wr_id: {"good": 0, "nogood": 0} for wr_id in wr_ids}
+        if not wr_ids:
+            return result
+
+        good_counts = self.db.execute(
+            select(BoardGood.wr_id, BoardGood.bg_flag, func.count())
+            .where(BoardGood.bo_table == bo_table, BoardGood.wr_id.in_(wr_ids))
+            .group_by(BoardGood.wr_id, BoardGood.bg_flag)
+        ).all()
+        for wr_id, bg_flag, count in good_counts:
+            key = "good" if bg_flag == "good" else "nogood"
+            result[wr_id][key] += count
+        return result
+
     def get_ajax_good_result(self, bo_table: str, member: Member, write: WriteBaseModel, type: str) -> dict:
         """게시글의 추천/비추천 데이터 확인"""
         result = {"status": "success", "message": "", "good": 0, "nogood": 0}
@@ -9,13 +9,14 @@ from core.models import Board, WriteBaseModel, Group, AutoSave
 from core.exception import AlertException
 from core.formclass import WriteForm
 from lib.board_lib import (
-    BoardConfig, FileCache, is_owner, is_write_delay, send_write_mail
+    BoardConfig, is_owner, is_write_delay, send_write_mail
 )
 from lib.member import MemberDetails
 from lib.common import (
     dynamic_create_write_table, filter_words,
     remove_query_params, set_url_query_params
 )
+from lib.fragment_cache import latest_cache
 from lib.html_sanitizer import content_sanitizer
 from lib.slowapi.create_post_limit.limiter import validate_slowapi_create_post
 from lib.pbkdf2 import create_hash, validate_password
@@ -261,7 +262,7 @@ class BoardService(BaseService, BoardConfig):
 
     def delete_cache(self):
         """최신글 캐시 삭제"""
-        FileCache().delete_prefix(f"latest-{self.bo_table}")
+        latest_cache.invalidate(self.bo_table)
     
     def delete_auto_save(self, uid: str):
         """자동저장 글 삭제"""
@@ -6,8 +6,9 @@ from sqlalchemy import select, update
 from core.database import db_session
 from core.models import WriteBaseModel, BoardNew, BoardGood, Scrap
 from core.formclass import WriteForm
-from lib.board_lib import FileCache, get_next_num, generate_reply_character
+from lib.board_lib import get_next_num, generate_reply_character
 from lib.common import cut_name, dynamic_create_write_table
+from lib.fragment_cache import latest_cache
 from lib.dependency.dependencies import (
     validate_captcha as lib_validate_captcha, get_variety_bo_table
 )
@@ -15,6 +16,7 @@ from lib.template_filters import datetime_format
 from api.v1.models.board import WriteModel, WriteTransportation
 from service.point_service import PointService
 from . import BoardService
+from service.board_count_service import BoardCountService
 from service.board_file_service import BoardFileService
 
 class CreatePostService(BoardService):
@@ -68,6 +70,7 @@ class CreatePostService(BoardService):
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
         self.db.commit()
+        BoardCountService.invalidate(self.bo_table)
         return write
 
     async def validate_captcha(self, recaptcha_response: str):
@@ -118,8 +121,8 @@ class MoveUpdateService(BoardService):
         origin_bo_table = self.bo_table
 
         # 게시글 복사/이동 작업 반복
-        file_cache = FileCache()
         for target_bo_table in target_bo_tables:
+            target_board = self.get_board(target_bo_table)
             for origin_write in origin_writes:
                 target_write_model = dynamic_create_write_table(target_bo_table)
                 target_write = target_write_model()
@@ -154,6 +157,15 @@ class MoveUpdateService(BoardService):
 
                 # 게시글 추가
                 self.db.add(target_write)
+                # 게시판 글/댓글 갯수 업데이트
+                if origin_write.wr_is_comment:
+                    target_board.bo_count_comment += 1
+                    if self.sw == WriteTransportation.MOVE.value:
+                        origin_board.bo_count_comment -= 1
+                else:
+                    target_board.bo_count_write += 1
+                    if self.sw == WriteTransportation.MOVE.value:
+                        origin_board.bo_count_write -= 1
                 self.db.commit()
                 # 부모아이디 설정
                 target_write.wr_parent = target_write.wr_id
@@ -194,8 +206,10 @@ class MoveUpdateService(BoardService):
                         self.file_service.copy_board_files(CreatePostService.FILE_DIRECTORY,
                                                            origin_bo_table, origin_write.wr_id,
                                                            target_bo_table, target_write.wr_id)
-            # 최신글 캐시 삭제
-            file_cache.delete_prefix(f'latest-{target_bo_table}')
+            # 최신글, 게시글 수 캐시 삭제
+            latest_cache.invalidate(target_bo_table)
+            BoardCountService.invalidate(target_bo_table)
 
-        # 원본 게시판 최신글 캐시 삭제
-        file_cache.delete_prefix(f'latest-{origin_bo_table}')
+        # 원본 게시판 최신글, 게시글 수 캐시 삭제
+        latest_cache.invalidate(origin_bo_table)
+        BoardCountService.invalidate(origin_bo_table)
@@ -5,8 +5,11 @@ from sqlalchemy import select, exists, delete, update
 
 from core.database import db_session
 from core.models import Member, BoardNew, Scrap, WriteBaseModel
-from lib.board_lib import is_owner, FileCache
+from lib.board_lib import is_owner
 from lib.common import remove_query_params, set_url_query_params
+from lib.fragment_cache import latest_cache
+from lib.fulltext import delete_fulltext_index
+from service.board_count_service import BoardCountService
 from service.board_file_service import BoardFileService
 from service.point_service import PointService
 from .board import BoardService
@@ -123,6 +126,8 @@ class DeletePostService(BoardService):
 
         # 원글+댓글 삭제
         db.execute(delete(write_model).filter_by(wr_parent=self.wr_id))
+        # 전문검색 색인 삭제
+        delete_fulltext_index(db, bo_table, [write.wr_id for write in writes])
 
         # 최근 게시물 삭제
         db.execute(delete(BoardNew).where(
@@ -146,8 +151,9 @@ class DeletePostService(BoardService):
         db.commit()
         db.close()
 
-        # 최신글 캐시 삭제
-        FileCache().delete_prefix(f'latest-{bo_table}')
+        # 최신글, 게시글 수 캐시 삭제
+        latest_cache.invalidate(bo_table)
+        BoardCountService.invalidate(bo_table)
 
 
 class DeleteCommentService(DeletePostService):
@@ -230,8 +236,11 @@ class DeleteCommentService(DeletePostService):
             update(write_model).values(wr_comment=write_model.wr_comment - 1)
             .where(write_model.wr_id == self.comment.wr_parent)
         )
+        # 게시판 댓글 갯수 1 감소
+        self.board.bo_count_comment -= 1
 
         self.db.commit()
+        BoardCountService.invalidate(self.bo_table)
 
 
 class ListDeleteService(BoardService):
@@ -272,6 +281,11 @@ class ListDeleteService(BoardService):
         ).all()
         for write in writes:
             self.db.delete(write)
+            # 게시판 글/댓글 갯수 감소
+            if write.wr_is_comment:
+                self.board.bo_count_comment -= 1
+            else:
+                self.board.bo_count_write -= 1
             # 원글 포인트 삭제
             if not self.point_service.delete_point(write.mb_id, self.bo_table, write.wr_id, "쓰기"):
                 self.point_service.save_point(write.mb_id, self.board.bo_write_point * (-1),
@@ -283,7 +297,8 @@ class ListDeleteService(BoardService):
             # TODO: 댓글 삭제
         self.db.commit()
 
-        # 최신글 캐시 삭제
-        FileCache().delete_prefix(f'latest-{self.bo_table}')
+        # 최신글, 게시글 수 캐시 삭제
+        latest_cache.invalidate(self.bo_table)
+        BoardCountService.invalidate(self.bo_table)
 
         # TODO: 게시글 삭제시 같이 삭제해야할 것들 추가
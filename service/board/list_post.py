@@ -1,11 +1,16 @@
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, Dict, List, Optional
 from fastapi import Request, Path, Depends
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import and_, asc, desc, func, or_, select
 
 from core.database import db_session
 from core.models import WriteBaseModel
 from lib.dependency.dependencies import common_search_query_params
-from lib.board_lib import get_list_thumbnail, write_search_filter, get_list, cut_name, is_owner
+from lib.board_thumbnail import get_thumbnail_records
+from lib.board_lib import (
+    get_list_thumbnail, write_search_filter, get_list, cut_name, is_owner,
+    encode_list_cursor, decode_list_cursor
+)
+from service.board_count_service import BoardCountService
 from service.board_file_service import BoardFileService
 from service.ajax import AJAXService
 from . import BoardService
@@ -28,11 +33,15 @@ class ListPostService(BoardService):
         if not self.is_list_level():
             self.raise_exception(detail="목록을 볼 권한이 없습니다.", status_code=403)
 
+        self.is_search = False
+        self.exclude_notice_ids = []
         self.query = self.get_query(search_params)
         self.file_service = file_service
         self.search_params = search_params
         self.prev_spt = None
         self.next_spt = None
+        self.prev_cursor: Optional[str] = None
+        self.next_cursor: Optional[str] = None
 
     @classmethod
     async def async_init(
@@ -46,6 +55,19 @@ class ListPostService(BoardService):
         instance = cls(request, db, bo_table, file_service, search_params)
         return instance
 
+    @property
+    def is_cursor_paging(self) -> bool:
+        """커서(seek) 페이징 사용 여부
+        - cursor 파라미터가 전달되고, 기본 정렬(wr_num, wr_reply)일 때만 사용합니다.
+        - 그 외의 경우 기존 페이지 번호(offset) 방식으로 동작합니다.
+        """
+        if "cursor" not in self.request.query_params:
+            return False
+        sst = self.search_params.get('sst')
+        if sst and hasattr(self.write_model, sst):
+            return False
+        return not self.board.bo_sort_field
+
     def get_query(self, search_params: dict) -> select:
         """쿼리를 생성합니다."""
         sca = self.request.query_params.get("sca")
@@ -74,7 +96,8 @@ class ListPostService(BoardService):
         else:
             self.query = self.get_list_sort_query(self.write_model, self.query)
 
-        if (sca or (sfl and stx)):  # 검색일 경우
+        self.is_search = bool(sca or (sfl and stx))
+        if self.is_search:  # 검색일 경우
             search_part = int(self.config.cf_search_part) or 10000
             min_spt = self.db.scalar(
                 select(func.coalesce(func.min(self.write_model.wr_num), 0)))
@@ -103,20 +126,37 @@ class ListPostService(BoardService):
         """
         게시글 목록에 부가 정보를 추가합니다.
         (댓글, 좋아요, 회원 이미지, 회원 아이콘, 썸네일, 첨부파일)
+        - 댓글, 첨부파일, 좋아요, 썸네일 정보는 목록의 게시글 전체를 대상으로 한번에 조회합니다.
         """
-        ajax_service = AJAXService(self.request, self.db)
-        for write in writes:
-            write.num = total_count - offset - writes.index(write)
-            write = get_list(self.request, self.db, write, self)
-
-            # 댓글 정보를 불러와서 write에 추가합니다.
-            comments: List[WriteBaseModel] = self.db.scalars(
-            select(self.write_model).filter_by(
-                    wr_parent=write.wr_id,
-                    wr_is_comment=1
-                ).order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
-            ).all()
+        if not writes:
+            return writes
 
+        wr_ids = [write.wr_id for write in writes]
+        comments_by_parent = self.get_comments_by_parents(wr_ids)
+        files_by_wr_id = self.file_service.get_board_files_by_wr_ids(self.bo_table, wr_ids)
+        ajax_service = AJAXService(self.request, self.db)
+        good_data_by_wr_id = ajax_service.get_ajax_good_data_by_wr_ids(self.bo_table, wr_ids)
+        thumbnail_records = get_thumbnail_records(self.db, self.bo_table, wr_ids)
+
+        # 같은 회원의 이미지/아이콘 경로는 한번만 조회합니다.
+        member_image_paths = {}
+        member_icon_paths = {}
+
+        def _set_member_paths(obj: WriteBaseModel):
+            mb_id = obj.mb_id
+            if mb_id not in member_image_paths:
+                member_image_paths[mb_id] = self.get_member_image_path(mb_id)
+                member_icon_paths[mb_id] = self.get_member_icon_path(mb_id)
+            obj.mb_image_path = member_image_paths[mb_id]
+            obj.mb_icon_path = member_icon_paths[mb_id]
+
+        for index, write in enumerate(writes):
+            write.num = total_count - offset - index
+            board_files = files_by_wr_id.get(write.wr_id, [])
+            write = get_list(self.request, self.db, write, self, file_exists=bool(board_files))
+
+            # 댓글 정보를 write에 추가합니다.
+            comments = comments_by_parent.get(write.wr_id, [])
             for comment in comments:
                 comment.name = cut_name(self.request, comment.wr_name)
                 comment.ip = self.get_display_ip(comment.wr_ip)
@@ -126,16 +166,15 @@ class ListPostService(BoardService):
                 comment.is_secret = "secret" in comment.wr_option
 
                 # 회원 이미지, 아이콘 경로 설정
-                comment.mb_image_path = self.get_member_image_path(comment.mb_id)
-                comment.mb_icon_path = self.get_member_icon_path(comment.mb_id)
+                _set_member_paths(comment)
 
                 # 비밀댓글 처리
+                # 댓글의 부모글은 현재 게시글(write)이므로 별도로 조회하지 않습니다.
                 session_secret_comment_name = f"ss_secret_comment_{self.bo_table}_{comment.wr_id}"
-                parent_write = self.db.get(self.write_model, comment.wr_parent)
                 if (comment.is_secret
                         and not self.member.admin_type
                         and not is_owner(comment, self.member.mb_id)
-                        and not is_owner(parent_write, self.member.mb_id)
+                        and not is_owner(write, self.member.mb_id)
                         and not self.request.session.get(session_secret_comment_name)):
                     comment.is_secret_content = True
                     comment.save_content = "비밀글 입니다."
@@ -144,21 +183,48 @@ class ListPostService(BoardService):
                     comment.save_content = comment.wr_content
             write.comments = comments
 
+            images, normal_files = self.file_service.split_files_by_type(board_files)
             # 게시글 목록 조회시 첨부된 파일을 함께 가져올 경우, default는 False
             if with_files:
-                write.images, write.normal_files = self.file_service.get_board_files_by_type(self.bo_table, write.wr_id)
+                write.images, write.normal_files = images, normal_files
 
             # 회원 이미지, 아이콘 경로 설정
-            write.mb_image_path = self.get_member_image_path(write.mb_id)
-            write.mb_icon_path = self.get_member_icon_path(write.mb_id)
+            _set_member_paths(write)
 
             # 게시글 좋아요/싫어요 정보 설정
-            ajax_good_data = ajax_service.get_ajax_good_data(self.bo_table, write)
+            ajax_good_data = good_data_by_wr_id[write.wr_id]
             write.good = ajax_good_data["good"]
             write.nogood = ajax_good_data["nogood"]
 
             # 게시글 썸네일 설정
-            write.thumbnail = get_list_thumbnail(self.request, self.board, write, self.gallery_width, self.gallery_height)
+            write.thumbnail = get_list_thumbnail(self.request, self.board, write,
+                                                 self.gallery_width, self.gallery_height,
+                                                 images=images, records=thumbnail_records)
+
+        return writes
+
+    def get_comments_by_parents(self, wr_ids: List[int]) -> Dict[int, List[WriteBaseModel]]:
+        """여러 게시글의 댓글 목록을 한번에 가져옵니다.
+
+        Args:
+            wr_ids (List[int]): 게시글 아이디 목록
+
+        Returns:
+            Dict[int, List[WriteBaseModel]]: 게시글 아이디(wr_parent)별 댓글 목록
+        """
+        comments_by_parent = {}
+        comments = self.db.scalars(
+            select(self.write_model)
+            .where(
+                self.write_model.wr_parent.in_(wr_ids),
+                self.write_model.wr_is_comment == 1
+            )
+            .order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
+        ).all()
+        for comment in comments:
+            comments_by_parent.setdefault(comment.wr_parent, []).append(comment)
+
+        return comments_by_parent
 
     def get_writes(self, with_files=False, page=1, per_page=None, with_notice=False) -> List[WriteBaseModel]:
         """게시글 목록을 가져옵니다."""
@@ -172,6 +238,10 @@ class ListPostService(BoardService):
         if not with_notice:
             notice_ids = self.get_notice_list()
             self.query = self.query.where(self.write_model.wr_id.notin_(notice_ids))
+            self.exclude_notice_ids = notice_ids
+
+        if self.is_cursor_paging:
+            return self.get_writes_by_cursor(page_rows, with_files)
 
         # 페이지 번호에 따른 offset 계산
         offset = (current_page - 1) * page_rows
@@ -188,17 +258,74 @@ class ListPostService(BoardService):
 
         return writes
 
+    def get_writes_by_cursor(self, page_rows: int, with_files=False) -> List[WriteBaseModel]:
+        """커서(seek) 방식으로 게시글 목록을 가져옵니다.
+        - OFFSET 대신 (wr_num, wr_reply) 인덱스를 기준으로 다음/이전 게시글을 조회하므로
+          뒤쪽 페이지로 갈수록 느려지지 않습니다.
+        - 다음/이전 페이지 커서는 self.next_cursor, self.prev_cursor에 저장합니다.
+        """
+        try:
+            cursor = decode_list_cursor(self.request.query_params.get("cursor", ""))
+        except ValueError as e:
+            self.raise_exception(detail=str(e), status_code=400)
+
+        model = self.write_model
+        query = self.query.add_columns(model).order_by(None)
+        direction = cursor.get("direction", "next")
+        offset = cursor.get("offset", 0)
+        if cursor:
+            wr_num, wr_reply = cursor["wr_num"], cursor["wr_reply"]
+            if direction == "next":
+                query = query.where(or_(
+                    model.wr_num > wr_num,
+                    and_(model.wr_num == wr_num, model.wr_reply > wr_reply)
+                ))
+            else:
+                query = query.where(or_(
+                    model.wr_num < wr_num,
+                    and_(model.wr_num == wr_num, model.wr_reply < wr_reply)
+                ))
+
+        # 다음 게시글이 있는지 확인하기 위해 1개를 더 조회합니다.
+        if direction == "next":
+            query = query.order_by(model.wr_num, model.wr_reply)
+        else:
+            query = query.order_by(desc(model.wr_num), desc(model.wr_reply))
+        writes = list(self.db.scalars(query.limit(page_rows + 1)).all())
+        has_more = len(writes) > page_rows
+        writes = writes[:page_rows]
+        if direction == "prev":
+            writes.reverse()
+
+        if writes:
+            has_next = has_more if direction == "next" else True
+            has_prev = bool(cursor) and (has_more if direction == "prev" else True)
+            if has_next:
+                self.next_cursor = encode_list_cursor(writes[-1], "next", offset + page_rows)
+            if has_prev:
+                self.prev_cursor = encode_list_cursor(writes[0], "prev", offset - page_rows)
+
+        total_count = self.get_total_count()
+
+        # 게시글 부가 정보 추가 (댓글, 좋아요, 썸네일 등)
+        self.add_additional_info_to_writes(writes, total_count, offset, with_files)
+
+        return writes
+
     def get_notice_writes(self, with_files=False) -> List[WriteBaseModel]:
         """게시글 중 공지사항 목록을 가져옵니다."""
         current_page = self.search_params.get('current_page')
         sca = self.request.query_params.get("sca")
         notice_writes = []
+        if self.is_cursor_paging:
+            # 커서 페이징은 첫 페이지(커서 없음)에서만 공지사항을 출력합니다.
+            current_page = 1 if not self.request.query_params.get("cursor") else 0
         if current_page == 1:
             notice_ids = self.get_notice_list()
             notice_query = select(self.write_model).where(self.write_model.wr_id.in_(notice_ids))
             if sca:
                 notice_query = notice_query.where(self.write_model.ca_name == sca)
-            notice_writes = [get_list(self.request, self.db, write, self) for write in self.db.scalars(notice_query).all()]
+            notice_writes = self.db.scalars(notice_query).all()
 
         # 게시글 부가 정보 추가 (댓글, 좋아요, 썸네일 등)
         self.add_additional_info_to_writes(notice_writes, len(notice_writes), 0, with_files)
@@ -206,6 +333,12 @@ class ListPostService(BoardService):
         return notice_writes
 
     def get_total_count(self) -> int:
-        """쿼리문을 통해 불러오는 게시글의 수"""
-        total_count = self.db.scalar(self.query.add_columns(func.count()).order_by(None))
-        return total_count
+        """쿼리문을 통해 불러오는 게시글의 수
+        - 검색이 아닌 경우 게시판의 게시글 수(bo_count_write)를 사용합니다.
+        - 검색인 경우 같은 조건의 게시글 수를 캐시하여 재사용합니다.
+        """
+        count_service = BoardCountService(self.db)
+        if not self.is_search:
+            return count_service.get_write_count(self.board, self.exclude_notice_ids)
+
+        return count_service.get_count(self.bo_table, self.query)
@@ -11,6 +11,7 @@ from lib.template_filters import number_format
 from lib.html_sanitizer import content_sanitizer
 from lib.pbkdf2 import create_hash
 from api.v1.models.board import WriteModel, CommentModel
+from service.board_count_service import BoardCountService
 from service.point_service import PointService
 from . import BoardService
 
@@ -53,6 +54,7 @@ class UpdatePostService(BoardService):
                 .values(ca_name=data.ca_name)
             )
             self.db.commit()
+            BoardCountService.invalidate(self.bo_table)
 
     def save_write(self, write, data: Union[WriteForm, WriteModel]):
         """게시글 수정 사항을 저장"""
@@ -60,6 +62,7 @@ class UpdatePostService(BoardService):
             if value:
                 setattr(write, field, value)
         self.db.commit()
+        BoardCountService.invalidate(self.bo_table)
 
 
 class CommentService(UpdatePostService):
@@ -167,8 +170,11 @@ class CommentService(UpdatePostService):
 
         # 게시글에 댓글 수 증가
         write.wr_comment +=  1
+        # 게시판 댓글 갯수 1 증가
+        self.board.bo_count_comment += 1
 
         self.db.commit()
+        BoardCountService.invalidate(self.bo_table)
         return comment
 
     def add_point(self, comment: WriteBaseModel):
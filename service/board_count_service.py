@@ -0,0 +1,174 @@
+"""게시판 게시글 수 관련 기능을 제공하는 서비스 모듈입니다."""
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from cachetools import TTLCache
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.sql.expression import Select
+
+from core.database import db_session
+from core.models import Board
+from lib.common import dynamic_create_write_table
+
+
+class BoardCountService():
+    """
+    게시판 게시글 수 조회 서비스 클래스입니다.
+    - 검색 조건이 없는 목록의 게시글 수는 게시판의 게시글 수(bo_count_write)로 응답합니다.
+    - 검색 조건(분류, 검색어)이 있는 게시글 수는 게시판/조건별로 TTL 캐시에 보관합니다.
+    - 게시글 작성/수정/삭제/이동 시 invalidate()로 해당 게시판의 캐시를 비웁니다.
+    """
+    cache = TTLCache(maxsize=4096, ttl=300)
+    # TTLCache는 스레드에 안전하지 않으므로 조회/저장/순회는 잠금 안에서 실행합니다.
+    cache_lock = threading.Lock()
+    # 다른 uvicorn worker의 캐시를 무효화하기 위한 게시판별 버전 파일 경로
+    version_dir = os.path.join("data", "board_count")
+
+    def __init__(self, db: db_session):
+        self.db = db
+
+    @classmethod
+    def get_version(cls, bo_table: str) -> int:
+        """게시판별 버전 파일의 수정시간(ns)을 반환합니다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+
+        Returns:
+            int: 버전 스탬프. 파일이 없으면 0
+        """
+        try:
+            return os.stat(os.path.join(cls.version_dir, bo_table)).st_mtime_ns
+        except OSError:
+            return 0
+
+    @classmethod
+    def invalidate(cls, bo_table: str) -> None:
+        """게시판의 게시글 수 캐시를 모든 worker에서 무효화합니다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+        """
+        with cls.cache_lock:
+            for key in [key for key in list(cls.cache.keys()) if key[0] == bo_table]:
+                cls.cache.pop(key, None)
+
+        os.makedirs(cls.version_dir, exist_ok=True)
+        with open(os.path.join(cls.version_dir, bo_table), "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+
+    def get_cached(self, key: Tuple) -> Optional[int]:
+        """캐시된 게시글 수를 반환합니다. 없으면 None"""
+        with self.cache_lock:
+            return self.cache.get(key)
+
+    def set_cached(self, key: Tuple, count: int) -> None:
+        """게시글 수를 캐시에 저장합니다."""
+        with self.cache_lock:
+            self.cache[key] = count
+
+    @staticmethod
+    def make_query_key(query: Select) -> Tuple[str, str]:
+        """검색 쿼리의 SQL과 파라미터로 캐시 키를 생성합니다."""
+        compiled = query.compile()
+        return str(compiled), repr(sorted(compiled.params.items()))
+
+    def get_count(self, bo_table: str, query: Select) -> int:
+        """검색 쿼리의 게시글 수를 반환합니다.
+        - 같은 게시판/조건의 게시글 수는 캐시된 값을 반환합니다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+            query (Select): 게시글 검색 쿼리
+
+        Returns:
+            int: 게시글 수
+        """
+        count_query = query.add_columns(func.count()).order_by(None)
+        key = (bo_table, self.get_version(bo_table), self.make_query_key(count_query))
+        count = self.get_cached(key)
+        if count is None:
+            count = self.db.scalar(count_query) or 0
+            self.set_cached(key, count)
+        return count
+
+    def get_counts(self, queries: Dict[str, Select]) -> Dict[str, int]:
+        """여러 게시판의 검색 쿼리 게시글 수를 반환합니다.
+        - 캐시에 없는 게시판만 UNION ALL 쿼리 한번으로 조회합니다.
+
+        Args:
+            queries (Dict[str, Select]): 게시판 테이블명별 게시글 검색 쿼리
+
+        Returns:
+            Dict[str, int]: 게시판 테이블명별 게시글 수
+        """
+        counts = {}
+        missing_keys = {}
+        for bo_table, query in queries.items():
+            count_query = query.add_columns(func.count()).order_by(None)
+            key = (bo_table, self.get_version(bo_table), self.make_query_key(count_query))
+            count = self.get_cached(key)
+            if count is None:
+                missing_keys[bo_table] = key
+            else:
+                counts[bo_table] = count
+
+        if missing_keys:
+            union_query = union_all(*[
+                queries[bo_table]
+                .add_columns(literal(bo_table).label("bo_table"), func.count().label("count"))
+                .order_by(None)
+                for bo_table in missing_keys
+            ])
+            rows = dict(self.db.execute(union_query).tuples().all())
+            for bo_table, key in missing_keys.items():
+                counts[bo_table] = rows.get(bo_table) or 0
+                self.set_cached(key, counts[bo_table])
+
+        return counts
+
+    def get_write_count(self, board: Board, exclude_ids: Iterable = None) -> int:
+        """검색 조건이 없는 게시판 목록의 게시글 수(댓글 제외)를 반환합니다.
+        - 게시글 테이블을 조회하지 않고 게시판의 게시글 수(bo_count_write)를 사용합니다.
+
+        Args:
+            board (Board): 게시판
+            exclude_ids (Iterable, optional): 목록에서 제외할 게시글 아이디 목록(공지사항). Defaults to None.
+
+        Returns:
+            int: 게시글 수
+        """
+        count = board.bo_count_write or 0
+        exclude_ids = tuple(sorted({int(wr_id) for wr_id in exclude_ids or [] if str(wr_id).isdigit()}))
+        if exclude_ids:
+            # 공지사항 중 실제로 존재하는 게시글 수만큼 제외합니다.
+            write_model = dynamic_create_write_table(board.bo_table)
+            key = (board.bo_table, self.get_version(board.bo_table), ("exclude", exclude_ids))
+            exclude_count = self.get_cached(key)
+            if exclude_count is None:
+                exclude_count = self.db.scalar(
+                    select(func.count())
+                    .where(write_model.wr_id.in_(exclude_ids), write_model.wr_is_comment == 0)
+                ) or 0
+                self.set_cached(key, exclude_count)
+            count -= exclude_count
+
+        return max(count, 0)
+
+    def recount(self, board: Board) -> None:
+        """게시글 테이블을 기준으로 게시판의 게시글/댓글 수를 다시 계산합니다.
+        - 변경된 값은 호출한 쪽에서 commit 합니다.
+
+        Args:
+            board (Board): 게시판
+        """
+        write_model = dynamic_create_write_table(board.bo_table)
+        counts = dict(self.db.execute(
+            select(write_model.wr_is_comment, func.count())
+            .group_by(write_model.wr_is_comment)
+        ).all())
+        board.bo_count_write = counts.get(0, 0)
+        board.bo_count_comment = counts.get(1, 0)
+        self.invalidate(board.bo_table)
@@ -1,12 +1,13 @@
 """게시판 파일 관련 기능을 제공하는 서비스 모듈입니다."""
 import os
 import shutil
-from typing import List
+from typing import Dict, List, Set, Tuple
 from fastapi import Request, UploadFile
-from sqlalchemy import exists, func, insert, select
+from sqlalchemy import and_, exists, func, insert, or_, select
 
 from core.database import db_session
 from core.models import Board, BoardFile
+from lib.board_thumbnail import mark_thumbnail_changed
 
 
 class BoardFileService():
@@ -30,6 +31,27 @@ class BoardFileService():
             .select()
         )
 
+    def get_exist_write_keys(self, wr_ids_by_table: Dict[str, List[int]]) -> Set[Tuple[str, int]]:
+        """여러 게시판의 게시글 중 파일이 있는 게시글을 한번에 확인
+
+        Args:
+            wr_ids_by_table (Dict[str, List[int]]): 게시판 테이블명별 게시글 아이디 목록
+
+        Returns:
+            Set[Tuple[str, int]]: 파일이 있는 (게시판 테이블명, 게시글 아이디) 목록
+        """
+        conditions = [
+            and_(BoardFile.bo_table == bo_table, BoardFile.wr_id.in_(wr_ids))
+            for bo_table, wr_ids in wr_ids_by_table.items() if wr_ids
+        ]
+        if not conditions:
+            return set()
+
+        rows = self.db.execute(
+            select(BoardFile.bo_table, BoardFile.wr_id).where(or_(*conditions)).distinct()
+        ).all()
+        return {(bo_table, wr_id) for bo_table, wr_id in rows}
+
     def is_upload_extension(self, file: UploadFile) -> bool:
         """업로드 파일 확장자를 확인한다.
 
@@ -75,6 +97,33 @@ class BoardFileService():
             )
         ).all()
 
+    def get_board_files_by_wr_ids(self, bo_table: str, wr_ids: List[int]) -> Dict[int, List[BoardFile]]:
+        """여러 게시글의 업로드된 파일 목록을 한번에 가져온다.
+
+        Args:
+            bo_table (str): 게시판 코드
+            wr_ids (List[int]): 게시글 아이디 목록
+
+        Returns:
+            Dict[int, List[BoardFile]]: 게시글 아이디별 파일 목록 (파일이 없는 게시글은 제외)
+        """
+        files_by_wr_id = {}
+        if not wr_ids:
+            return files_by_wr_id
+
+        board_files = self.db.scalars(
+            select(BoardFile)
+            .where(
+                BoardFile.bo_table == bo_table,
+                BoardFile.wr_id.in_(wr_ids)
+            )
+            .order_by(BoardFile.wr_id, BoardFile.bf_no)
+        ).all()
+        for file in board_files:
+            files_by_wr_id.setdefault(file.wr_id, []).append(file)
+
+        return files_by_wr_id
+
     def get_board_files_by_form(self, board: Board, wr_id: int = None) -> List[BoardFile]:
         """입력/수정 폼에서 사용할 파일 목록을 가져온다.
 
@@ -108,6 +157,19 @@ class BoardFileService():
             list[BoardFile]: 이미지 목록
         """
         board_files = self.get_board_files(bo_table, wr_id)
+
+        return self.split_files_by_type(board_files)
+
+    def split_files_by_type(self, board_files: List[BoardFile]):
+        """파일 목록을 파일과 이미지로 분리한다.
+
+        Args:
+            board_files (List[BoardFile]): 파일 목록
+
+        Returns:
+            list[BoardFile]: 이미지 목록
+            list[BoardFile]: 파일 목록
+        """
         images = []
         files = []
         for file in board_files:
@@ -165,6 +227,8 @@ class BoardFileService():
                 bf_filesize=file.size
             )
         )
+        # 일괄 처리 쿼리는 ORM 이벤트가 발생하지 않으므로 썸네일 재생성을 직접 기록합니다.
+        mark_thumbnail_changed(self.db, bo_table, wr_id)
         self.db.commit()
 
     def update_board_file(self, board_file: BoardFile,
@@ -6,10 +6,12 @@ from sqlalchemy import func, select, Select
 from core.models import Board, BoardNew
 from core.database import db_session
 from core.exception import AlertException
-from lib.common import dynamic_create_write_table, cut_name, FileCache
+from lib.common import dynamic_create_write_table, cut_name
 from lib.board_lib import BoardConfig, get_list, get_list_thumbnail
+from lib.fragment_cache import latest_cache
 from service import BaseService
 from service.ajax.ajax import AJAXService
+from service.board_count_service import BoardCountService
 from service.board_file_service import BoardFileService
 from service.point_service import PointService
 from api.v1.service.member import MemberImageServiceAPI
@@ -163,6 +165,7 @@ class BoardNewService(BaseService):
         """최신글 삭제"""
         # 새글 정보 조회
         board_news = self.db.scalars(select(BoardNew).where(BoardNew.bn_id.in_(bn_ids))).all()
+        deleted_tables = set()
         for new in board_news:
             board = self.db.get(Board, new.bo_table)
             write_model = dynamic_create_write_table(new.bo_table)
@@ -172,6 +175,7 @@ class BoardNewService(BaseService):
                     # 게시글 삭제
                     # TODO: 게시글 삭제 공용함수 추가
                     self.db.delete(write)
+                    board.bo_count_write -= 1
 
                     # 원글 포인트 삭제
                     if not self.point_service.delete_point(write.mb_id, board.bo_table, write.wr_id, "쓰기"):
@@ -181,6 +185,7 @@ class BoardNewService(BaseService):
                     # 댓글 삭제
                     # TODO: 댓글 삭제 공용함수 추가
                     self.db.delete(write)
+                    board.bo_count_comment -= 1
 
                     # 댓글 포인트 삭제
                     if not self.point_service.delete_point(write.mb_id, board.bo_table, write.wr_id, "댓글"):
@@ -189,14 +194,18 @@ class BoardNewService(BaseService):
                 # 파일 삭제
                 self.file_service.delete_board_files(board.bo_table, write.wr_id)
 
+                deleted_tables.add(board.bo_table)
+
             # 최신글 삭제
             self.db.delete(new)
 
-            # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{new.bo_table}')
-
         self.db.commit()
 
+        # 최신글, 게시글 수 캐시 삭제
+        for bo_table in deleted_tables:
+            latest_cache.invalidate(bo_table)
+            BoardCountService.invalidate(bo_table)
+
 
 class BoardNewServiceAPI(BoardNewService):
     """
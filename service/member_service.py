@@ -17,7 +17,8 @@ from core.exception import AlertException, JSONException
 from core.models import Member
 from lib.common import filter_words, get_client_ip, is_none_datetime, check_prohibit_words
 from lib.member import get_next_open_date, hide_member_id
-from lib.pbkdf2 import validate_password
+from lib.member_cache import member_cache
+from lib.password_hasher import password_hasher
 from service import BaseService
 
 
@@ -79,10 +80,42 @@ class MemberService(BaseService):
         # 아이디, 비밀번호 중 어떤 것이 틀렸는지 알려주지 않도록 하기 위해
         # self.fetch_member()를 호출하지 않습니다.
         member = self.fetch_member_by_id(mb_id)
-        if not member or not validate_password(password, member.mb_password):
+        if not member or not password_hasher.verify(password, member.mb_password):
             self.raise_exception(
                 status_code=403, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
 
+        if password_hasher.needs_rehash(member.mb_password):
+            self._update_password_hash(member, password_hasher.hash(password))
+
+        return self._check_login_member(member)
+
+    async def authenticate_member_async(self, mb_id: str, password: str) -> Member:
+        """
+        비밀번호를 검증하여 회원 인증을 수행합니다. (비동기 라우터용)
+        - 비밀번호 검증/암호화는 스레드 풀에서 실행하여 이벤트 루프를 멈추지 않습니다.
+        - 검증 조건은 authenticate_member()와 같습니다.
+        """
+        member = self.fetch_member_by_id(mb_id)
+        if not member or not await password_hasher.verify_async(password, member.mb_password):
+            self.raise_exception(
+                status_code=403, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
+
+        if password_hasher.needs_rehash(member.mb_password):
+            self._update_password_hash(member, await password_hasher.hash_async(password))
+
+        return self._check_login_member(member)
+
+    def _update_password_hash(self, member: Member, hashed_password: str) -> None:
+        """로그인한 회원의 비밀번호를 설정한 반복 횟수로 다시 암호화하여 저장합니다."""
+        self.db.execute(
+            update(Member).values(mb_password=hashed_password)
+            .where(Member.mb_id == member.mb_id)
+            .execution_options(mb_id=member.mb_id)
+        )
+        self.db.commit()
+
+    def _check_login_member(self, member: Member) -> Member:
+        """인증한 회원의 상태(탈퇴, 차단, 이메일 인증)를 확인합니다."""
         is_active, message = self.is_activated(member)
         if not is_active:
             self.raise_exception(status_code=403, detail=message)
@@ -90,7 +123,7 @@ class MemberService(BaseService):
         is_certified, message = self.is_member_email_certified(member)
         if not is_certified:
             key = hashlib.md5(f"{member.mb_ip}{member.mb_datetime}".encode()).hexdigest()
-            url = self.request.url_for("certify_email_update_form", mb_id=mb_id, key=key)
+            url = self.request.url_for("certify_email_update_form", mb_id=member.mb_id, key=key)
             self.raise_exception(status_code=403, detail=message, url=url)
 
         return member
@@ -100,8 +133,13 @@ class MemberService(BaseService):
         현재 회원 정보를 조회합니다.
         - 회원 정보가 없거나 탈퇴 또는 차단된 회원은 조회할 수 없습니다.
         - 이메일 인증이 완료되지 않은 회원은 조회할 수 없습니다.
+        - 로그인 세션/JWT 인증에 사용하므로 회원 정보 캐시(lib/member_cache.py)에서 조회합니다.
         """
-        member = self.read_member(mb_id)
+        member = self.fetch_cached_member_by_id(mb_id)
+        if not member:
+            self.raise_exception(
+                status_code=404, detail=f"{mb_id} : 회원정보가 없습니다.")
+
         is_active, message = self.is_activated(member)
         if not is_active:
             self.raise_exception(status_code=403, detail=message)
@@ -174,6 +212,7 @@ class MemberService(BaseService):
             if hasattr(member, key) and value is not None:
                 setattr(member, key, value)
         self.db.commit()
+        member_cache.invalidate(member.mb_id)
 
         return member
 
@@ -182,6 +221,7 @@ class MemberService(BaseService):
         self.db.execute(
             update(Member).values(mb_point=point)
             .where(Member.mb_id == mb_id)
+            .execution_options(mb_id=mb_id)
         )
         self.db.commit()
 
@@ -194,6 +234,7 @@ class MemberService(BaseService):
         member.mb_leave_date = datetime.now().strftime("%Y%m%d")
         member.mb_memo = f"{member.mb_memo}\n{datetime.now().strftime('%Y-%m-%d')}탈퇴함"
         self.db.commit()
+        member_cache.invalidate(member.mb_id)
 
     def find_id(self, mb_name: str, mb_email: str) -> Member:
         """
@@ -283,6 +324,10 @@ class MemberService(BaseService):
         """ID로 회원 정보를 데이터베이스에서 조회합니다."""
         return self.db.scalar(select(Member).where(Member.mb_id == mb_id))
 
+    def fetch_cached_member_by_id(self, mb_id: str) -> Optional[Member]:
+        """ID로 회원 정보를 회원 정보 캐시(lib/member_cache.py)에서 조회합니다. (로그인 회원 확인용)"""
+        return member_cache.get(self.db, mb_id, lambda: self.fetch_member_by_id(mb_id))
+
     def fetch_member_by_nick(self, mb_nick: str) -> Member:
         """닉네임으로 회원 정보를 데이터베이스에서 조회합니다."""
         return self.db.scalar(select(Member).where(Member.mb_nick == mb_nick))
@@ -1,14 +1,14 @@
 """메뉴 서비스를 제공하는 모듈입니다."""
-from typing import List
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
+from collections import defaultdict
+from typing import Dict, List, Tuple
 
 from fastapi import Request
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from core.database import db_session
 from core.exception import AlertException
 from core.models import Menu
+from lib.layout_cache import LAYOUT_MENUS, LayoutSnapshot, layout_cache
 from service import BaseService
 
 
@@ -24,27 +24,26 @@ class MenuService(BaseService):
     def raise_exception(self, status_code: int = 400, detail: str = None, url: str = None) -> None:
         raise AlertException(detail, status_code, url)
 
-    @cached(LRUCache(maxsize=128), key=lambda _: hashkey("menus"))
-    def fetch_menus(self) -> List[Menu]:
-        """사용자페이지 메뉴 조회 함수"""
-        menus = []
-        # 부모메뉴 조회
-        parent_menus = self.db.scalars(
-            select(Menu)
-            .where(func.char_length(Menu.me_code) == 2)
-            .order_by(Menu.me_order)
+    def fetch_menus(self) -> Tuple[LayoutSnapshot, ...]:
+        """사용자페이지 메뉴 조회 함수
+        - 레이아웃 캐시를 사용하며, 관리자 메뉴설정에서 저장하면 무효화됩니다.
+        """
+        return layout_cache.get(LAYOUT_MENUS, self._fetch_menus)
+
+    def _fetch_menus(self) -> Tuple[LayoutSnapshot, ...]:
+        """메뉴 트리를 조회하여 캐시할 수 있는 값 객체로 반환합니다.
+        - 전체 메뉴를 한번에 조회한 후 메뉴코드로 부모(2자리)/자식(4자리) 메뉴를 구성합니다.
+        """
+        menus = self.db.scalars(
+            select(Menu).order_by(Menu.me_order, Menu.me_id)
         ).all()
 
-        for menu in parent_menus:
-            parent_code = menu.me_code
-            # 자식 메뉴 조회
-            child_menus = self.db.scalars(
-                select(Menu).where(
-                    func.char_length(Menu.me_code) == 4,
-                    func.substr(Menu.me_code, 1, 2) == parent_code
-                ).order_by(Menu.me_order)
-            ).all()
-
-            menu.sub = child_menus
-            menus.append(menu)
-        return menus
+        children: Dict[str, List[LayoutSnapshot]] = defaultdict(list)
+        for menu in menus:
+            if len(menu.me_code) == 4:
+                children[menu.me_code[:2]].append(LayoutSnapshot.from_model(menu))
+
+        return tuple(
+            LayoutSnapshot.from_model(menu, sub=tuple(children[menu.me_code]))
+            for menu in menus if len(menu.me_code) == 2
+        )
@@ -1,15 +1,18 @@
 """포인트 관련 기능을 제공하는 서비스 모듈입니다."""
+import logging
 import uuid
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import List, Optional
 from typing_extensions import Annotated
 
 from fastapi import Depends, Request
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.exception import AlertException
 from core.models import Member, Point
+from lib.config_cache import config_cache
 from service import BaseService
 from service.member_service import MemberService
 
@@ -92,13 +95,17 @@ class PointService(BaseService):
             if self.point_term > 0:
                 expire_days = expire if expire > 0 else self.point_term
                 after_datetime = timedelta(days=expire_days - 1)
-                po_expire_date = (datetime.now() + after_datetime).strftime('%Y-%m-%d')
+                po_expire_date = (datetime.now() + after_datetime).date()
         else:
             po_expired = 1
             po_expire_date = datetime.now()
 
-        mb_point = self.get_total_point(mb_id)
-        po_mb_point = mb_point + point
+        # 사용한 포인트는 적립된 포인트 내역에서 차감
+        if point < 0:
+            self._consume_points(mb_id, point)
+
+        # 회원 포인트 잔액 갱신 (포인트 내역과 같은 트랜잭션에서 처리)
+        po_mb_point = self._add_member_point(mb_id, point)
 
         new_point = Point(
             mb_id=mb_id,
@@ -113,9 +120,7 @@ class PointService(BaseService):
             po_rel_action=rel_action
         )
         self.db.add(new_point)
-
-        # 회원 포인트 갱신
-        self.member_service.update_member_point(mb_id, po_mb_point)
+        self.db.commit()
 
     def get_config_point(self, cf_name: str) -> int:
         """
@@ -126,16 +131,17 @@ class PointService(BaseService):
     def get_total_point(self, mb_id: str) -> int:
         """
         회원의 포인트 총합
+        - 포인트 내역을 합산하지 않고 회원 테이블의 포인트 잔액(mb_point)을 반환합니다.
+        - 유효기간이 지난 포인트는 스케줄러(expire_points_job)가 매일 소멸 처리합니다.
         """
-        # 만료된 포인트들을 소진 처리
-        expire_point = self._fetch_expire_points(mb_id)
-        if expire_point > 0:
-            self._insert_expire_point(mb_id, expire_point)
-
-        # 만료된 포인트 내역 업데이트
-        self._update_expired_points(mb_id)
+        mb_point = self.db.scalar(select(Member.mb_point).where(Member.mb_id == mb_id))
+        return int(mb_point) if mb_point else 0
 
-        # 포인트 총합
+    def calculate_total_point(self, mb_id: str) -> int:
+        """
+        포인트 내역을 합산한 회원의 포인트 총합
+        - 포인트 내역을 삭제한 경우 회원 포인트 잔액을 다시 계산할 때 사용합니다.
+        """
         point_sum = self.db.scalar(
             select(func.sum(Point.po_point))
             .where(Point.mb_id == mb_id)
@@ -147,45 +153,69 @@ class PointService(BaseService):
         """
         사용한 포인트 내역 입력&업데이트
         """
+        self._consume_points(mb_id, point, po_id)
+        self.db.commit()
+
+    def _consume_points(self, mb_id: str, point: int, exclude_po_id: int = None) -> int:
+        """
+        적립된 포인트 내역을 먼저 적립된(만료일이 빠른) 순서로 사용 처리합니다.
+        - 한번에 읽어가며 사용할 포인트를 배분하고, 한번의 UPDATE(executemany)로 반영합니다.
+        - 사용 처리할 포인트 내역은 잠금(FOR UPDATE)하며, commit은 호출한 쪽에서 처리합니다.
+
+        Args:
+            mb_id (str): 회원아이디
+            point (int): 사용한 포인트
+            exclude_po_id (int, optional): 제외할 포인트 내역 번호. Defaults to None.
+
+        Returns:
+            int: 사용 처리하지 못한 포인트 (사용 가능한 포인트가 부족한 경우)
+        """
         using_point = abs(point)
+        if not using_point:
+            return 0
+
         # 사용할 수 있는 포인트 내역 조회
         query = (
-            select(Point).where(
+            select(Point.po_id, Point.po_point, Point.po_use_point).where(
                 Point.mb_id == mb_id,
                 Point.po_expired == 0,
                 Point.po_point > Point.po_use_point
             )
         )
-        if po_id:
-            query.where(Point.po_id != po_id)
+        if exclude_po_id:
+            query = query.where(Point.po_id != exclude_po_id)
 
         order_list = [Point.po_id.asc()]
         if self.point_term:
             order_list.insert(0, Point.po_expire_date.asc())
 
-        points = self.db.scalars(query.order_by(*order_list)).all()
+        # 포인트 사용 배분 (필요한 만큼만 읽습니다.)
+        allocations = []
+        rows = self.db.execute(
+            query.order_by(*order_list).with_for_update().execution_options(yield_per=500)
+        )
+        for po_id, po_point, po_use_point in rows:
+            remaining = po_point - po_use_point
+            if remaining > using_point:
+                allocations.append({"b_po_id": po_id, "b_use_point": po_use_point + using_point, "b_expired": 0})
+                using_point = 0
+            else:
+                allocations.append({"b_po_id": po_id, "b_use_point": po_point, "b_expired": 100})
+                using_point -= remaining
+            if not using_point:
+                break
+        rows.close()
 
         # 포인트 사용처리
-        for row in points:
-            row_point = row.po_point
-            used_point = row.po_use_point
+        if allocations:
+            table = Point.__table__
+            self.db.execute(
+                update(table).where(table.c.po_id == bindparam("b_po_id"))
+                .values(po_use_point=bindparam("b_use_point"), po_expired=bindparam("b_expired")),
+                allocations
+            )
 
-            if (row_point - used_point) > using_point:
-                self.db.execute(
-                    update(Point).values(po_mb_point=Point.po_mb_point + using_point)
-                    .where(Point.po_id == row.po_id)
-                )
-                self.db.commit()
-            else:
-                deduction_point = row_point - used_point
-                self.db.execute(
-                    update(Point).values(
-                        po_use_point=(Point.po_use_point + deduction_point),
-                        po_expired=100
-                    ).where(Point.po_id == row.po_id)
-                )
-                self.db.commit()
-                using_point -= deduction_point
+        return using_point
 
     def delete_point(self, mb_id: str, rel_table: str, rel_id: str, rel_action: str) -> None:
         """
@@ -227,7 +257,7 @@ class PointService(BaseService):
                     self.db.commit()
 
                 # 회원 포인트 총합 갱신
-                sum_point = self.get_total_point(mb_id)
+                sum_point = self.calculate_total_point(mb_id)
                 self.member_service.update_member_point(mb_id, sum_point)
 
         return result
@@ -336,61 +366,98 @@ class PointService(BaseService):
                     Point.po_rel_action == rel_action)
         )
 
-    def _fetch_expire_points(self, mb_id: str) -> int:
-        """
-        회원의 만료 예정 포인트 얻기
-        """
-        if self.point_term <= 0:
-            return 0
-
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point - Point.po_use_point))
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired == 0,
-                   Point.po_expire_date < datetime.now())
-        )
-
-        return int(point_sum) if point_sum else 0
-
-    def _insert_expire_point(self, mb_id: str, point: int) -> None:
+    def _add_member_point(self, mb_id: str, point: int) -> int:
         """
-        만료된 포인트만큼 포인트를 소멸시킵니다.
+        회원 포인트 잔액을 증감하고 변경된 잔액을 반환합니다. (commit은 호출한 쪽에서 처리)
         """
-        member = self.member_service.fetch_member_by_id(mb_id)
-        mb_point = member.mb_point if member else 0
-        expired_point = point * (-1)
-        new_point = Point(
-            mb_id=mb_id,
-            po_content='포인트 소멸',
-            po_point=expired_point,
-            po_use_point=0,
-            po_mb_point=mb_point + expired_point,
-            po_expired=1,
-            po_rel_table='@expire',
-            po_rel_id=str(mb_id),
-            po_rel_action='expire-' + str(uuid.uuid4()),
-        )
-        self.db.add(new_point)
-        self.db.commit()
-
-        # 포인트를 사용한 경우 포인트 내역에 사용금액 기록
-        # TODO: 주석처리된 이유를 확인해야 함
-        if expired_point < 0:
-            # insert_use_point(mb_id, point)
-            pass
-
-    def _update_expired_points(self, mb_id: str) -> None:
-        if self.point_term <= 0:
-            return None
-
         self.db.execute(
-            update(Point).values(po_expired=1)
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired != 1,
-                   Point.po_expire_date != self.MAX_DATE,
-                   Point.po_expire_date < datetime.now()
-            )
+            update(Member).values(mb_point=Member.mb_point + point)
+            .where(Member.mb_id == mb_id)
+            .execution_options(mb_id=mb_id)
         )
-        self.db.commit()
-
-        return None
\ No newline at end of file
+        mb_point = self.db.scalar(select(Member.mb_point).where(Member.mb_id == mb_id))
+        return int(mb_point) if mb_point else 0
+
+
+def expire_points(db: Session, point_term: int, today: Optional[date] = None) -> int:
+    """
+    유효기간이 지난 포인트를 모든 회원에 대해 한번에 소멸 처리합니다.
+    - 회원별 소멸 포인트 내역을 추가하고 회원 포인트 잔액에서 차감합니다.
+    - 유효기간이 지난 포인트 내역은 만료(po_expired=1)로 변경합니다.
+
+    Args:
+        db (Session): DB 세션
+        point_term (int): 포인트 유효기간(일). 0 이하이면 처리하지 않습니다.
+        today (Optional[date], optional): 기준일. Defaults to None. (오늘)
+
+    Returns:
+        int: 포인트가 소멸된 회원 수
+    """
+    if point_term <= 0:
+        return 0
+    today = today or date.today()
+
+    # 회원별 소멸 포인트
+    expire_points_by_member = {
+        mb_id: int(point) for mb_id, point in db.execute(
+            select(Point.mb_id, func.sum(Point.po_point - Point.po_use_point))
+            .where(Point.po_expired == 0, Point.po_expire_date < today)
+            .group_by(Point.mb_id)
+        ).all() if point and point > 0
+    }
+
+    if expire_points_by_member:
+        member_table = Member.__table__
+        db.execute(
+            update(member_table)
+            .where(member_table.c.mb_id == bindparam("b_mb_id"))
+            .values(mb_point=member_table.c.mb_point - bindparam("b_point")),
+            [{"b_mb_id": mb_id, "b_point": point} for mb_id, point in expire_points_by_member.items()]
+        )
+        mb_ids = list(expire_points_by_member)
+        mb_points = {}
+        for i in range(0, len(mb_ids), 500):
+            mb_points.update(db.execute(
+                select(Member.mb_id, Member.mb_point).where(Member.mb_id.in_(mb_ids[i:i + 500]))
+            ).all())
+        db.execute(insert(Point), [
+            {
+                "mb_id": mb_id,
+                "po_datetime": datetime.now(),
+                "po_content": "포인트 소멸",
+                "po_point": point * (-1),
+                "po_use_point": 0,
+                "po_mb_point": mb_points.get(mb_id, 0),
+                "po_expired": 1,
+                "po_expire_date": today,
+                "po_rel_table": "@expire",
+                "po_rel_id": mb_id,
+                "po_rel_action": "expire-" + str(uuid.uuid4()),
+            }
+            for mb_id, point in expire_points_by_member.items()
+            if mb_id in mb_points
+        ])
+
+    # 만료된 포인트 내역 업데이트
+    db.execute(
+        update(Point).values(po_expired=1)
+        .where(Point.po_expired != 1,
+               Point.po_expire_date != PointService.MAX_DATE,
+               Point.po_expire_date < today)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    return len(expire_points_by_member)
+
+
+def expire_points_job() -> None:
+    """포인트 소멸 예약 작업 (매일 실행)"""
+    try:
+        with DBConnect().sessionLocal() as db:
+            config = config_cache.get(db)
+            count = expire_points(db, getattr(config, "cf_point_term", 0))
+            if count:
+                logging.info("포인트 소멸 처리: %s명", count)
+    except Exception as e:
+        logging.error("포인트 소멸 처리 실패", exc_info=e)
@@ -1,8 +1,6 @@
 """설문조사 관련 기능을 제공하는 서비스 모듈입니다."""
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
 from sqlalchemy import select
 
@@ -10,6 +8,7 @@ from core.database import db_session
 from core.exception import AlertException, AlertCloseException
 from core.models import Member, Poll, PollEtc
 from lib.common import get_client_ip
+from lib.layout_cache import LAYOUT_POLL, LayoutSnapshot, layout_cache
 from service import BaseService
 
 
@@ -131,17 +130,21 @@ class PollService(BaseService):
         self.db.delete(poll_etc)
         self.db.commit()
 
-    @cached(LRUCache(maxsize=1), key=lambda _: hashkey("latest_poll"))
-    def fetch_latest_poll(self):
+    def fetch_latest_poll(self) -> Optional[LayoutSnapshot]:
         """
         사용 설정된 최신 설문조사 1건을 조회합니다.
+        - 레이아웃 캐시를 사용하며, 관리자 설문조사관리에서 저장/삭제하면 무효화됩니다.
         """
+        return layout_cache.get(LAYOUT_POLL, self._fetch_latest_poll)
+
+    def _fetch_latest_poll(self) -> Optional[LayoutSnapshot]:
+        """최신 설문조사를 조회하여 캐시할 수 있는 값 객체로 반환합니다."""
         latest_poll = self.db.scalar(
             select(Poll)
             .where(Poll.po_use == 1)
             .order_by(Poll.po_id.desc())
         )
-        return latest_poll
+        return LayoutSnapshot.from_model(latest_poll) if latest_poll else None
 
 
 class ValidatePollService(BaseService):
@@ -2,14 +2,13 @@
 from datetime import date, datetime, timedelta
 from typing import List
 
-from cachetools import TTLCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
 from sqlalchemy import delete, desc, exists, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from core.database import db_session
 from core.models import Popular
 from lib.common import get_client_ip
+from lib.layout_cache import LAYOUT_POPULARS, LayoutSnapshot, layout_cache
 from service import BaseService
 
 
@@ -27,21 +26,25 @@ class PopularService(BaseService):
     def raise_exception(self, status_code: int, detail: str = None):
         pass
 
-    @cached(TTLCache(maxsize=128, ttl=60),
-            key=lambda self, limit=10, day=3: hashkey("populars", limit, day))
-    def fetch_populars(self, limit: int = 10, day: int = 3) -> List[Popular]:
+    def fetch_populars(self, limit: int = 10, day: int = 3) -> List[LayoutSnapshot]:
         """
         현재 날짜와 day일 전 날짜 사이의 인기검색어를 조회한다.
-        - TTL(Time To Live)캐시를 사용하여 조회한다.
+        - 레이아웃 캐시를 사용하여 조회한다. (보관시간 60초, 인기검색어 삭제시 무효화)
+        - 검색할 때마다 등록되는 인기검색어는 무효화하지 않고 보관시간이 지나면 반영한다.
 
         Args:
             limit (int, optional): 조회 갯수. Defaults to 7.
             day (int, optional): 오늘부터 {day}일 전. Defaults to 3.
 
         Returns:
-            List[Popular]: 인기검색어 리스트
+            List[LayoutSnapshot]: 인기검색어 리스트 (pp_word, count)
 
         """
+        return layout_cache.get(LAYOUT_POPULARS, lambda: self._fetch_populars(limit, day),
+                                key=(limit, day), ttl=60)
+
+    def _fetch_populars(self, limit: int, day: int) -> List[LayoutSnapshot]:
+        """인기검색어를 조회하여 캐시할 수 있는 값 객체로 반환합니다."""
         today = datetime.now()
         before_day = today - timedelta(days=day)
         populars = self.db.execute(
@@ -56,7 +59,7 @@ class PopularService(BaseService):
             .limit(limit)
         ).all()
 
-        return populars
+        return [LayoutSnapshot(pp_word=row.pp_word, count=row.count) for row in populars]
 
     def create_popular(self, request: Request, fields: str, word: str) -> None:
         """인기검색어를 생성합니다."""
@@ -99,4 +102,5 @@ class PopularService(BaseService):
             delete(Popular).where(Popular.pp_date < base_date)
         )
         self.db.commit()
+        layout_cache.invalidate(LAYOUT_POPULARS)
         return result.rowcount
@@ -1,7 +1,8 @@
 """전체검색 관련 기능을 제공하는 서비스 모듈입니다."""
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, Dict, List, Set
 from fastapi import Depends, Query, Request, HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.orm import selectinload
 
 from api.v1.dependencies.member import get_current_member_optional
 from core.models import Member, Board, Group, GroupMember
@@ -11,6 +12,8 @@ from lib.board_lib import BoardConfig, write_search_filter, get_list
 from lib.common import dynamic_create_write_table
 from lib.member import MemberDetails
 from service import BaseService
+from service.board_count_service import BoardCountService
+from service.board_file_service import BoardFileService
 
 
 class SearchService(BaseService):
@@ -62,6 +65,7 @@ class SearchService(BaseService):
         """게시판 목록 조회"""
         boards_query = (
             select(Board)
+            .options(selectinload(Board.group))
             .where(
                 Board.bo_use_search == 1,
                 Board.bo_list_level <= self.member.level,
@@ -73,6 +77,57 @@ class SearchService(BaseService):
         boards = self.db.scalars(boards_query).all()
         return boards
 
+    def get_member_group_ids(self) -> Set[str]:
+        """로그인 회원이 속한 그룹 아이디 목록 조회"""
+        if not self.member.mb_id:
+            return set()
+
+        return set(self.db.scalars(
+            select(GroupMember.gr_id).where(GroupMember.mb_id == self.member.mb_id)
+        ).all())
+
+    def get_search_writes(self, searches: List[dict], offset: int, per_page: int) -> Dict[str, list]:
+        """게시판별 검색 결과 게시글을 UNION ALL 쿼리 한번으로 조회
+
+        Args:
+            searches (List[dict]): 게시판별 검색 정보 (board, board_config, write_model, query)
+            offset (int): 게시판별 조회 시작 위치
+            per_page (int): 게시판별 조회 개수
+
+        Returns:
+            Dict[str, list]: 게시판 테이블명별 게시글 목록 (게시판 정렬 순서)
+        """
+        writes_by_table = {search["board"].bo_table: [] for search in searches}
+        if not searches:
+            return writes_by_table
+
+        # 게시판별 정렬/페이징은 서브쿼리에서 처리하고 결과는 게시판 테이블명으로 구분합니다.
+        union_query = union_all(*[
+            select(
+                search["query"]
+                .add_columns(literal(search["board"].bo_table).label("bo_table"),
+                             *search["write_model"].__table__.columns)
+                .offset(offset).limit(per_page)
+                .subquery()
+            )
+            for search in searches
+        ])
+        for row in self.db.execute(union_query).mappings():
+            writes_by_table[row["bo_table"]].append(row)
+
+        for search in searches:
+            bo_table = search["board"].bo_table
+            write_model = search["write_model"]
+            columns = [column.key for column in write_model.__table__.columns]
+            # 조회용 객체이므로 세션에 추가하지 않습니다. (비밀글 내용 변경이 저장되지 않도록)
+            writes = [write_model(**{key: row[key] for key in columns}) for row in writes_by_table[bo_table]]
+            # UNION ALL 결과의 순서는 보장되지 않으므로 게시판 정렬 순서로 다시 정렬합니다.
+            for field, is_desc in reversed(search["board_config"].get_list_sort_fields(write_model)):
+                writes.sort(key=lambda write: getattr(write, field), reverse=is_desc)
+            writes_by_table[bo_table] = writes
+
+        return writes_by_table
+
     def search(
         self,
         boards: List[Board],
@@ -82,27 +137,27 @@ class SearchService(BaseService):
         page: int = 1,
         per_page: int = 5
     ) -> dict:
-        """게시판 검색 데이터"""
+        """게시판 검색 데이터
+        - 게시판별 게시글 수와 게시글 목록을 각각 UNION ALL 쿼리 한번으로 조회합니다.
+        """
         if len(stx) < 2:
             self.raise_exception(status_code=400, detail="검색어는 2글자 이상 입력해 주세요.")
 
         remove_boards = []
         total_search_count = 0
         offset = (page - 1) * per_page
+        member_group_ids = None
+        searches = []
         for board in boards:
             board_config = BoardConfig(self.request, board)
             board.subject = board_config.subject
             # 그룹접근 사용이면서 그룹관리자도 아니고 그룹회원도 아닌 경우 boards에서 제외
             group = board.group
             if group.gr_use_access and not self.member.is_super_admin():
+                if member_group_ids is None:
+                    member_group_ids = self.get_member_group_ids()
                 is_group_admin = group.gr_admin == self.member.mb_id
-                group_member = self.db.scalar(
-                    select(GroupMember).where(
-                        GroupMember.gr_id == group.gr_id,
-                        GroupMember.mb_id == self.member.mb_id
-                    )
-                )
-                if not (is_group_admin or group_member):
+                if not (is_group_admin or group.gr_id in member_group_ids):
                     remove_boards.append(board)
                     continue
 
@@ -111,30 +166,59 @@ class SearchService(BaseService):
             query = write_search_filter(write_model, search_field=sfl,
                                         keyword=stx, operator=sop)
             query = board_config.get_list_sort_query(write_model, query)
-            board.search_count = self.db.scalar(query.add_columns(func.count()).order_by(None))
+            searches.append({
+                "board": board,
+                "board_config": board_config,
+                "write_model": write_model,
+                "query": query,
+            })
 
+        counts = BoardCountService(self.db).get_counts(
+            {search["board"].bo_table: search["query"] for search in searches}
+        )
+        for search in searches:
+            board = search["board"]
+            board.search_count = counts[board.bo_table]
             if board.search_count > 0:
-                board.writes = self.db.scalars(query.add_columns(write_model).\
-                                offset(offset).limit(per_page)).all()
                 total_search_count += board.search_count
-                for write in board.writes:
-                    write = get_list(self.request, self.db, write, board_config)
-                    if write.wr_is_comment:
-                        word = "댓글"
-                        parent_write = self.db.get(write_model, write.wr_parent)
-                        if parent_write:
-                            write.subject = parent_write.wr_subject
-                            write.href = f"/board/{board.bo_table}/{parent_write.wr_id}?{self.request.query_params}#c_{write.wr_id}"
-                    else:
-                        word = "글"
-                        write.href = f"/board/{board.bo_table}/{write.wr_id}?{self.request.query_params}"
-
-                    if "secret" in write.wr_option:
-                        write.wr_content = f"[비밀{word} 입니다.]"
             else:
                 # 검색 결과가 없으면 remove_boards 추가
                 remove_boards.append(board)
-                continue
+        searches = [search for search in searches if search["board"].search_count > 0]
+
+        writes_by_table = self.get_search_writes(searches, offset, per_page)
+        file_exists = BoardFileService(self.request, self.db).get_exist_write_keys(
+            {bo_table: [write.wr_id for write in writes] for bo_table, writes in writes_by_table.items()}
+        )
+        for search in searches:
+            board = search["board"]
+            board_config = search["board_config"]
+            write_model = search["write_model"]
+            board.writes = writes_by_table[board.bo_table]
+
+            # 댓글의 원글 제목을 한번에 조회
+            parent_ids = {write.wr_parent for write in board.writes if write.wr_is_comment}
+            parent_subjects = {}
+            if parent_ids:
+                parent_subjects = dict(self.db.execute(
+                    select(write_model.wr_id, write_model.wr_subject)
+                    .where(write_model.wr_id.in_(parent_ids))
+                ).tuples().all())
+
+            for write in board.writes:
+                write = get_list(self.request, self.db, write, board_config,
+                                 file_exists=(board.bo_table, write.wr_id) in file_exists)
+                if write.wr_is_comment:
+                    word = "댓글"
+                    if write.wr_parent in parent_subjects:
+                        write.subject = parent_subjects[write.wr_parent]
+                        write.href = f"/board/{board.bo_table}/{write.wr_parent}?{self.request.query_params}#c_{write.wr_id}"
+                else:
+                    word = "글"
+                    write.href = f"/board/{board.bo_table}/{write.wr_id}?{self.request.query_params}"
+
+                if "secret" in write.wr_option:
+                    write.wr_content = f"[비밀{word} 입니다.]"
 
         # boards에서 제외된 게시판 제거
         for board in remove_boards:
@@ -1,21 +1,26 @@
 """방문자 서비스를 제공하는 모듈입니다."""
+from collections import Counter, defaultdict
 from datetime import date, datetime, timedelta
+import os
 import re
-from typing import Union
+from typing import Dict, Iterable, List, Set, Tuple, Union
 
 from fastapi import Request
-from sqlalchemy import exists, func, select
-from user_agents import parse
+from filelock import FileLock
+from sqlalchemy import exists, insert, select, update
 
 from core.database import db_session
 from core.models import Config, Visit, VisitSum
 from lib.common import get_client_ip
+from lib.user_agent import user_agent_cache
 
 
 class VisitService:
     """
     방문자 관련 서비스를 제공하는 종속성 주입 클래스입니다.
     """
+    # 접속 이력 저장 잠금 파일 (여러 worker의 중복 저장 방지)
+    lock_file_path = os.path.join("data", "visit.lock")
 
     def __init__(self, request: Request, db: db_session) -> None:
         self.request = request
@@ -44,31 +49,59 @@ class VisitService:
         - 방문자 합계 테이블 갱신
         - 기본설정 테이블에 방문자 수 기록
         """
-        vi_ip = get_client_ip(self.request)
-        if self.is_exists_visit(vi_ip, self.today):
+        inserted = self.save_visits([self.make_visit_record(self.request)])
+        if not inserted:
             return None
 
-        referer = self.request.headers.get("referer", "")
-        user_agent = self.request.headers.get("User-Agent", "")
-        browser, os, device = self._parse_user_agent(user_agent)
-        visit = Visit(
-            vi_ip=vi_ip,
-            vi_date=self.today,
-            vi_time=datetime.now().time(),
-            vi_referer=referer,
-            vi_agent=user_agent,
-            vi_browser=browser,
-            vi_os=os,
-            vi_device=device,
-        )
-        self.db.add(visit)
-        self.db.commit()
-        self.db.refresh(visit)
+        return Visit(**inserted[0])
+
+    @staticmethod
+    def make_visit_record(request: Request) -> dict:
+        """요청 정보로 접속 이력(저장 전)을 생성합니다."""
+        return {
+            "vi_ip": get_client_ip(request),
+            "vi_date": date.today(),
+            "vi_time": datetime.now().time(),
+            "vi_referer": request.headers.get("referer", ""),
+            "vi_agent": request.headers.get("User-Agent", ""),
+        }
+
+    def save_visits(self, records: List[dict]) -> List[dict]:
+        """
+        접속 이력을 한번에 저장합니다.
+        - 이미 기록된(같은 날짜, 같은 IP) 접속 이력은 제외합니다.
+        - 방문자 합계, 기본설정 방문자 수는 저장한 건수만큼 증가시킵니다.
+        - 여러 worker가 동시에 저장하지 않도록 파일 잠금을 사용합니다.
 
-        self._update_visit_sum()
-        self._update_config()
+        Args:
+            records (List[dict]): make_visit_record()로 생성한 접속 이력 목록
 
-        return visit
+        Returns:
+            List[dict]: 저장한 접속 이력 목록
+        """
+        # 같은 날짜, 같은 IP의 접속 이력은 처음 것만 저장
+        visits = {}
+        for record in records:
+            visits.setdefault((record["vi_date"], record["vi_ip"]), record)
+
+        with FileLock(self.lock_file_path, timeout=30):
+            for key in self._get_exists_visits(visits.keys()):
+                visits.pop(key, None)
+            if not visits:
+                return []
+
+            inserted = list(visits.values())
+            for visit in inserted:
+                visit["vi_agent"] = visit["vi_agent"][:200]
+                visit["vi_browser"], visit["vi_os"], visit["vi_device"] = self._parse_user_agent(visit["vi_agent"])
+            self.db.execute(insert(Visit), inserted)
+
+            counts = Counter(visit["vi_date"] for visit in inserted)
+            self._update_visit_sum(counts)
+            self._update_config(len(inserted))
+            self.db.commit()
+
+        return inserted
 
     def is_exists_visit(self, ip: str, visit_date: date) -> bool:
         """오늘의 접속이 이미 기록되어 있는지 확인합니다."""
@@ -79,16 +112,31 @@ class VisitService:
             ).select()
         )
 
-    def _parse_user_agent(self, user_agent: str):
+    def _get_exists_visits(self, keys: Iterable[Tuple[date, str]]) -> Set[Tuple[date, str]]:
+        """이미 기록된 (날짜, IP) 목록을 조회합니다."""
+        ips_by_date = defaultdict(list)
+        for visit_date, ip in keys:
+            ips_by_date[visit_date].append(ip)
+
+        exists_visits = set()
+        for visit_date, ips in ips_by_date.items():
+            for i in range(0, len(ips), 500):
+                exists_visits.update(self.db.execute(
+                    select(Visit.vi_date, Visit.vi_ip)
+                    .where(Visit.vi_date == visit_date, Visit.vi_ip.in_(ips[i:i + 500]))
+                ).all())
+        return exists_visits
+
+    @staticmethod
+    def _parse_user_agent(user_agent: str):
         """User-Agent 문자열을 파싱하여 브라우저, OS, 디바이스 정보를 반환합니다."""
-        ua = parse(user_agent)
-        browser = getattr(ua.browser, 'family', 'unknown')
-        os = getattr(ua.os, 'family', 'unknown')
-        device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
-        return browser, os, device
-
-    def _update_config(self) -> None:
-        """기본설정 테이블 > 방문자 수 갱신 함수"""
+        info = user_agent_cache.classify(user_agent)
+        return info.browser, info.os, info.device
+
+    def _update_config(self, count: int) -> None:
+        """기본설정 테이블 > 방문자 수 갱신 함수
+        - 전체 방문자 수는 저장한 건수만큼 증가시키고, 최대 방문자 수는 오늘 방문자 수와 비교하여 갱신합니다.
+        """
         today = self.db.scalar(
             select(VisitSum.vs_count).where(VisitSum.vs_date == self.today)
         ) or 0
@@ -96,18 +144,21 @@ class VisitService:
             select(VisitSum.vs_count)
             .where(VisitSum.vs_date == self.today - timedelta(days=1))
         ) or 0
-        visit_max = self.db.scalar(func.max(VisitSum.vs_count)) or 0
-        visit_total = self.db.scalar(func.sum(VisitSum.vs_count)) or 0
 
         config = self.db.scalars(select(Config)).first()
+        visit = self.parse_visit_data(config.cf_visit)
+        visit_max = max(visit["max"], today)
+        visit_total = visit["total"] + count
         config.cf_visit = f"오늘:{today},어제:{yesterday},최대:{visit_max},전체:{visit_total}"
-        self.db.commit()
 
-    def _update_visit_sum(self) -> None:
-        """방문자 합계 테이블 갱신 함수"""
-        visit_count_today = self.db.scalar(
-            select(func.count(Visit.vi_id))
-            .where(Visit.vi_date == self.today)
-        )
-        self.db.merge(VisitSum(vs_date=self.today, vs_count=visit_count_today))
-        self.db.commit()
+    def _update_visit_sum(self, counts: Dict[date, int]) -> None:
+        """방문자 합계 테이블 갱신 함수 (날짜별 방문자 수 증가)"""
+        for visit_date, count in counts.items():
+            result = self.db.execute(
+                update(VisitSum)
+                .where(VisitSum.vs_date == visit_date)
+                .values(vs_count=VisitSum.vs_count + count)
+            )
+            if not result.rowcount:
+                self.db.add(VisitSum(vs_date=visit_date, vs_count=count))
+        self.db.flush()